@@ -0,0 +1,98 @@
+# coding: utf-8
+
+"""Rows/sec of decoding list of dict
+
+Usage:
+
+    $ uv run python benchmarks/bench_from_dicts.py
+    $ uv run python benchmarks/bench_from_dicts.py 10000 100000
+"""
+
+import gc
+import sys
+import time
+
+from owlmixin import OwlMixin, TList, TOption
+
+
+class Address(OwlMixin):
+    city: str
+    zip_code: TOption[str]
+
+
+class Record(OwlMixin):
+    id: int
+    name: str
+    score: float
+    tags: TList[str]
+    address: Address
+    memo: TOption[str]
+
+
+class CompiledRecord(OwlMixin, compiled=True):
+    id: int
+    name: str
+    score: float
+    tags: TList[str]
+    address: Address
+    memo: TOption[str]
+
+
+def make_rows(size: int) -> list:
+    return [
+        {
+            "id": i,
+            "name": f"name{i}",
+            "score": i / 10,
+            "tags": ["a", "b"],
+            "address": {"city": "tokyo", "zipCode": "100-0001"},
+            "memo": None if i % 2 else "memo",
+        }
+        for i in range(size)
+    ]
+
+
+def measure(title: str, size: int, fn, repeat: int = 3) -> None:
+    elapsed = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        elapsed = min(elapsed, time.perf_counter() - start)
+    print(f"{title:<40} {size:>9,} rows  {size / elapsed:>12,.0f} rows/sec")
+
+
+def from_dicts_without_gc(rows: list) -> TList[Record]:
+    # owlmixin leaves the garbage collector alone, so pausing it is up to callers
+    gc.disable()
+    try:
+        return Record.from_dicts(rows)
+    finally:
+        gc.enable()
+
+
+def main(sizes):
+    for size in sizes:
+        rows = make_rows(size)
+        measure("from_dict per row", size, lambda: [Record.from_dict(r) for r in rows])
+        measure(
+            "from_dict per row (compiled)",
+            size,
+            lambda: [CompiledRecord.from_dict(r) for r in rows],
+        )
+        measure("from_dicts", size, lambda: Record.from_dicts(rows))
+        measure(
+            "from_dicts (gc.disable() by caller)",
+            size,
+            lambda: from_dicts_without_gc(rows),
+        )
+        measure(
+            "from_dicts(validate=False)",
+            size,
+            lambda: Record.from_dicts(rows, validate=False),
+        )
+        print()
+
+
+if __name__ == "__main__":
+    main([int(x) for x in sys.argv[1:]] or [10_000, 100_000, 1_000_000])
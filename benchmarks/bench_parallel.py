@@ -0,0 +1,77 @@
+# coding: utf-8
+
+"""Rows/sec of decoding list of dict across 1..N worker processes
+
+Usage:
+
+    $ uv run python benchmarks/bench_parallel.py
+    $ uv run python benchmarks/bench_parallel.py 100000 1 2 4 8
+"""
+
+import gc
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from owlmixin import OwlMixin, TList, TOption
+
+
+class Address(OwlMixin):
+    city: str
+    zip_code: TOption[str]
+
+
+class Record(OwlMixin):
+    id: int
+    name: str
+    score: float
+    tags: TList[str]
+    address: Address
+    memo: TOption[str]
+
+
+def make_rows(size: int) -> list:
+    return [
+        {
+            "id": i,
+            "name": f"name{i}",
+            "score": i / 10,
+            "tags": ["a", "b"],
+            "address": {"city": "tokyo", "zipCode": "100-0001"},
+            "memo": None if i % 2 else "memo",
+        }
+        for i in range(size)
+    ]
+
+
+def measure(title: str, size: int, fn, repeat: int = 3) -> None:
+    elapsed = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        elapsed = min(elapsed, time.perf_counter() - start)
+    print(f"{title:<40} {size:>9,} rows  {size / elapsed:>12,.0f} rows/sec")
+
+
+def main(size: int, workers_list):
+    rows = make_rows(size)
+    measure("from_dicts", size, lambda: Record.from_dicts(rows))
+    for workers in workers_list:
+        # Reuse processes in order to exclude the startup cost
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            Record.from_dicts(rows[:workers], executor=executor)
+            measure(
+                f"from_dicts(executor={workers} processes)",
+                size,
+                lambda: Record.from_dicts(rows, executor=executor),
+            )
+
+
+if __name__ == "__main__":
+    args = [int(x) for x in sys.argv[1:]]
+    main(
+        args[0] if args else 100_000,
+        args[1:] or sorted({1, 2, 4, os.cpu_count() or 1}),
+    )
@@ -1,9 +1,31 @@
 # coding: utf-8
 # pylint: disable=too-many-lines
 
+import csv
+import functools
 import inspect
+import keyword
+import linecache
 import sys
-from typing import Any, Iterable, List, Optional, Sequence, TypeVar
+from concurrent.futures import Executor, ProcessPoolExecutor
+from math import ceil
+from operator import itemgetter
+from types import MemberDescriptorType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from owlmixin import util
 from owlmixin.errors import InvalidTypeError, RequiredError, UnknownPropertiesError
@@ -17,9 +39,14 @@ from owlmixin.owlenum import (
 from owlmixin.transformers import (
     DictTransformer,
     JsonTransformer,
+    JsonWriterPlan,
+    SnapshotTransformer,
     TOption,
     ValueTransformer,
     YamlTransformer,
+    build_json_writer_plan,
+    compile_field_encoder,
+    compile_json_field_writer,
     traverse_dict,  # Avoid for breaking changes (import will be not working...)
 )
 
@@ -52,12 +79,7 @@ def traverse(
     type_, name, value, cls, force_snake_case: bool, force_cast: bool, restrict: bool
 ) -> Any:
     # pylint: disable=too-many-return-statements,too-many-branches,too-many-arguments
-    if isinstance(type_, str):
-        type_ = sys.modules[cls.__module__].__dict__.get(type_)
-    if hasattr(type_, "__forward_arg__"):
-        # `_ForwardRef` (3.6) or `ForwardRef` (>= 3.7) includes __forward_arg__
-        # PEP 563 -- Postponed Evaluation of Annotations
-        type_ = sys.modules[cls.__module__].__dict__.get(type_.__forward_arg__)
+    type_ = _resolve_type(type_, cls)
 
     if not _is_generic(type_):
         assert_none(value, type_, cls, name)
@@ -143,14 +165,1389 @@ def traverse(
     raise RuntimeError(f"This generics is not supported `{o_type}`")
 
 
+def _resolve_type(type_, cls):
+    if isinstance(type_, str):
+        type_ = sys.modules[cls.__module__].__dict__.get(type_)
+    if hasattr(type_, "__forward_arg__"):
+        # `_ForwardRef` (3.6) or `ForwardRef` (>= 3.7) includes __forward_arg__
+        # PEP 563 -- Postponed Evaluation of Annotations
+        type_ = sys.modules[cls.__module__].__dict__.get(type_.__forward_arg__)
+    return type_
+
+
+def _is_resolved(type_, cls) -> bool:
+    type_ = _resolve_type(type_, cls)
+    if not _is_generic(type_):
+        return type_ is not None
+    return all(_is_resolved(t, cls) for t in type_.__args__)
+
+
+def compile_decoder(type_, cls, validate: bool = True) -> Callable:
+    """Build a decode function for `type_` which behaves as same as `traverse`.
+
+    Type resolution and dispatch are done only once, so the returned function
+    only checks and converts values.
+
+    :param type_: Annotated type (str and ForwardRef are resolved by the module of `cls`)
+    :param cls: Owner class of the property
+    :param validate: Skip checks of None, types and extra properties if False
+    :return: fn(name, value, force_snake_case, force_cast, restrict)
+
+    Usage:
+
+        >>> decode = compile_decoder(TList[int], OwlMixin)
+        >>> decode("ids", [1, 2], True, False, True)
+        [1, 2]
+        >>> decode("ids", ["1", 2], True, True, True)
+        [1, 2]
+        >>> compile_decoder(TList[int], OwlMixin, validate=False)("ids", [1, None], True, False, True)
+        [1, None]
+    """
+    # pylint: disable=too-many-return-statements,too-many-statements
+    annotation = type_
+    type_ = _resolve_type(type_, cls)
+
+    if not validate:
+        return _compile_trusted_decoder(type_, annotation, cls)
+
+    if not _is_generic(type_):
+        if type_ is any or type_ is Any:
+
+            def decode_any(name, value, force_snake_case, force_cast, restrict):
+                assert_none(value, type_, cls, name)
+                return value
+
+            return decode_any
+
+        if not isinstance(type_, type):
+            # Not resolved yet (ex. forward reference to undefined class)
+            def decode_lazily(name, value, force_snake_case, force_cast, restrict):
+                return traverse(
+                    annotation, name, value, cls, force_snake_case, force_cast, restrict
+                )
+
+            return decode_lazily
+
+        if issubclass(type_, OwlMixin):
+
+            def decode_owlmixin(name, value, force_snake_case, force_cast, restrict):
+                assert_none(value, type_, cls, name)
+                if isinstance(value, type_):
+                    return value
+                assert_types(value, (type_, dict), cls, name)
+                return type_.from_dict(
+                    value,
+                    force_snake_case=force_snake_case,
+                    force_cast=force_cast,
+                    restrict=restrict,
+                )
+
+            return decode_owlmixin
+
+        if issubclass(type_, ValueTransformer):
+
+            def decode_value(name, value, force_snake_case, force_cast, restrict):
+                assert_none(value, type_, cls, name)
+                if isinstance(value, type_):
+                    return value
+                return type_.from_value(value)
+
+            return decode_value
+
+        types = (type_,)
+
+        def decode_primitive(name, value, force_snake_case, force_cast, restrict):
+            assert_none(value, type_, cls, name)
+            if isinstance(value, type_):
+                return value
+            if force_cast:
+                return type_(value)
+            assert_types(value, types, cls, name)
+            return value
+
+        return decode_primitive
+
+    o_type = type_.__origin__
+
+    if o_type == TList:
+        decode_item = compile_decoder(type_.__args__[0], cls)
+
+        def decode_list(name, value, force_snake_case, force_cast, restrict):
+            assert_none(value, type_, cls, name)
+            assert_types(value, (list,), cls, name)
+            return TList(
+                [
+                    decode_item(
+                        f"{name}.{i}", v, force_snake_case, force_cast, restrict
+                    )
+                    for i, v in enumerate(value)
+                ]
+            )
+
+        return decode_list
+
+    if o_type == TIterator:
+        decode_item = compile_decoder(type_.__args__[0], cls)
+
+        def decode_iterator(name, value, force_snake_case, force_cast, restrict):
+            assert_none(value, type_, cls, name)
+            assert_types(value, (Iterable,), cls, name)
+            return TIterator(
+                decode_item(f"{name}.{i}", v, force_snake_case, force_cast, restrict)
+                for i, v in enumerate(value)
+            )
+
+        return decode_iterator
+
+    if o_type == TDict:
+        decode_item = compile_decoder(type_.__args__[0], cls)
+
+        def decode_dict(name, value, force_snake_case, force_cast, restrict):
+            assert_none(value, type_, cls, name)
+            assert_types(value, (dict,), cls, name)
+            return TDict(
+                {
+                    k: decode_item(
+                        f"{name}.{k}", v, force_snake_case, force_cast, restrict
+                    )
+                    for k, v in value.items()
+                }
+            )
+
+        return decode_dict
+
+    if o_type == TOption:
+        decode_item = compile_decoder(type_.__args__[0], cls)
+
+        def decode_option(name, value, force_snake_case, force_cast, restrict):
+            v = value.get() if isinstance(value, TOption) else value
+            # TODO: Fot `from_csvf`... need to more simple!!
+            if (isinstance(v, str) and v) or (not isinstance(v, str) and v is not None):
+                return TOption(
+                    decode_item(name, v, force_snake_case, force_cast, restrict)
+                )
+            return TOption(None)
+
+        return decode_option
+
+    def decode_unsupported(name, value, force_snake_case, force_cast, restrict):
+        raise RuntimeError(f"This generics is not supported `{o_type}`")
+
+    return decode_unsupported
+
+
+def _compile_trusted_decoder(type_, annotation, cls) -> Callable:
+    """`compile_decoder` with `validate=False` (`type_` is resolved `annotation`)"""
+    # pylint: disable=too-many-return-statements
+    if not _is_generic(type_):
+        if type_ is any or type_ is Any:
+            return _decode_as_is
+
+        if not isinstance(type_, type):
+            return compile_decoder(annotation, cls)
+
+        if issubclass(type_, OwlMixin):
+
+            def decode_owlmixin(name, value, force_snake_case, force_cast, restrict):
+                if value is None or isinstance(value, type_):
+                    return value
+                return type_.from_dict(
+                    value,
+                    force_snake_case=force_snake_case,
+                    force_cast=force_cast,
+                    restrict=restrict,
+                    validate=False,
+                )
+
+            return decode_owlmixin
+
+        if issubclass(type_, ValueTransformer):
+
+            def decode_value(name, value, force_snake_case, force_cast, restrict):
+                if value is None or isinstance(value, type_):
+                    return value
+                return type_.from_value(value)
+
+            return decode_value
+
+        def decode_primitive(name, value, force_snake_case, force_cast, restrict):
+            if force_cast and value is not None and not isinstance(value, type_):
+                return type_(value)
+            return value
+
+        return decode_primitive
+
+    o_type = type_.__origin__
+    if o_type not in (TList, TIterator, TDict, TOption):
+        return compile_decoder(annotation, cls)
+
+    decode_item = compile_decoder(type_.__args__[0], cls, validate=False)
+
+    if o_type == TList:
+
+        def decode_list(name, value, force_snake_case, force_cast, restrict):
+            if value is None:
+                return None
+            return TList(
+                [
+                    decode_item(name, v, force_snake_case, force_cast, restrict)
+                    for v in value
+                ]
+            )
+
+        return decode_list
+
+    if o_type == TIterator:
+
+        def decode_iterator(name, value, force_snake_case, force_cast, restrict):
+            if value is None:
+                return None
+            return TIterator(
+                decode_item(name, v, force_snake_case, force_cast, restrict)
+                for v in value
+            )
+
+        return decode_iterator
+
+    if o_type == TDict:
+
+        def decode_dict(name, value, force_snake_case, force_cast, restrict):
+            if value is None:
+                return None
+            return TDict(
+                {
+                    k: decode_item(name, v, force_snake_case, force_cast, restrict)
+                    for k, v in value.items()
+                }
+            )
+
+        return decode_dict
+
+    def decode_option(name, value, force_snake_case, force_cast, restrict):
+        v = value.get() if isinstance(value, TOption) else value
+        if (isinstance(v, str) and v) or (not isinstance(v, str) and v is not None):
+            return TOption(decode_item(name, v, force_snake_case, force_cast, restrict))
+        return TOption(None)
+
+    return decode_option
+
+
+def _decode_as_is(name, value, force_snake_case, force_cast, restrict):
+    return value
+
+
+class FieldPlan(NamedTuple):
+    """How to decode one property
+
+    :ivar name: Property name
+    :ivar type_: Resolved property type
+    :ivar hook: Classmethod `___{name}` which converts a raw value before decoding
+    :ivar default: Default value defined in the class
+    :ivar decode: Function built by `compile_decoder`
+    :ivar decode_trusted: Function built by `compile_decoder` with `validate=False`
+    :ivar encode: Function built by `compile_field_encoder`
+    :ivar lazy: Decoded at the first access if `from_dict` is called with `lazy=True`
+    """
+
+    name: str
+    type_: Any
+    hook: Optional[Callable]
+    default: Any
+    decode: Callable
+    decode_trusted: Callable
+    encode: Callable
+    lazy: bool
+
+
+class DecodePlan(NamedTuple):
+    """How to decode a dict to an instance of `cls`
+
+    :ivar cls: Target class
+    :ivar fields: Plans of properties in annotation order
+    :ivar keys: Allowed property names
+    :ivar encoders: Encode functions by property name
+    :ivar json_writers: How to write properties as json text
+    :ivar from_dict: Function generated by `generate_from_dict` if compiled
+    :ivar from_dict_trusted: Same as `from_dict`, but generated with `validate=False`
+    :ivar from_dicts: Function generated by `generate_from_dict` with `batch=True` at the first batch
+    :ivar from_dicts_trusted: Same as `from_dicts`, but generated with `validate=False`
+    """
+
+    cls: type
+    fields: Tuple[FieldPlan, ...]
+    keys: FrozenSet[str]
+    encoders: Dict[str, Callable]
+    json_writers: JsonWriterPlan
+    from_dict: Optional[Callable] = None
+    from_dict_trusted: Optional[Callable] = None
+    from_dicts: Optional[Callable] = None
+    from_dicts_trusted: Optional[Callable] = None
+
+
+def _emit_decode(lines, ns, type_, cls, var, name_expr, indent, validate=True):
+    """Append statements which decode `var` in place as same as `compile_decoder`"""
+
+    # pylint: disable=too-many-arguments,too-many-statements,too-many-branches
+    def emit(line):
+        lines.append("    " * indent + line)
+
+    def bind(value) -> str:
+        key = f"_v{len(ns)}"
+        ns[key] = value
+        return key
+
+    def emit_required():
+        nonlocal indent
+        if validate:
+            emit(f"if {var} is None:")
+            emit(f"    raise RequiredError(cls=cls, prop={name_expr}, type_={t})")
+        else:
+            # Following statements are for not None
+            emit(f"if {var} is not None:")
+            indent += 1
+
+    def emit_invalid(expected: str):
+        emit(
+            f"    raise InvalidTypeError(cls=cls, prop={name_expr}, value={var}, "
+            f"expected={expected}, actual=type({var}))"
+            if validate
+            else "    pass"
+        )
+
+    annotation = type_
+    type_ = _resolve_type(type_, cls)
+    t = bind(type_)
+
+    if not _is_generic(type_):
+        if type_ is any or type_ is Any:
+            if validate:
+                emit_required()
+            return
+        if isinstance(type_, OwlMeta):
+            emit_required()
+            emit(f"if not isinstance({var}, {t}):")
+            indent += 1
+            if validate:
+                emit(f"if not isinstance({var}, dict):")
+                emit_invalid(f"({t}, dict)")
+            emit(
+                f"{var} = {t}.from_dict({var}, force_snake_case=force_snake_case, "
+                f"force_cast=force_cast, restrict=restrict, validate={validate})"
+            )
+            return
+        if isinstance(type_, type) and issubclass(type_, ValueTransformer):
+            emit_required()
+            emit(f"if not isinstance({var}, {t}):")
+            emit(f"    {var} = {t}.from_value({var})")
+            return
+        if isinstance(type_, type):
+            emit_required()
+            emit(f"if not isinstance({var}, {t}):")
+            emit("    if force_cast:")
+            emit(f"        {var} = {t}({var})")
+            if validate:
+                emit("    else:")
+                indent += 1
+                emit_invalid(f"({t},)")
+            return
+    else:
+        depth = len(ns)
+        o_type = type_.__origin__
+        if o_type in (TList, TDict):
+            item, key = f"e{depth}", f"k{depth}"
+            items = f"items{depth}"
+            container, loop = (
+                ("list", f"for {key}, {item} in enumerate({var}):")
+                if o_type == TList
+                else ("dict", f"for {key}, {item} in {var}.items():")
+            )
+            emit_required()
+            if validate:
+                emit(f"if not isinstance({var}, {container}):")
+                emit_invalid(f"({container},)")
+            emit(f"{items} = {'[]' if o_type == TList else '{}'}")
+            emit(loop)
+            _emit_decode(
+                lines,
+                ns,
+                type_.__args__[0],
+                cls,
+                item,
+                f'"{{}}.{{}}".format({name_expr}, {key})',
+                indent + 1,
+                validate,
+            )
+            if o_type == TList:
+                emit(f"    {items}.append({item})")
+                emit(f"{var} = TList({items})")
+            else:
+                emit(f"    {items}[{key}] = {item}")
+                emit(f"{var} = TDict({items})")
+            return
+        if o_type == TOption:
+            emit(f"if isinstance({var}, TOption):")
+            emit(f"    {var} = {var}.get()")
+            emit(
+                f"if (isinstance({var}, str) and {var}) or "
+                f"(not isinstance({var}, str) and {var} is not None):"
+            )
+            _emit_decode(
+                lines, ns, type_.__args__[0], cls, var, name_expr, indent + 1, validate
+            )
+            emit(f"    {var} = TOption({var})")
+            emit("else:")
+            emit(f"    {var} = TOption(None)")
+            return
+
+    # TIterator, unsupported generics and unresolved types
+    decode = bind(compile_decoder(annotation, cls, validate))
+    emit(
+        f"{var} = {decode}({name_expr}, {var}, force_snake_case, force_cast, restrict)"
+    )
+
+
+def _assigns_dict(cls, names) -> bool:
+    """Whether properties can be set by assigning `__dict__` of instances at once"""
+    return (
+        cls.__owl_slot_names__ is None
+        and cls.__setattr__ is object.__setattr__
+        and not any(
+            hasattr(inspect.getattr_static(cls, n, None), "__set__") for n in names
+        )
+    )
+
+
+def generate_from_dict(
+    plan: DecodePlan, validate: bool = True, batch: bool = False
+) -> Callable:
+    """Generate a `from_dict` function specialized for `plan.cls`
+
+    Property loop, type checks and nested containers are inlined into
+    straight-line code, so it doesn't call `compile_decoder` functions per value.
+    Instances are created by `object.__new__` and `__dict__` is assigned at once
+    unless the class defines `__init__`, `__setattr__`, slots or descriptors.
+
+    :param plan: Decode plan
+    :param validate: Skip checks of None, types and extra properties if False
+    :param batch: Generate a generator function which decodes each dict of `ds` if True
+    :return: fn(cls, d, force_snake_case, force_cast, restrict)
+             or fn(cls, ds, force_snake_case, force_cast, restrict) if `batch` is True
+
+    Usage:
+
+        >>> from owlmixin.samples import Japanese
+        >>> from_dict = generate_from_dict(Japanese.__owl_plan__)
+        >>> taro = from_dict(Japanese, {"name": "taro"}, True, False, True)
+        >>> taro.name, taro.language
+        ('taro', 'japanese')
+        >>> from_dicts = generate_from_dict(Japanese.__owl_plan__, batch=True)
+        >>> [x.name for x in from_dicts(Japanese, [{"name": "taro"}, taro], True, False, True)]
+        ['taro', 'taro']
+    """
+    # pylint: disable=too-many-locals
+    cls = plan.cls
+    ns: dict = {
+        "keys": plan.keys,
+        "replace_keys": util.replace_keys,
+        "replace_keys_of_shape": util.replace_keys_of_shape,
+        "keymap": {"self": "_self"},
+        "new": object.__new__,
+        "RequiredError": RequiredError,
+        "InvalidTypeError": InvalidTypeError,
+        "UnknownPropertiesError": UnknownPropertiesError,
+        "TDict": TDict,
+        "TList": TList,
+        "TOption": TOption,
+    }
+    depth = 2 if batch else 1
+    pad = "    " * depth
+    assigns_dict = _assigns_dict(cls, [f.name for f in plan.fields])
+
+    check_extra = [
+        "if restrict:",
+        "    extra_keys = d.keys() - keys",
+        "    if extra_keys:",
+        "        raise UnknownPropertiesError(cls=cls, props=sorted(extra_keys))",
+    ]
+    if batch:
+        # Keys are replaced and checked only when the shape differs from the previous row
+        lines = [
+            "def from_dicts(cls, ds, force_snake_case, force_cast, restrict):",
+            "    last_shape = None",
+            "    for d in ds:",
+            "        if isinstance(d, cls):",
+            "            yield d",
+            "            continue",
+            "        shape = tuple(d.keys())",
+            "        if shape != last_shape:",
+            "            replaced_keys = replace_keys_of_shape(shape, keymap, force_snake_case)",
+            "            if replaced_keys is not None:",
+            "                d = dict(zip(replaced_keys, d.values()))",
+            *(["            " + x for x in check_extra] if validate else []),
+            "            last_shape = shape",
+            "        elif replaced_keys is not None:",
+            "            d = dict(zip(replaced_keys, d.values()))",
+        ]
+    else:
+        lines = [
+            "def from_dict(cls, d, force_snake_case, force_cast, restrict):",
+            "    d = replace_keys(d, keymap, force_snake_case)",
+            *(["    " + x for x in check_extra] if validate else []),
+        ]
+    lines.append(
+        pad
+        + (
+            "instance = new(cls)"
+            if cls.__init__ is object.__init__
+            else "instance = cls()"
+        )
+    )
+    lines.append(pad + "get = d.get")
+    for i, f in enumerate(plan.fields):
+        var = f"v{i}"
+        name = repr(f.name)
+        if f.hook:
+            ns[f"hook{i}"] = f.hook
+            lines.append(f"{pad}{var} = hook{i}(get({name}))")
+        else:
+            lines.append(f"{pad}{var} = get({name})")
+        if f.default is not None:
+            ns[f"default{i}"] = f.default
+            lines.append(f"{pad}if {var} is None:")
+            lines.append(f"{pad}    {var} = default{i}")
+        _emit_decode(lines, ns, f.type_, cls, var, name, depth, validate)
+        if assigns_dict:
+            continue
+        if f.name.isidentifier() and not keyword.iskeyword(f.name):
+            lines.append(f"{pad}instance.{f.name} = {var}")
+        else:
+            lines.append(f"{pad}setattr(instance, {name}, {var})")
+    if assigns_dict:
+        items = ", ".join(f"{f.name!r}: v{i}" for i, f in enumerate(plan.fields))
+        lines.append(f"{pad}instance.__dict__ = {{{items}}}")
+    lines.append(pad + ("yield instance" if batch else "return instance"))
+
+    source = "\n".join(lines)
+    suffix = ("" if validate else " trusted") + (" batch" if batch else "")
+    filename = f"<owlmixin from_dict {cls.__module__}.{cls.__qualname__}{suffix}>"
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    exec(compile(source, filename, "exec"), ns)  # pylint: disable=exec-used
+    return ns["from_dicts" if batch else "from_dict"]
+
+
+def _iter_from_dicts(
+    cls, ds: Iterable[dict], force_snake_case, force_cast, restrict, validate
+) -> Iterator:
+    """Decode dicts in a single loop generated for `cls` (`from_dict` is not called)"""
+    # pylint: disable=too-many-arguments
+    plan: DecodePlan = cls.__owl_plan__
+    if (
+        cls.__dict__.get("__owl_plan_cache__") is not plan
+        or cls.from_dict.__func__ is not OwlMixin.from_dict.__func__
+    ):
+        # Forward references are not resolved yet or `from_dict` is overridden
+        return (
+            cls.from_dict(
+                d,
+                force_snake_case=force_snake_case,
+                force_cast=force_cast,
+                restrict=restrict,
+                validate=validate,
+            )
+            for d in ds
+        )
+
+    key = "from_dicts" if validate else "from_dicts_trusted"
+    from_dicts = getattr(plan, key)
+    if from_dicts is None:
+        from_dicts = generate_from_dict(plan, validate, batch=True)
+        cls.__owl_plan_cache__ = plan._replace(**{key: from_dicts})
+    return from_dicts(cls, ds, force_snake_case, force_cast, restrict)
+
+
+def _iter_from_csvf(
+    cls,
+    fpath,
+    fieldnames,
+    encoding,
+    dialect,
+    compression,
+    force_snake_case,
+    restrict,
+    validate,
+) -> Iterator:
+    """Decode rows of a csv file by `compile_csv_row_decoder` (`from_dict` is not called)
+
+    The file is opened at the first `next`, so it is never leaked if the iterator isn't consumed.
+    """
+    # pylint: disable=too-many-arguments
+    # The plan is evaluated first because it is cached by the evaluation
+    if (
+        cls.__owl_plan__ is not cls.__dict__.get("__owl_plan_cache__")
+        or cls.from_dict.__func__ is not OwlMixin.from_dict.__func__
+    ):
+        # Forward references are not resolved yet or `from_dict` is overridden
+        yield from _iter_from_dicts(
+            cls,
+            util.load_csvf(fpath, fieldnames, encoding, dialect, compression),
+            force_snake_case,
+            True,
+            restrict,
+            validate,
+        )
+        return
+
+    header, rows = util.load_csvf_rows(
+        fpath, fieldnames, encoding, dialect, compression
+    )
+    yield from _iter_from_csv_rows(
+        cls, header, rows, force_snake_case, restrict, validate
+    )
+
+
+def _iter_from_csv_rows(
+    cls, header, rows: Iterable[List[str]], force_snake_case, restrict, validate
+) -> Iterator:
+    # pylint: disable=too-many-arguments
+    # Compile on the first row so that a header without rows never raises (as same as `from_dicts`)
+    decode = None
+    for row in rows:
+        if decode is None:
+            decode = compile_csv_row_decoder(
+                cls, header, force_snake_case, restrict, validate
+            )
+        yield decode(row)
+
+
+def _from_csvf_in_parallel(
+    cls,
+    fpath,
+    fieldnames,
+    encoding,
+    dialect,
+    compression,
+    force_snake_case,
+    restrict,
+    validate,
+    workers,
+    executor,
+) -> TList:
+    """Rows (lists of cells) are sent to worker processes instead of dicts"""
+    # pylint: disable=too-many-arguments
+    # The plan is evaluated first because it is cached by the evaluation
+    if (
+        cls.__owl_plan__ is not cls.__dict__.get("__owl_plan_cache__")
+        or cls.from_dict.__func__ is not OwlMixin.from_dict.__func__
+    ):
+        # Forward references are not resolved yet or `from_dict` is overridden
+        return _decode_in_parallel(
+            functools.partial(
+                _decode_dicts_chunk, cls, force_snake_case, True, restrict, validate
+            ),
+            list(util.load_csvf(fpath, fieldnames, encoding, dialect, compression)),
+            workers,
+            executor,
+        )
+
+    header, rows = util.load_csvf_rows(
+        fpath, fieldnames, encoding, dialect, compression
+    )
+    return _decode_in_parallel(
+        functools.partial(
+            _decode_csv_rows_chunk, cls, header, force_snake_case, restrict, validate
+        ),
+        list(rows),
+        workers,
+        executor,
+    )
+
+
+def _load_with_cache(cache: bool, load: Callable[[], Any], fpath: str, *options):
+    return util.file_cache.get_or_load(options, fpath, load) if cache else load()
+
+
+def _is_parallel(workers: Optional[int], executor: Optional[Executor]) -> bool:
+    return executor is not None or (workers is not None and workers > 1)
+
+
+def _decode_in_parallel(
+    decode_chunk: Callable[[list], list],
+    items: list,
+    workers: Optional[int],
+    executor: Optional[Executor],
+) -> TList:
+    """Split items into chunks, decode them across processes and concatenate results in input order.
+
+    The error of the first failing chunk is raised, so it is the same as decoding in a single process.
+
+    :param decode_chunk: Picklable function (ex. `functools.partial` of a module level function)
+    :param items: Dicts or csv rows
+    :param workers: Number of processes of a new `ProcessPoolExecutor` (used if executor is None)
+    :param executor: Executor which is not shut down
+    """
+    pool = executor or ProcessPoolExecutor(max_workers=workers)
+    concurrency = util.pool_size(workers)
+    # 4 chunks per process in order to balance loads
+    size = max(1, ceil(len(items) / (concurrency * 4)))
+    try:
+        decoded_chunks = util.map_bounded(
+            pool,
+            decode_chunk,
+            (items[i : i + size] for i in range(0, len(items), size)),
+            concurrency * 2,
+        )
+        results: TList = TList()
+        for decoded in decoded_chunks:
+            results.extend(decoded)
+        return results
+    finally:
+        if executor is None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _decode_dicts_chunk(
+    cls, force_snake_case, force_cast, restrict, validate, ds: List[dict]
+) -> list:
+    """Run in worker processes"""
+    # pylint: disable=too-many-arguments
+    return list(
+        _iter_from_dicts(cls, ds, force_snake_case, force_cast, restrict, validate)
+    )
+
+
+def _decode_csv_rows_chunk(
+    cls, header, force_snake_case, restrict, validate, rows: List[List[str]]
+) -> list:
+    """Run in worker processes"""
+    # pylint: disable=too-many-arguments
+    return list(
+        _iter_from_csv_rows(cls, header, rows, force_snake_case, restrict, validate)
+    )
+
+
+def _is_nested(type_) -> bool:
+    o_type = getattr(type_, "__origin__", None)
+    if o_type is TOption:
+        return _is_nested(type_.__args__[0])
+    return isinstance(type_, OwlMeta) or o_type in (TList, TDict)
+
+
+def _is_expanded(type_, cls) -> bool:
+    """Whether `decode_iteratively` expands values of `type_` on the stack"""
+    type_ = _resolve_type(type_, cls)
+    o_type = getattr(type_, "__origin__", None)
+    if o_type in (TList, TDict, TOption):
+        return _is_expanded(type_.__args__[0], cls)
+    return (
+        isinstance(type_, OwlMeta)
+        and type_.from_dict.__func__ is OwlMixin.from_dict.__func__  # type: ignore
+    )
+
+
+_leaf_decoders: Dict[tuple, Optional[Callable]] = {}
+
+
+def _leaf_decoder(type_, cls, validate: bool) -> Optional[Callable]:
+    """Decoder for values which are not expanded by `decode_iteratively` (cached)"""
+    key = (type_, cls, validate)
+    try:
+        return _leaf_decoders[key]
+    except KeyError:
+        pass
+
+    decode = None if _is_expanded(type_, cls) else compile_decoder(type_, cls, validate)
+    if _is_resolved(type_, cls):
+        _leaf_decoders[key] = decode
+    return decode
+
+
+def decode_iteratively(
+    cls,
+    d: dict,
+    force_snake_case: bool = True,
+    force_cast: bool = False,
+    restrict: bool = True,
+    validate: bool = True,
+):
+    """Same as `cls.from_dict(d, ...)`, but uses an explicit stack instead of recursion.
+
+    It handles arbitrarily deep nesting of OwlMixin, TList, TDict and TOption without `RecursionError`.
+    Values of other types and classes which override `from_dict` are decoded as usual.
+    Properties are decoded depth-first in declaration order, so the error raised is the same as `from_dict`.
+
+    :param cls: OwlMixin class
+    :param d: Dict
+    :param force_snake_case: Keys are transformed to snake case in order to compliant PEP8 if True
+    :param force_cast: Cast forcibly if True
+    :param restrict: Prohibit extra parameters if True
+    :param validate: Skip checks of None, types and extra properties for trusted data if False
+    :return: Instance
+
+    Usage:
+
+        >>> from owlmixin.samples import Human
+        >>> human: Human = decode_iteratively(Human, {
+        ...     "id": 1,
+        ...     "name": "Tom",
+        ...     "favorites": [{"name": "Apple", "namesByLang": {"en": "Apple"}}]
+        ... })
+        >>> human.favorites[0].names_by_lang.get()["en"]
+        'Apple'
+    """
+    # pylint: disable=too-many-arguments,too-many-locals,too-many-branches,too-many-statements
+    keymap = {"self": "_self"}
+    root: list = [None]
+    # (type, owner class, property name, value, container of the result, key, set as attribute, leaf decoder)
+    stack: list = [(cls, cls, None, d, root, 0, False, None)]
+    pop = stack.pop
+
+    while stack:
+        type_, owner, name, value, target, key, as_attr, decode = pop()
+        t = _resolve_type(type_, owner)
+
+        if decode is not None:
+            result = decode(name, value, force_snake_case, force_cast, restrict)
+        elif value is None and getattr(t, "__origin__", None) is not TOption:
+            if validate:
+                raise RequiredError(cls=owner, prop=name, type_=t)
+            result = None
+        elif isinstance(t, OwlMeta):
+            if isinstance(value, t):
+                result = value
+            else:
+                if validate:
+                    assert_types(value, (t, dict), owner, name)
+                plan: DecodePlan = t.__owl_plan__  # type: ignore
+                result = t()
+                value = util.replace_keys(value, keymap, force_snake_case)
+                if restrict and validate:
+                    extra_keys = value.keys() - plan.keys
+                    if extra_keys:
+                        raise UnknownPropertiesError(cls=t, props=sorted(extra_keys))
+
+                # All properties are decoded in order from the stack (even if they are leaves)
+                # so that the same error as `from_dict` is raised first
+                pending = []
+                annotations = t.__annotations__
+                for f in plan.fields:
+                    arg_v = f.hook(value.get(f.name)) if f.hook else value.get(f.name)
+                    v = f.default if arg_v is None else arg_v
+                    # Placeholder to keep the order of properties
+                    setattr(result, f.name, None)
+                    pending.append(
+                        (
+                            annotations[f.name],
+                            t,
+                            f.name,
+                            v,
+                            result,
+                            f.name,
+                            True,
+                            _leaf_decoder(annotations[f.name], t, validate),
+                        )
+                    )
+                pending.reverse()
+                stack.extend(pending)
+        else:
+            o_type = t.__origin__
+            item_type = t.__args__[0]
+            decode = _leaf_decoder(item_type, owner, validate)
+
+            if o_type is TOption:
+                v = value.get() if isinstance(value, TOption) else value
+                # TODO: Fot `from_csvf`... need to more simple!!
+                if (isinstance(v, str) and v) or (
+                    not isinstance(v, str) and v is not None
+                ):
+                    if decode is None:
+                        result = TOption(None)
+                        stack.append(
+                            (item_type, owner, name, v, result, "value", True, None)
+                        )
+                    else:
+                        result = TOption(
+                            decode(name, v, force_snake_case, force_cast, restrict)
+                        )
+                else:
+                    result = TOption(None)
+            else:
+                if o_type is TList:
+                    if validate:
+                        assert_types(value, (list,), owner, name)
+                    result = TList([None] * len(value))
+                    items: Iterable = enumerate(value)
+                else:
+                    if validate:
+                        assert_types(value, (dict,), owner, name)
+                    result = TDict(dict.fromkeys(value))
+                    items = value.items()
+                pending = [
+                    (item_type, owner, f"{name}.{k}", v, result, k, False, None)
+                    for k, v in items
+                ]
+                pending.reverse()
+                stack.extend(pending)
+
+        if as_attr:
+            setattr(target, key, result)
+        else:
+            target[key] = result
+
+    return root[0]
+
+
+def _compile_csv_cell_decoder(
+    f: FieldPlan, cls, force_snake_case: bool, restrict: bool, validate: bool
+) -> Callable:
+    """Decoder of a property from a csv cell which behaves as same as `f.decode` with `force_cast=True`
+
+    Cells (str) of primitive, ValueTransformer and TOption of them are converted directly,
+    and the others (defaults or unsupported types) are decoded by the plan.
+    """
+    decode = f.decode if validate else f.decode_trusted
+
+    def compile_cast(type_) -> Optional[Callable]:
+        if type_ is str:
+            return lambda v: v
+        if type_ in (int, float, bool):
+            return type_
+        if isinstance(type_, type) and issubclass(type_, ValueTransformer):
+            return type_.from_value  # type: ignore
+        return None
+
+    def fallback(name, v):
+        return decode(name, v, force_snake_case, True, restrict)
+
+    type_ = f.type_
+    if getattr(type_, "__origin__", None) is TOption:
+        cast = compile_cast(_resolve_type(type_.__args__[0], cls))
+        if cast is None:
+            return fallback
+
+        def decode_option(name, v):
+            if type(v) is not str:
+                return fallback(name, v)
+            return TOption(cast(v) if v else None)
+
+        return decode_option
+
+    cast = compile_cast(type_)
+    if cast is None:
+        return fallback
+
+    def decode_cell(name, v):
+        return cast(v) if type(v) is str else fallback(name, v)
+
+    return decode_cell
+
+
+def compile_csv_row_decoder(
+    cls,
+    fieldnames: Sequence[str],
+    force_snake_case: bool = True,
+    restrict: bool = True,
+    validate: bool = True,
+) -> Callable[[List[str]], Any]:
+    """Build a function which decodes a csv row (list of cells) to an instance.
+
+    It behaves as same as `cls.from_dict(dict(zip(fieldnames, row)), force_cast=True, ...)`,
+    but keys are replaced and checked only once per header, and each column has its own converter.
+    Cells out of the header are ignored.
+
+    :param cls: OwlMixin class
+    :param fieldnames: Header
+    :param force_snake_case: Keys are transformed to snake case in order to compliant PEP8 if True
+    :param restrict: Prohibit extra parameters if True
+    :param validate: Skip checks of None, types and extra properties for trusted data if False
+    :return: fn(row) -> instance
+
+    Usage:
+
+        >>> from owlmixin.samples import Human
+        >>> decode = compile_csv_row_decoder(Human, ["id", "name", "favorites"])
+        >>> human = decode(["1", "Tom", []])
+        >>> (human.id, human.name)
+        (1, 'Tom')
+        >>> compile_csv_row_decoder(Human, ["id", "nickname"])
+        Traceback (most recent call last):
+            ...
+        owlmixin.errors.UnknownPropertiesError: ...
+    """
+    # pylint: disable=too-many-locals
+    plan: DecodePlan = cls.__owl_plan__  # type: ignore
+    keys = util.replace_keys_of_shape(
+        tuple(fieldnames), {"self": "_self"}, force_snake_case
+    ) or tuple(fieldnames)
+    if restrict and validate:
+        extra_keys = set(keys) - plan.keys
+        if extra_keys:
+            raise UnknownPropertiesError(cls=cls, props=sorted(extra_keys))
+
+    # The last one wins if the same names exist (as same as `csv.DictReader`)
+    index_by_key = {k: i for i, k in enumerate(keys)}
+    columns = tuple(
+        (
+            f.name,
+            index_by_key.get(f.name, -1),
+            f.hook,
+            f.default,
+            _compile_csv_cell_decoder(f, cls, force_snake_case, restrict, validate),
+        )
+        for f in plan.fields
+    )
+
+    new = object.__new__ if cls.__init__ is object.__init__ else lambda c: c()
+    assigns_dict = _assigns_dict(cls, [f.name for f in plan.fields])
+
+    def decode_row(row):
+        size = len(row)
+        values = {}
+        for name, i, hook, default, decode in columns:
+            v = row[i] if -1 < i < size else None
+            if hook:
+                v = hook(v)
+            values[name] = decode(name, default if v is None else v)
+
+        instance = new(cls)
+        if assigns_dict:
+            instance.__dict__ = values
+        else:
+            for k, v in values.items():
+                setattr(instance, k, v)
+        return instance
+
+    return decode_row
+
+
+def build_plan(cls) -> DecodePlan:
+    """Build a decode plan of `cls` from its annotations
+
+    :param cls: OwlMixin class
+    :return: Decode plan
+
+    Usage:
+
+        >>> from owlmixin.samples import Japanese
+        >>> plan = build_plan(Japanese)
+        >>> [(f.name, f.type_, f.default) for f in plan.fields]
+        [('name', <class 'str'>, None), ('language', <class 'str'>, 'japanese')]
+        >>> sorted(plan.keys)
+        ['language', 'name']
+    """
+    resolve = lambda x: _resolve_type(x, cls)  # noqa: E731
+    try:
+        # Defaults can be assigned in `__init__` as well as declared as class variables
+        instance = cls()
+    except Exception:  # pylint: disable=broad-except
+        instance = None
+    fields = tuple(
+        FieldPlan(
+            name=n,
+            type_=resolve(t),
+            hook=cls.__methods_dict__.get(f"_{cls.__name__}___{n}"),
+            default=default,
+            decode=compile_decoder(t, cls),
+            decode_trusted=compile_decoder(t, cls, validate=False),
+            encode=compile_field_encoder(t, resolve),
+            # Properties which have defaults are found as class variables before `__getattr__`
+            lazy=default is None and _is_nested(resolve(t)),
+        )
+        for n, t in cls.__annotations__.items()
+        for default in [
+            _default_of(cls, n, None)
+            if instance is None
+            else getattr(instance, n, None)
+        ]
+    )
+    return DecodePlan(
+        cls=cls,
+        fields=fields,
+        keys=frozenset(f.name for f in fields),
+        encoders={f.name: f.encode for f in fields},
+        json_writers=build_json_writer_plan(
+            {
+                n: compile_json_field_writer(t, resolve)
+                for n, t in cls.__annotations__.items()
+            }
+        ),
+    )
+
+
+_MISSING = object()
+
+
+def _default_of(cls, name: str, fallback=_MISSING):
+    """Default value of the property defined in `cls` or its bases
+
+    Defaults of classes declared with `slots=True` are kept in `__owl_defaults__`
+    because class variables conflict with `__slots__`.
+    """
+    for klass in cls.__mro__:
+        defaults = klass.__dict__.get("__owl_defaults__", {})
+        if name in defaults:
+            return defaults[name]
+        value = klass.__dict__.get(name, _MISSING)
+        if value is not _MISSING and not isinstance(value, MemberDescriptorType):
+            return value
+    return fallback
+
+
+def _decode_lazy_values(self) -> None:
+    """Decode all properties which are not decoded yet (properties may shadow `validate`)"""
+    lazy = self.__owl_lazy__
+    if lazy is None:
+        return
+
+    for name in list(lazy[0]):
+        getattr(self, name)
+    del self.__owl_lazy__
+    if self.__owl_slot_names__ is None:
+        # Lazily decoded properties were appended, so restore the order of properties
+        d = self.__dict__
+        self.__dict__ = {
+            **{
+                f.name: d[f.name] for f in type(self).__owl_plan__.fields if f.name in d
+            },
+            **d,
+        }
+
+
+def _slots_dict(self) -> dict:
+    """`_dict` of instances which store properties in `__slots__`"""
+    d = {}
+    for n in type(self).__owl_slot_names__:
+        try:
+            d[n] = getattr(self, n)
+        except AttributeError:
+            pass
+    if type(self).__dictoffset__:
+        d.update(self.__dict__)
+    return d
+
+
+def _values_getter(cls) -> Callable[[dict], tuple]:
+    """Function which picks property values from a dict in annotation order (cached per class)"""
+    getter = cls.__dict__.get("__owl_values_getter__")
+    if getter is None:
+        names = tuple(cls.__annotations__)
+        if len(names) > 1:
+            getter = itemgetter(*names)
+        else:
+            getter = lambda d: tuple([d[n] for n in names])  # noqa: E731
+        cls.__owl_values_getter__ = getter
+    return getter
+
+
+_PICKLE_HOOKS = (
+    "__reduce__",
+    "__getstate__",
+    "__setstate__",
+    "__getnewargs__",
+    "__getnewargs_ex__",
+)
+
+
+def _has_pickle_hooks(cls) -> bool:
+    """True if cls or its mixins define their own pickling (cached per class)"""
+    has = cls.__dict__.get("__owl_pickle_hooks__")
+    if has is None:
+        has = any(
+            h in vars(c)
+            for c in cls.__mro__
+            if c not in OwlMixin.__mro__
+            for h in _PICKLE_HOOKS
+        )
+        cls.__owl_pickle_hooks__ = has
+    return has
+
+
+def _restore(cls, *values):
+    """Inverse of `OwlMixin.__reduce_ex__`"""
+    instance = cls.__new__(cls)
+    if cls.__owl_slot_names__ is None:
+        instance.__dict__ = dict(zip(cls.__annotations__, values))
+    else:
+        for n, v in zip(cls.__annotations__, values):
+            setattr(instance, n, v)
+    return instance
+
+
+def _restore_with_extras(cls, extras: dict, *values):
+    """Inverse of `OwlMixin.__reduce_ex__` for instances which have attributes other than properties"""
+    instance = _restore(cls, *values)
+    if cls.__owl_slot_names__ is None:
+        instance.__dict__.update(extras)
+    else:
+        for n, v in extras.items():
+            setattr(instance, n, v)
+    return instance
+
+
 class OwlMeta(type):
-    def __new__(cls, name, bases, class_dict):
+    def __new__(
+        cls,
+        name,
+        bases,
+        class_dict,
+        compiled: Optional[bool] = None,
+        slots: Optional[bool] = None,
+    ):
+        inherited = tuple(
+            dict.fromkeys(
+                n for b in bases for n in getattr(b, "__owl_slot_names__", None) or ()
+            )
+        )
+        slots_bases = any(
+            getattr(b, "__owl_slot_names__", None) is not None for b in bases
+        )
+        if slots is None:
+            slots = slots_bases
+        if slots and "__slots__" not in class_dict:
+            annotations = class_dict.get("__annotations__", {})
+            class_dict["__slots__"] = tuple(
+                n for n in annotations if n not in inherited
+            ) + (() if slots_bases else ("__owl_lazy__",))
+            class_dict["__owl_slot_names__"] = inherited + tuple(
+                n for n in annotations if n not in inherited
+            )
+            class_dict["__owl_defaults__"] = {
+                n: class_dict.pop(n) for n in annotations if n in class_dict
+            }
+
         ret_cls = type.__new__(cls, name, bases, class_dict)
         ret_cls.__methods_dict__ = dict(inspect.getmembers(ret_cls, inspect.ismethod))
+        if compiled is not None:
+            ret_cls.__owl_compiled__ = compiled
         return ret_cls
 
+    @property
+    def __owl_plan__(cls) -> DecodePlan:
+        """Decode plan which is built at the first access and cached per class.
+
+        It is not cached while some forward references can't be resolved yet.
+        `from_dict` is generated if the class is declared with `compiled=True`.
+        """
+        plan = cls.__dict__.get("__owl_plan_cache__")
+        if plan is None:
+            plan = build_plan(cls)
+            if all(_is_resolved(f.type_, cls) for f in plan.fields):
+                if getattr(cls, "__owl_compiled__", False):
+                    plan = plan._replace(
+                        from_dict=generate_from_dict(plan),
+                        from_dict_trusted=generate_from_dict(plan, validate=False),
+                    )
+                cls.__owl_plan_cache__ = plan
+        return plan
+
+
+class OwlMixin(
+    DictTransformer,
+    JsonTransformer,
+    YamlTransformer,
+    SnapshotTransformer,
+    metaclass=OwlMeta,
+):
+    __slots__ = ()
+    # Property names stored in `__slots__` (None unless declared with `slots=True`)
+    __owl_slot_names__ = None
+    # (raw values by property name, force_snake_case, force_cast, restrict, validate)
+    __owl_lazy__ = None
+
+    def __getattr__(self, name: str):
+        if name == "__owl_lazy__":
+            # Not set in the slot
+            return None
+
+        lazy = self.__owl_lazy__
+        if lazy is not None and name in lazy[0]:
+            values, force_snake_case, force_cast, restrict, validate = lazy
+            f = next(f for f in type(self).__owl_plan__.fields if f.name == name)
+            value = (f.decode if validate else f.decode_trusted)(
+                name, values[name], force_snake_case, force_cast, restrict
+            )
+            setattr(self, name, value)
+            del values[name]
+            return value
+
+        if name in (self.__owl_slot_names__ or ()):
+            # Defaults of slots classes are not class variables
+            value = _default_of(type(self), name)
+            if value is not _MISSING:
+                return value
+
+        # Raise the original error again (ex. `AttributeError` raised in a property) instead of a new one
+        return object.__getattribute__(self, name)
+
+    def __reduce_ex__(self, protocol):
+        """Pickle property values positionally in annotation order (without property names)"""
+        cls = type(self)
+        if _has_pickle_hooks(cls) or self.__owl_lazy__ is not None:
+            # Respect pickling defined by subclasses and keep undecoded values as they are
+            return object.__reduce_ex__(self, protocol)
+
+        state = self.__dict__ if cls.__owl_slot_names__ is None else _slots_dict(self)
+        try:
+            values = _values_getter(cls)(state)
+        except KeyError:
+            return object.__reduce_ex__(self, protocol)
+        names = cls.__annotations__
+        if len(state) == len(names):
+            return _restore, (cls, *values)
+        extras = {k: v for k, v in state.items() if k not in names}
+        return _restore_with_extras, (cls, extras, *values)
+
+    @property
+    def _dict(self):
+        if self.__owl_lazy__ is not None:
+            _decode_lazy_values(self)
+        if self.__owl_slot_names__ is None:
+            return self.__dict__
+        return _slots_dict(self)
+
+    def validate(self: T) -> T:
+        """Decode all properties which are not decoded yet by `from_dict(..., lazy=True)`
+
+        :return: Self
+
+        Usage:
+
+            >>> from owlmixin.samples import Human
+            >>> human: Human = Human.from_dict({
+            ...     "id": 1,
+            ...     "name": "Tom",
+            ...     "favorites": [{"name": "Apple"}, {"names_by_lang": {}}],
+            ... }, lazy=True)
+            >>> human.name
+            'Tom'
+            >>> human.validate()  # doctest: +NORMALIZE_WHITESPACE
+            Traceback (most recent call last):
+                ...
+            owlmixin.errors.RequiredError:
+            .        ∧,,_∧      ,___________________
+                 ⊂ ( ･ω･ )つ-  <  Required error
+               ／／/     /::/     `-------------------
+               |::|/⊂ヽノ|::|」
+            ／￣￣旦￣￣￣／|
+            ＿＿＿＿＿＿／  | |
+            |------ー----ー|／
+            <BLANKLINE>
+            `owlmixin.samples.Food#name: <class 'str'>` is empty!!
+            <BLANKLINE>
+                * If `name` is certainly required, specify anything.
+                * If `name` is optional, change type from `<class 'str'>` to `TOption[<class 'str'>]`
+            <BLANKLINE>
+        """
+        _decode_lazy_values(self)
+        return self
+
+    @property
+    def _encoders(self) -> Dict[str, Callable]:
+        return type(self).__owl_plan__.encoders  # type: ignore
+
+    @property
+    def _json_writers(self) -> JsonWriterPlan:
+        return type(self).__owl_plan__.json_writers  # type: ignore
 
-class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlMeta):
     @classmethod
     def from_dict(
         cls,
@@ -159,6 +1556,9 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
         force_snake_case: bool = True,
         force_cast: bool = False,
         restrict: bool = True,
+        lazy: bool = False,
+        validate: bool = True,
+        iterative: bool = False,
     ) -> T:
         """From dict to instance
 
@@ -166,6 +1566,11 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
         :param force_snake_case: Keys are transformed to snake case in order to compliant PEP8 if True
         :param force_cast: Cast forcibly if True
         :param restrict: Prohibit extra parameters if True
+        :param lazy: Nested OwlMixin, TList and TDict properties are decoded at the first access if True.
+                     Errors of them are raised at the access or `validate()`.
+        :param validate: Skip checks of None, types and extra properties for trusted data if False
+        :param iterative: Decode with an explicit stack instead of recursion for deeply nested data if True.
+                          `lazy` is ignored. (See `decode_iteratively`)
         :return: Instance
 
         Usage:
@@ -301,35 +1706,92 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
         """
         if isinstance(d, cls):
             return d
+        if iterative:
+            return decode_iteratively(
+                cls, d, force_snake_case, force_cast, restrict, validate
+            )
+
+        plan: DecodePlan = cls.__owl_plan__  # type: ignore
+        if not lazy:
+            from_dict = plan.from_dict if validate else plan.from_dict_trusted
+            if from_dict:
+                return from_dict(cls, d, force_snake_case, force_cast, restrict)
 
         instance: T = cls()  # type: ignore
         d = util.replace_keys(d, {"self": "_self"}, force_snake_case)
 
-        properties = cls.__annotations__.items()
-
-        if restrict:
-            assert_extra(properties, d, cls)
-
-        for n, t in properties:
-            f = cls.__methods_dict__.get(f"_{cls.__name__}___{n}")  # type: ignore
-            arg_v = f(d.get(n)) if f else d.get(n)
-            def_v = getattr(instance, n, None)
+        if restrict and validate:
+            extra_keys = d.keys() - plan.keys
+            if extra_keys:
+                raise UnknownPropertiesError(cls=cls, props=sorted(extra_keys))
+
+        lazy_values = {}
+        for f in plan.fields:
+            arg_v = f.hook(d.get(f.name)) if f.hook else d.get(f.name)
+            if lazy and f.lazy:
+                lazy_values[f.name] = arg_v
+                continue
             setattr(
                 instance,
-                n,
-                traverse(
-                    type_=t,
-                    name=n,
-                    value=def_v if arg_v is None else arg_v,
-                    cls=cls,
-                    force_snake_case=force_snake_case,
-                    force_cast=force_cast,
-                    restrict=restrict,
+                f.name,
+                (f.decode if validate else f.decode_trusted)(
+                    f.name,
+                    f.default if arg_v is None else arg_v,
+                    force_snake_case,
+                    force_cast,
+                    restrict,
                 ),
             )
+        if lazy_values:
+            instance.__owl_lazy__ = (
+                lazy_values,
+                force_snake_case,
+                force_cast,
+                restrict,
+                validate,
+            )
 
         return instance
 
+    @classmethod
+    def compile(cls):
+        """Generate `from_dict` specialized for this class and use it from now on.
+
+        It is also enabled by declaring the class with `compiled=True`,
+        then it is generated at the first decoding.
+
+        :return: This class
+
+        Usage:
+
+            >>> from owlmixin.samples import Food
+            >>> class Basket(OwlMixin):
+            ...     id: int
+            ...     foods: TList[Food]
+            >>> basket: Basket = Basket.compile().from_dict({
+            ...     "id": 1,
+            ...     "foods": [{"name": "Apple"}]
+            ... })
+            >>> basket.foods[0].name
+            'Apple'
+            >>> Basket.__owl_plan__.from_dict is not None
+            True
+
+            >>> class Event(OwlMixin, compiled=True):
+            ...     id: int
+            ...     tags: TList[str]
+            >>> Event.from_dict({"id": 1, "tags": ["a"]}).tags
+            ['a']
+            >>> Event.__owl_plan__.from_dict is not None
+            True
+        """
+        cls.__owl_compiled__ = True
+        if "__owl_plan_cache__" in cls.__dict__:
+            del cls.__owl_plan_cache__
+        # Generated now if forward references are resolved, otherwise at the first decoding after that
+        _ = cls.__owl_plan__
+        return cls
+
     @classmethod
     def from_optional_dict(
         cls,
@@ -338,6 +1800,7 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
         force_snake_case: bool = True,
         force_cast: bool = False,
         restrict: bool = True,
+        validate: bool = True,
     ) -> TOption[T]:
         """From dict to optional instance.
 
@@ -345,6 +1808,7 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
         :param force_snake_case: Keys are transformed to snake case in order to compliant PEP8 if True
         :param force_cast: Cast forcibly if True
         :param restrict: Prohibit extra parameters if True
+        :param validate: Skip checks of None, types and extra properties for trusted data if False
         :return: Instance
 
         Usage:
@@ -376,6 +1840,7 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
                 force_snake_case=force_snake_case,
                 force_cast=force_cast,
                 restrict=restrict,
+                validate=validate,
             )
             if d is not None
             else None
@@ -389,13 +1854,26 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
         force_snake_case: bool = True,
         force_cast: bool = False,
         restrict: bool = True,
+        validate: bool = True,
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
     ) -> TList[T]:
         """From list of dict to list of instance
 
+        Dicts are decoded in a single loop generated for this class.
+        The garbage collector is left as it is, so disable it around the call by yourself
+        if collections triggered by many new instances matter (see `benchmarks/bench_from_dicts.py`).
+        Instances decoded in worker processes (`workers` or `executor`) are sent back by pickle,
+        so it pays off only if decoding costs more than pickling (ex. many cores and heavy hooks).
+
         :param ds: List of dict
         :param force_snake_case: Keys are transformed to snake case in order to compliant PEP8 if True
         :param force_cast: Cast forcibly if True
         :param restrict: Prohibit extra parameters if True
+        :param validate: Skip checks of None, types and extra properties for trusted data if False
+        :param workers: Decode in parallel by this number of processes if more than 1.
+                        `cls` must be importable in worker processes.
+        :param executor: Decode in parallel by this executor instead of a new `ProcessPoolExecutor` (not shut down)
         :return: List of instance
 
         Usage:
@@ -410,16 +1888,23 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
             >>> humans[1].name
             'John'
         """
+        if _is_parallel(workers, executor):
+            return _decode_in_parallel(
+                functools.partial(
+                    _decode_dicts_chunk,
+                    cls,
+                    force_snake_case,
+                    force_cast,
+                    restrict,
+                    validate,
+                ),
+                ds if isinstance(ds, list) else list(ds),
+                workers,
+                executor,
+            )
+
         return TList(
-            [
-                cls.from_dict(
-                    d,
-                    force_snake_case=force_snake_case,
-                    force_cast=force_cast,
-                    restrict=restrict,
-                )
-                for d in ds
-            ]
+            _iter_from_dicts(cls, ds, force_snake_case, force_cast, restrict, validate)
         )
 
     @classmethod
@@ -430,6 +1915,7 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
         force_snake_case: bool = True,
         force_cast: bool = False,
         restrict: bool = True,
+        validate: bool = True,
     ) -> TIterator[T]:
         """From iterable dict to iterable instance
 
@@ -437,6 +1923,7 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
         :param force_snake_case: Keys are transformed to snake case in order to compliant PEP8 if True
         :param force_cast: Cast forcibly if True
         :param restrict: Prohibit extra parameters if True
+        :param validate: Skip checks of None, types and extra properties for trusted data if False
         :return: Iterator
 
         Usage:
@@ -452,13 +1939,7 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
             'John'
         """
         return TIterator(
-            cls.from_dict(
-                d,
-                force_snake_case=force_snake_case,
-                force_cast=force_cast,
-                restrict=restrict,
-            )
-            for d in ds
+            _iter_from_dicts(cls, ds, force_snake_case, force_cast, restrict, validate)
         )
 
     @classmethod
@@ -469,6 +1950,7 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
         force_snake_case: bool = True,
         force_cast: bool = False,
         restrict: bool = True,
+        validate: bool = True,
     ) -> TOption[TList[T]]:
         """From list of dict to optional list of instance.
 
@@ -476,6 +1958,7 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
         :param force_snake_case: Keys are transformed to snake case in order to compliant PEP8 if True
         :param force_cast: Cast forcibly if True
         :param restrict: Prohibit extra parameters if True
+        :param validate: Skip checks of None, types and extra properties for trusted data if False
         :return: List of instance
 
         Usage:
@@ -492,6 +1975,7 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
                 force_snake_case=force_snake_case,
                 force_cast=force_cast,
                 restrict=restrict,
+                validate=validate,
             )
             if ds is not None
             else None
@@ -505,6 +1989,7 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
         force_snake_case: bool = True,
         force_cast: bool = False,
         restrict: bool = True,
+        validate: bool = True,
     ) -> TOption[TIterator[T]]:
         """From iterable dict to optional iterable instance.
 
@@ -512,6 +1997,7 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
         :param force_snake_case: Keys are transformed to snake case in order to compliant PEP8 if True
         :param force_cast: Cast forcibly if True
         :param restrict: Prohibit extra parameters if True
+        :param validate: Skip checks of None, types and extra properties for trusted data if False
         :return: Iterable instance
 
         Usage:
@@ -528,6 +2014,7 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
                 force_snake_case=force_snake_case,
                 force_cast=force_cast,
                 restrict=restrict,
+                validate=validate,
             )
             if ds is not None
             else None
@@ -541,6 +2028,7 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
         force_snake_case: bool = True,
         force_cast: bool = False,
         restrict: bool = True,
+        validate: bool = True,
     ) -> TDict[T]:
         """From dict of dict to dict of instance
 
@@ -548,6 +2036,7 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
         :param force_snake_case: Keys are transformed to snake case in order to compliant PEP8 if True
         :param force_cast: Cast forcibly if True
         :param restrict: Prohibit extra parameters if True
+        :param validate: Skip checks of None, types and extra properties for trusted data if False
         :return: Dict of instance
 
         Usage:
@@ -569,6 +2058,7 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
                     force_snake_case=force_snake_case,
                     force_cast=force_cast,
                     restrict=restrict,
+                    validate=validate,
                 )
                 for k, v in ds.items()
             }
@@ -582,6 +2072,7 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
         force_snake_case=True,
         force_cast: bool = False,
         restrict: bool = True,
+        validate: bool = True,
     ) -> TOption[TDict[T]]:
         """From dict of dict to optional dict of instance.
 
@@ -589,6 +2080,7 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
         :param force_snake_case: Keys are transformed to snake case in order to compliant PEP8 if True
         :param force_cast: Cast forcibly if True
         :param restrict: Prohibit extra parameters if True
+        :param validate: Skip checks of None, types and extra properties for trusted data if False
         :return: Dict of instance
 
         Usage:
@@ -605,6 +2097,7 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
                 force_snake_case=force_snake_case,
                 force_cast=force_cast,
                 restrict=restrict,
+                validate=validate,
             )
             if ds is not None
             else None
@@ -618,13 +2111,18 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
         force_snake_case=True,
         force_cast: bool = False,
         restrict: bool = False,
+        validate: bool = True,
     ) -> T:
         """From json string to instance
 
+        There is no iterative path, so data nested deeper than about 200 levels raises `RecursionError`
+        (the json parser itself also has a nesting limit). Use `from_dict(..., iterative=True)` for such dicts.
+
         :param data: Json string
         :param force_snake_case: Keys are transformed to snake case in order to compliant PEP8 if True
         :param force_cast: Cast forcibly if True
         :param restrict: Prohibit extra parameters if True
+        :param validate: Skip checks of None, types and extra properties for trusted data if False
         :return: Instance
 
         Usage:
@@ -650,6 +2148,7 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
             force_snake_case=force_snake_case,
             force_cast=force_cast,
             restrict=restrict,
+            validate=validate,
         )
 
     @classmethod
@@ -661,21 +2160,47 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
         force_snake_case=True,
         force_cast: bool = False,
         restrict: bool = False,
+        validate: bool = True,
+        compression: Optional[str] = "infer",
+        cache: bool = False,
     ) -> T:
         """From json file path to instance
 
+        There is no iterative path for deeply nested data (see `from_json`).
+
         :param fpath: Json file path
         :param encoding: Json file encoding
         :param force_snake_case: Keys are transformed to snake case in order to compliant PEP8 if True
         :param force_cast: Cast forcibly if True
         :param restrict: Prohibit extra parameters if True
+        :param validate: Skip checks of None, types and extra properties for trusted data if False
+        :param compression: "gzip", "bz2", "xz" or None. It is inferred from the extension of fpath if "infer"
+        :param cache: Return the instance cached in `util.file_cache` if the file is not changed since it was
+                      loaded with the same options. Don't mutate it because it is shared.
         :return: Instance
         """
-        return cls.from_dict(
-            util.load_jsonf(fpath, encoding),
-            force_snake_case=force_snake_case,
-            force_cast=force_cast,
-            restrict=restrict,
+
+        def load():
+            return cls.from_dict(
+                util.load_jsonf(fpath, encoding, compression=compression),
+                force_snake_case=force_snake_case,
+                force_cast=force_cast,
+                restrict=restrict,
+                validate=validate,
+            )
+
+        return _load_with_cache(
+            cache,
+            load,
+            fpath,
+            cls,
+            "from_jsonf",
+            encoding,
+            force_snake_case,
+            force_cast,
+            restrict,
+            validate,
+            compression,
         )
 
     @classmethod
@@ -686,13 +2211,22 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
         force_snake_case=True,
         force_cast: bool = False,
         restrict: bool = False,
+        validate: bool = True,
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
     ) -> TList[T]:
         """From json string to list of instance
 
+        There is no iterative path for deeply nested data (see `from_json`).
+
         :param data: Json string
         :param force_snake_case: Keys are transformed to snake case in order to compliant PEP8 if True
         :param force_cast: Cast forcibly if True
         :param restrict: Prohibit extra parameters if True
+        :param validate: Skip checks of None, types and extra properties for trusted data if False
+        :param workers: Decode in parallel by this number of processes if more than 1.
+                        `cls` must be importable in worker processes.
+        :param executor: Decode in parallel by this executor instead of a new `ProcessPoolExecutor` (not shut down)
         :return: List of instance
 
         Usage:
@@ -712,6 +2246,9 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
             force_snake_case=force_snake_case,
             force_cast=force_cast,
             restrict=restrict,
+            validate=validate,
+            workers=workers,
+            executor=executor,
         )
 
     @classmethod
@@ -722,13 +2259,17 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
         force_snake_case=True,
         force_cast: bool = False,
         restrict: bool = False,
+        validate: bool = True,
     ) -> TIterator[T]:
-        """From json string to iterable instance
+        """From json string to iterable instance (elements of the array are decoded one by one)
+
+        There is no iterative path for deeply nested data (see `from_json`).
 
         :param data: Json string
         :param force_snake_case: Keys are transformed to snake case in order to compliant PEP8 if True
         :param force_cast: Cast forcibly if True
         :param restrict: Prohibit extra parameters if True
+        :param validate: Skip checks of None, types and extra properties for trusted data if False
         :return: Iterable instance
 
         Usage:
@@ -744,10 +2285,11 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
             True
         """
         return cls.from_iterable_dicts(
-            util.load_json(data),
+            util.load_json_iterator(data),
             force_snake_case=force_snake_case,
             force_cast=force_cast,
             restrict=restrict,
+            validate=validate,
         )
 
     @classmethod
@@ -759,21 +2301,54 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
         force_snake_case=True,
         force_cast: bool = False,
         restrict: bool = False,
+        validate: bool = True,
+        compression: Optional[str] = "infer",
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        cache: bool = False,
     ) -> TList[T]:
         """From json file path to list of instance
 
+        There is no iterative path for deeply nested data (see `from_json`).
+
         :param fpath: Json file path
         :param encoding: Json file encoding
         :param force_snake_case: Keys are transformed to snake case in order to compliant PEP8 if True
         :param force_cast: Cast forcibly if True
         :param restrict: Prohibit extra parameters if True
+        :param validate: Skip checks of None, types and extra properties for trusted data if False
+        :param compression: "gzip", "bz2", "xz" or None. It is inferred from the extension of fpath if "infer"
+        :param workers: Decode in parallel by this number of processes if more than 1.
+                        `cls` must be importable in worker processes.
+        :param executor: Decode in parallel by this executor instead of a new `ProcessPoolExecutor` (not shut down)
+        :param cache: Return the instance cached in `util.file_cache` if the file is not changed since it was
+                      loaded with the same options. Don't mutate it because it is shared.
         :return: List of instance
         """
-        return cls.from_dicts(
-            util.load_jsonf(fpath, encoding),
-            force_snake_case=force_snake_case,
-            force_cast=force_cast,
-            restrict=restrict,
+
+        def load():
+            return cls.from_dicts(
+                util.load_jsonf(fpath, encoding, compression=compression),
+                force_snake_case=force_snake_case,
+                force_cast=force_cast,
+                restrict=restrict,
+                validate=validate,
+                workers=workers,
+                executor=executor,
+            )
+
+        return _load_with_cache(
+            cache,
+            load,
+            fpath,
+            cls,
+            "from_jsonf_to_list",
+            encoding,
+            force_snake_case,
+            force_cast,
+            restrict,
+            validate,
+            compression,
         )
 
     @classmethod
@@ -785,21 +2360,99 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
         force_snake_case=True,
         force_cast: bool = False,
         restrict: bool = False,
+        validate: bool = True,
+        compression: Optional[str] = "infer",
     ) -> TIterator[T]:
         """From json file path to iterable instance
 
+        The file is read in chunks and elements of the top-level array are decoded one by one,
+        so memory is bounded by the largest element instead of the whole file.
+
+        There is no iterative path for deeply nested data (see `from_json`).
+
         :param fpath: Json file path
         :param encoding: Json file encoding
         :param force_snake_case: Keys are transformed to snake case in order to compliant PEP8 if True
         :param force_cast: Cast forcibly if True
         :param restrict: Prohibit extra parameters if True
+        :param validate: Skip checks of None, types and extra properties for trusted data if False
+        :param compression: "gzip", "bz2", "xz" or None. It is inferred from the extension of fpath if "infer"
+        :return: Iterable instance
+        """
+        return cls.from_iterable_dicts(
+            util.load_jsonf_iterator(fpath, encoding, compression=compression),
+            force_snake_case=force_snake_case,
+            force_cast=force_cast,
+            restrict=restrict,
+            validate=validate,
+        )
+
+    @classmethod
+    def from_jsonl_to_iterator(
+        cls,
+        data: str,
+        *,
+        force_snake_case=True,
+        force_cast: bool = False,
+        restrict: bool = False,
+        validate: bool = True,
+    ) -> TIterator[T]:
+        """From json lines string (one record per line) to iterable instance
+
+        :param data: Json lines string
+        :param force_snake_case: Keys are transformed to snake case in order to compliant PEP8 if True
+        :param force_cast: Cast forcibly if True
+        :param restrict: Prohibit extra parameters if True
+        :param validate: Skip checks of None, types and extra properties for trusted data if False
+        :return: Iterable instance
+
+        Usage:
+
+            >>> from owlmixin.samples import Human
+            >>> humans: TIterator[Human] = Human.from_jsonl_to_iterator(
+            ...     '{"id": 1, "name": "Tom",  "favorites": [{"name": "Apple"}]}\\n'
+            ...     '{"id": 2, "name": "John", "favorites": [{"name": "Orange"}]}\\n'
+            ... )
+            >>> humans.next_at(1).get().name
+            'John'
+        """
+        return cls.from_iterable_dicts(
+            util.load_jsonl_iterator(data),
+            force_snake_case=force_snake_case,
+            force_cast=force_cast,
+            restrict=restrict,
+            validate=validate,
+        )
+
+    @classmethod
+    def from_jsonlf_to_iterator(
+        cls,
+        fpath: str,
+        encoding: str = "utf8",
+        *,
+        force_snake_case=True,
+        force_cast: bool = False,
+        restrict: bool = False,
+        validate: bool = True,
+        compression: Optional[str] = "infer",
+    ) -> TIterator[T]:
+        """From json lines file path to iterable instance (lines are read and decoded one by one)
+
+        :param fpath: Json lines file path
+        :param encoding: Json lines file encoding
+        :param force_snake_case: Keys are transformed to snake case in order to compliant PEP8 if True
+        :param force_cast: Cast forcibly if True
+        :param restrict: Prohibit extra parameters if True
+        :param validate: Skip checks of None, types and extra properties for trusted data if False
+        :param compression: "gzip", "bz2", "xz" or None. It is inferred from the extension of fpath if "infer"
         :return: Iterable instance
         """
         return cls.from_iterable_dicts(
-            util.load_jsonf(fpath, encoding),
+            util.load_jsonlf_iterator(fpath, encoding, compression=compression),
             force_snake_case=force_snake_case,
             force_cast=force_cast,
             restrict=restrict,
+            validate=validate,
         )
 
     @classmethod
@@ -810,6 +2463,7 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
         force_snake_case=True,
         force_cast: bool = False,
         restrict: bool = True,
+        validate: bool = True,
     ) -> T:
         """From yaml string to instance
 
@@ -817,6 +2471,7 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
         :param force_snake_case: Keys are transformed to snake case in order to compliant PEP8 if True
         :param force_cast: Cast forcibly if True
         :param restrict: Prohibit extra parameters if True
+        :param validate: Skip checks of None, types and extra properties for trusted data if False
         :return: Instance
 
         Usage:
@@ -844,6 +2499,7 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
             force_snake_case=force_snake_case,
             force_cast=force_cast,
             restrict=restrict,
+            validate=validate,
         )
 
     @classmethod
@@ -855,6 +2511,9 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
         force_snake_case=True,
         force_cast: bool = False,
         restrict: bool = True,
+        validate: bool = True,
+        compression: Optional[str] = "infer",
+        cache: bool = False,
     ) -> T:
         """From yaml file path to instance
 
@@ -863,13 +2522,34 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
         :param force_snake_case: Keys are transformed to snake case in order to compliant PEP8 if True
         :param force_cast: Cast forcibly if True
         :param restrict: Prohibit extra parameters if True
+        :param validate: Skip checks of None, types and extra properties for trusted data if False
+        :param compression: "gzip", "bz2", "xz" or None. It is inferred from the extension of fpath if "infer"
+        :param cache: Return the instance cached in `util.file_cache` if the file is not changed since it was
+                      loaded with the same options. Don't mutate it because it is shared.
         :return: Instance
         """
-        return cls.from_dict(
-            util.load_yamlf(fpath, encoding),
-            force_snake_case=force_snake_case,
-            force_cast=force_cast,
-            restrict=restrict,
+
+        def load():
+            return cls.from_dict(
+                util.load_yamlf(fpath, encoding, compression=compression),
+                force_snake_case=force_snake_case,
+                force_cast=force_cast,
+                restrict=restrict,
+                validate=validate,
+            )
+
+        return _load_with_cache(
+            cache,
+            load,
+            fpath,
+            cls,
+            "from_yamlf",
+            encoding,
+            force_snake_case,
+            force_cast,
+            restrict,
+            validate,
+            compression,
         )
 
     @classmethod
@@ -880,6 +2560,7 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
         force_snake_case=True,
         force_cast: bool = False,
         restrict: bool = True,
+        validate: bool = True,
     ) -> TList[T]:
         """From yaml string to list of instance
 
@@ -887,6 +2568,7 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
         :param force_snake_case: Keys are transformed to snake case in order to compliant PEP8 if True
         :param force_cast: Cast forcibly if True
         :param restrict: Prohibit extra parameters if True
+        :param validate: Skip checks of None, types and extra properties for trusted data if False
         :return: List of instance
 
         Usage:
@@ -914,6 +2596,7 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
             force_snake_case=force_snake_case,
             force_cast=force_cast,
             restrict=restrict,
+            validate=validate,
         )
 
     @classmethod
@@ -924,6 +2607,8 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
         force_snake_case=True,
         force_cast: bool = False,
         restrict: bool = True,
+        validate: bool = True,
+        multi_document: bool = False,
     ) -> TIterator[T]:
         """From yaml string to iterable instance
 
@@ -931,6 +2616,8 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
         :param force_snake_case: Keys are transformed to snake case in order to compliant PEP8 if True
         :param force_cast: Cast forcibly if True
         :param restrict: Prohibit extra parameters if True
+        :param validate: Skip checks of None, types and extra properties for trusted data if False
+        :param multi_document: Each `---` separated document is an instance if True, else the document is a list
         :return: Iterable instance
 
         Usage:
@@ -953,12 +2640,27 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
             True
             >>> human1.favorites[0].name
             'Orange'
+
+        Documents are decoded one by one if `multi_document` is True
+
+            >>> humans: TIterator[Human] = Human.from_yaml_to_iterator('''
+            ... id: 1
+            ... name: Tom
+            ... favorites: []
+            ... ---
+            ... id: 2
+            ... name: John
+            ... favorites: []
+            ... ''', multi_document=True)
+            >>> humans.map(lambda x: x.name).to_list()
+            ['Tom', 'John']
         """
         return cls.from_iterable_dicts(
-            util.load_yaml(data),
+            util.load_yaml_documents(data) if multi_document else util.load_yaml(data),
             force_snake_case=force_snake_case,
             force_cast=force_cast,
             restrict=restrict,
+            validate=validate,
         )
 
     @classmethod
@@ -970,6 +2672,11 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
         force_snake_case=True,
         force_cast: bool = False,
         restrict: bool = True,
+        validate: bool = True,
+        compression: Optional[str] = "infer",
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        cache: bool = False,
     ) -> TList[T]:
         """From yaml file path to list of instance
 
@@ -978,13 +2685,39 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
         :param force_snake_case: Keys are transformed to snake case in order to compliant PEP8 if True
         :param force_cast: Cast forcibly if True
         :param restrict: Prohibit extra parameters if True
+        :param validate: Skip checks of None, types and extra properties for trusted data if False
+        :param compression: "gzip", "bz2", "xz" or None. It is inferred from the extension of fpath if "infer"
+        :param workers: Decode in parallel by this number of processes if more than 1.
+                        `cls` must be importable in worker processes.
+        :param executor: Decode in parallel by this executor instead of a new `ProcessPoolExecutor` (not shut down)
+        :param cache: Return the instance cached in `util.file_cache` if the file is not changed since it was
+                      loaded with the same options. Don't mutate it because it is shared.
         :return: List of instance
         """
-        return cls.from_dicts(
-            util.load_yamlf(fpath, encoding),
-            force_snake_case=force_snake_case,
-            force_cast=force_cast,
-            restrict=restrict,
+
+        def load():
+            return cls.from_dicts(
+                util.load_yamlf(fpath, encoding, compression=compression),
+                force_snake_case=force_snake_case,
+                force_cast=force_cast,
+                restrict=restrict,
+                validate=validate,
+                workers=workers,
+                executor=executor,
+            )
+
+        return _load_with_cache(
+            cache,
+            load,
+            fpath,
+            cls,
+            "from_yamlf_to_list",
+            encoding,
+            force_snake_case,
+            force_cast,
+            restrict,
+            validate,
+            compression,
         )
 
     @classmethod
@@ -996,6 +2729,9 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
         force_snake_case=True,
         force_cast: bool = False,
         restrict: bool = True,
+        validate: bool = True,
+        multi_document: bool = False,
+        compression: Optional[str] = "infer",
     ) -> TIterator[T]:
         """From yaml file path to iterable instance
 
@@ -1004,13 +2740,22 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
         :param force_snake_case: Keys are transformed to snake case in order to compliant PEP8 if True
         :param force_cast: Cast forcibly if True
         :param restrict: Prohibit extra parameters if True
+        :param validate: Skip checks of None, types and extra properties for trusted data if False
+        :param multi_document: Each `---` separated document is an instance if True, else the document is a list.
+                               Documents are parsed lazily one by one if True.
+        :param compression: "gzip", "bz2", "xz" or None. It is inferred from the extension of fpath if "infer"
         :return: Iterable instance
         """
         return cls.from_iterable_dicts(
-            util.load_yamlf(fpath, encoding),
+            (
+                util.load_yamlf_documents(fpath, encoding, compression=compression)
+                if multi_document
+                else util.load_yamlf(fpath, encoding, compression=compression)
+            ),
             force_snake_case=force_snake_case,
             force_cast=force_cast,
             restrict=restrict,
+            validate=validate,
         )
 
     @classmethod
@@ -1022,6 +2767,12 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
         *,
         force_snake_case: bool = True,
         restrict: bool = True,
+        validate: bool = True,
+        dialect: Optional[Union[str, csv.Dialect, type]] = None,
+        compression: Optional[str] = "infer",
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        cache: bool = False,
     ) -> TList[T]:
         """From csv file path to list of instance
 
@@ -1030,13 +2781,60 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
         :param encoding: Csv file encoding
         :param force_snake_case: Keys are transformed to snake case in order to compliant PEP8 if True
         :param restrict: Prohibit extra parameters if True
+        :param validate: Skip checks of None, types and extra properties for trusted data if False
+        :param dialect: Csv dialect name or class (ex. "excel-tab", "lf_tsv"). It is sniffed from the file if None
+        :param compression: "gzip", "bz2", "xz" or None. It is inferred from the extension of fpath if "infer"
+        :param workers: Decode in parallel by this number of processes if more than 1.
+                        `cls` must be importable in worker processes.
+        :param executor: Decode in parallel by this executor instead of a new `ProcessPoolExecutor` (not shut down)
+        :param cache: Return the instance cached in `util.file_cache` if the file is not changed since it was
+                      loaded with the same options. Don't mutate it because it is shared.
         :return: List of Instance
         """
-        return cls.from_dicts(
-            list(util.load_csvf(fpath, fieldnames, encoding)),
-            force_snake_case=force_snake_case,
-            force_cast=True,
-            restrict=restrict,
+
+        def load():
+            if _is_parallel(workers, executor):
+                return _from_csvf_in_parallel(
+                    cls,
+                    fpath,
+                    fieldnames,
+                    encoding,
+                    dialect,
+                    compression,
+                    force_snake_case,
+                    restrict,
+                    validate,
+                    workers,
+                    executor,
+                )
+
+            return TList(
+                _iter_from_csvf(
+                    cls,
+                    fpath,
+                    fieldnames,
+                    encoding,
+                    dialect,
+                    compression,
+                    force_snake_case,
+                    restrict,
+                    validate,
+                )
+            )
+
+        return _load_with_cache(
+            cache,
+            load,
+            fpath,
+            cls,
+            "from_csvf_to_list",
+            None if fieldnames is None else tuple(fieldnames),
+            encoding,
+            force_snake_case,
+            restrict,
+            validate,
+            dialect,
+            compression,
         )
 
     @classmethod
@@ -1048,6 +2846,9 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
         *,
         force_snake_case: bool = True,
         restrict: bool = True,
+        validate: bool = True,
+        dialect: Optional[Union[str, csv.Dialect, type]] = None,
+        compression: Optional[str] = "infer",
     ) -> TIterator[T]:
         """From csv file path to iterable instance
 
@@ -1056,13 +2857,23 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
         :param encoding: Csv file encoding
         :param force_snake_case: Keys are transformed to snake case in order to compliant PEP8 if True
         :param restrict: Prohibit extra parameters if True
+        :param validate: Skip checks of None, types and extra properties for trusted data if False
+        :param dialect: Csv dialect name or class (ex. "excel-tab", "lf_tsv"). It is sniffed from the file if None
+        :param compression: "gzip", "bz2", "xz" or None. It is inferred from the extension of fpath if "infer"
         :return: Iterable Instance
         """
-        return cls.from_iterable_dicts(
-            util.load_csvf(fpath, fieldnames, encoding),
-            force_snake_case=force_snake_case,
-            force_cast=True,
-            restrict=restrict,
+        return TIterator(
+            _iter_from_csvf(
+                cls,
+                fpath,
+                fieldnames,
+                encoding,
+                dialect,
+                compression,
+                force_snake_case,
+                restrict,
+                validate,
+            )
         )
 
     @classmethod
@@ -1073,6 +2884,7 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
         force_snake_case=True,
         force_cast: bool = False,
         restrict: bool = False,
+        validate: bool = True,
     ) -> T:
         """From url which returns json to instance
 
@@ -1080,6 +2892,7 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
         :param force_snake_case: Keys are transformed to snake case in order to compliant PEP8 if True
         :param force_cast: Cast forcibly if True
         :param restrict: Prohibit extra parameters if True
+        :param validate: Skip checks of None, types and extra properties for trusted data if False
         :return: Instance
         """
         return cls.from_dict(
@@ -1087,4 +2900,29 @@ class OwlMixin(DictTransformer, JsonTransformer, YamlTransformer, metaclass=OwlM
             force_snake_case=force_snake_case,
             force_cast=force_cast,
             restrict=restrict,
+            validate=validate,
         )
+
+
+class OwlSlotsMixin(OwlMixin, slots=True):
+    """OwlMixin whose instances store properties in `__slots__` instead of `__dict__`.
+
+    It is same as declaring a class with `slots=True` (ex. `class Human(OwlMixin, slots=True)`).
+    Defaults are moved from class variables to `__owl_defaults__`,
+    and subclasses are also declared with `slots=True` unless `slots=False` is specified.
+
+    Usage:
+
+        >>> class Point(OwlSlotsMixin):
+        ...     x: int
+        ...     y: int = 0
+        >>> p = Point.from_dict({"x": 1})
+        >>> p.to_dict()
+        {'x': 1, 'y': 0}
+        >>> Point.__slots__
+        ('x', 'y')
+        >>> hasattr(p, "__dict__")
+        False
+        >>> Point().y
+        0
+    """
@@ -22,6 +22,16 @@ class OwlMixinError(Exception):
     def description(self) -> str:
         raise NotImplementedError
 
+    def __reduce__(self):
+        # `__init__` takes keyword arguments only, so restore attributes directly (ex. from worker processes)
+        return _restore_error, (type(self), self.__dict__)
+
+
+def _restore_error(cls, attributes: dict) -> OwlMixinError:
+    error = cls.__new__(cls)
+    error.__dict__.update(attributes)
+    return error
+
 
 class InvalidTypeError(OwlMixinError):
     """
@@ -2,6 +2,7 @@
 
 import functools
 from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from itertools import chain, filterfalse, groupby, islice, takewhile, tee
 from typing import (
     Any,
@@ -11,17 +12,21 @@ from typing import (
     Iterable,
     Iterator,
     List,
+    Optional,
     Tuple,
     TypeVar,
     Union,
 )
 
+from owlmixin import util
 from owlmixin.owloption import TOption
 from owlmixin.transformers import (
     CsvTransformer,
     DictsTransformer,
     DictTransformer,
+    JsonLinesTransformer,
     JsonTransformer,
+    SnapshotTransformer,
     TableTransformer,
     YamlTransformer,
 )
@@ -31,11 +36,63 @@ U = TypeVar("U")
 K = TypeVar("K")
 
 
+def _map_chunk(func, chunk: list) -> list:
+    return [func(x) for x in chunk]
+
+
+def _filter_chunk(func, chunk: list) -> list:
+    return [x for x in chunk if func(x)]
+
+
+def _check_parallel_options(chunk_size: int, max_pending: Optional[int]) -> None:
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be 1 or more: {chunk_size}")
+    if max_pending is not None and max_pending < 1:
+        raise ValueError(f"max_pending must be 1 or more: {max_pending}")
+
+
+def _parallel(
+    apply_chunk: Callable[[Callable, list], list],
+    func: Callable,
+    iterable: Iterable,
+    workers: Optional[int],
+    processes: bool,
+    executor: Optional[Executor],
+    ordered: bool,
+    chunk_size: int,
+    max_pending: Optional[int],
+) -> Iterator:
+    """Apply `apply_chunk(func, chunk)` to chunks of iterable in a pool, and yield elements of results.
+
+    Only `max_pending` chunks are submitted at once, so a lazy iterable is never materialized.
+    The pool is created at the first `next` and shut down (or pending chunks are cancelled) at the end.
+    """
+    # pylint: disable=too-many-arguments
+    pool = executor or (ProcessPoolExecutor if processes else ThreadPoolExecutor)(
+        max_workers=workers
+    )
+    iterator = iter(iterable)
+    try:
+        for results in util.map_bounded(
+            pool,
+            functools.partial(apply_chunk, func),
+            iter(lambda: list(islice(iterator, chunk_size)), []),
+            util.pool_size(workers) * 2 if max_pending is None else max_pending,
+            ordered=ordered,
+        ):
+            yield from results
+    finally:
+        if executor is None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
 class TList(
     list,
     DictsTransformer,
     JsonTransformer,
+    JsonLinesTransformer,
     YamlTransformer,
+    SnapshotTransformer,
     CsvTransformer,
     TableTransformer,
     Generic[T],
@@ -78,6 +135,42 @@ class TList(
         for x in self:
             func(x)
 
+    def pfor_each(
+        self,
+        func: Callable[[T], None],
+        workers: Optional[int] = None,
+        *,
+        processes: bool = False,
+        executor: Optional[Executor] = None,
+        chunk_size: int = 1,
+        max_pending: Optional[int] = None,
+    ) -> None:
+        """Same as `for_each`, but func is called in a thread pool (or a process pool) in any order.
+        Options are the same as `pmap`.
+
+        Usage:
+
+            >>> xs = []
+            >>> TList([1, 2, 3]).pfor_each(xs.append, workers=2)
+            >>> sorted(xs)
+            [1, 2, 3]
+        """
+        _check_parallel_options(chunk_size, max_pending)
+        deque(
+            _parallel(
+                _map_chunk,
+                func,
+                self,
+                workers,
+                processes,
+                executor,
+                False,
+                chunk_size,
+                max_pending,
+            ),
+            maxlen=0,
+        )
+
     def map(self, func: Callable[[T], U]) -> "TList[U]":
         """
         Usage:
@@ -86,6 +179,47 @@ class TList(
         """
         return TList(map(func, self))
 
+    def pmap(
+        self,
+        func: Callable[[T], U],
+        workers: Optional[int] = None,
+        *,
+        processes: bool = False,
+        executor: Optional[Executor] = None,
+        ordered: bool = True,
+        chunk_size: int = 1,
+        max_pending: Optional[int] = None,
+    ) -> "TList[U]":
+        """Same as `map`, but func is called in a thread pool (or a process pool)
+
+        :param func: It must be picklable (ex. module level function) if processes is True
+        :param workers: Number of threads or processes (default of the pool if None)
+        :param processes: Use `ProcessPoolExecutor` for CPU bound func if True, else `ThreadPoolExecutor`
+        :param executor: Use this executor instead of a new pool (it is not shut down)
+        :param ordered: Keep the order of elements if True, else in order of completion
+        :param chunk_size: Number of elements sent to a worker at once
+        :param max_pending: Max number of chunks submitted at once (twice of workers if None)
+        :raises ValueError: If chunk_size or max_pending is less than 1
+
+        Usage:
+            >>> TList([1, 2, 3, 4, 5]).pmap(lambda x: x+1, workers=2)
+            [2, 3, 4, 5, 6]
+        """
+        _check_parallel_options(chunk_size, max_pending)
+        return TList(
+            _parallel(
+                _map_chunk,
+                func,
+                self,
+                workers,
+                processes,
+                executor,
+                ordered,
+                chunk_size,
+                max_pending,
+            )
+        )
+
     def emap(self, func: Callable[[T, int], U]) -> "TList[U]":
         """
         Usage:
@@ -118,6 +252,39 @@ class TList(
         """
         return TList([x for x in self if func(x)])
 
+    def pfilter(
+        self,
+        func: Callable[[T], bool],
+        workers: Optional[int] = None,
+        *,
+        processes: bool = False,
+        executor: Optional[Executor] = None,
+        ordered: bool = True,
+        chunk_size: int = 1,
+        max_pending: Optional[int] = None,
+    ) -> "TList[T]":
+        """Same as `filter`, but func is called in a thread pool (or a process pool).
+        Options are the same as `pmap`.
+
+        Usage:
+            >>> TList([1, 2, 3, 4, 5]).pfilter(lambda x: x > 3, workers=2)
+            [4, 5]
+        """
+        _check_parallel_options(chunk_size, max_pending)
+        return TList(
+            _parallel(
+                _filter_chunk,
+                func,
+                self,
+                workers,
+                processes,
+                executor,
+                ordered,
+                chunk_size,
+                max_pending,
+            )
+        )
+
     def reject(self, func: Callable[[T], bool]) -> "TList[T]":
         """
         Usage:
@@ -366,6 +533,7 @@ class TList(
 class TIterator(
     DictsTransformer,
     JsonTransformer,
+    JsonLinesTransformer,
     YamlTransformer,
     CsvTransformer,
     TableTransformer,
@@ -426,6 +594,42 @@ class TIterator(
         for x in self:
             func(x)
 
+    def pfor_each(
+        self,
+        func: Callable[[T], None],
+        workers: Optional[int] = None,
+        *,
+        processes: bool = False,
+        executor: Optional[Executor] = None,
+        chunk_size: int = 1,
+        max_pending: Optional[int] = None,
+    ) -> None:
+        """Same as `for_each`, but func is called in a thread pool (or a process pool) in any order.
+        Options are the same as `pmap`.
+
+        Usage:
+
+            >>> xs = []
+            >>> TIterator([1, 2, 3]).pfor_each(xs.append, workers=2)
+            >>> sorted(xs)
+            [1, 2, 3]
+        """
+        _check_parallel_options(chunk_size, max_pending)
+        deque(
+            _parallel(
+                _map_chunk,
+                func,
+                self,
+                workers,
+                processes,
+                executor,
+                False,
+                chunk_size,
+                max_pending,
+            ),
+            maxlen=0,
+        )
+
     def map(self, func: Callable[[T], U]) -> "TIterator[U]":
         """
         Usage:
@@ -438,6 +642,52 @@ class TIterator(
         """
         return TIterator(map(func, self))
 
+    def pmap(
+        self,
+        func: Callable[[T], U],
+        workers: Optional[int] = None,
+        *,
+        processes: bool = False,
+        executor: Optional[Executor] = None,
+        ordered: bool = True,
+        chunk_size: int = 1,
+        max_pending: Optional[int] = None,
+    ) -> "TIterator[U]":
+        """Same as `map`, but func is called in a thread pool (or a process pool).
+        Only `max_pending` chunks are read ahead, so the iterator is never loaded on memory at once.
+
+        :param func: It must be picklable (ex. module level function) if processes is True
+        :param workers: Number of threads or processes (default of the pool if None)
+        :param processes: Use `ProcessPoolExecutor` for CPU bound func if True, else `ThreadPoolExecutor`
+        :param executor: Use this executor instead of a new pool (it is not shut down)
+        :param ordered: Keep the order of elements if True, else in order of completion
+        :param chunk_size: Number of elements sent to a worker at once
+        :param max_pending: Max number of chunks submitted at once (twice of workers if None)
+        :raises ValueError: If chunk_size or max_pending is less than 1
+
+        Usage:
+
+            >>> it = TIterator([1, 2, 3, 4, 5]).pmap(lambda x: x+1, workers=2)
+            >>> it.to_list()
+            [2, 3, 4, 5, 6]
+            >>> it.to_list()
+            []
+        """
+        _check_parallel_options(chunk_size, max_pending)
+        return TIterator(
+            _parallel(
+                _map_chunk,
+                func,
+                self,
+                workers,
+                processes,
+                executor,
+                ordered,
+                chunk_size,
+                max_pending,
+            )
+        )
+
     def emap(self, func: Callable[[T, int], U]) -> "TIterator[U]":
         """
         Usage:
@@ -462,6 +712,43 @@ class TIterator(
         """
         return TIterator(filter(func, self))
 
+    def pfilter(
+        self,
+        func: Callable[[T], bool],
+        workers: Optional[int] = None,
+        *,
+        processes: bool = False,
+        executor: Optional[Executor] = None,
+        ordered: bool = True,
+        chunk_size: int = 1,
+        max_pending: Optional[int] = None,
+    ) -> "TIterator[T]":
+        """Same as `filter`, but func is called in a thread pool (or a process pool).
+        Options are the same as `pmap`.
+
+        Usage:
+
+            >>> it = TIterator([1, 2, 3, 4, 5]).pfilter(lambda x: x > 3, workers=2)
+            >>> it.to_list()
+            [4, 5]
+            >>> it.to_list()
+            []
+        """
+        _check_parallel_options(chunk_size, max_pending)
+        return TIterator(
+            _parallel(
+                _filter_chunk,
+                func,
+                self,
+                workers,
+                processes,
+                executor,
+                ordered,
+                chunk_size,
+                max_pending,
+            )
+        )
+
     def reject(self, func: Callable[[T], bool]) -> "TIterator[T]":
         """
         Usage:
@@ -801,7 +1088,14 @@ class TIterator(
         return TIterator(reversed(list(self)))
 
 
-class TDict(dict, DictTransformer, JsonTransformer, YamlTransformer, Generic[T]):
+class TDict(
+    dict,
+    DictTransformer,
+    JsonTransformer,
+    YamlTransformer,
+    SnapshotTransformer,
+    Generic[T],
+):
     @property
     def _dict(self) -> dict:
         return dict(self)
@@ -10,6 +10,10 @@ class TOption(Generic[T]):
     def __init__(self, value):
         self.value = value
 
+    def __reduce__(self):
+        # A value without the attribute name, instead of the instance dict
+        return type(self), (self.value,)
+
     def get(self) -> T:
         """
         Usage:
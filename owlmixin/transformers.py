@@ -1,11 +1,27 @@
 # coding: utf-8
-from typing import Any, Iterator, List, Optional, Sequence
+from json.encoder import encode_basestring  # type: ignore
+from operator import itemgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from owlmixin import util
 from owlmixin.owloption import TOption
 
 
 class ValueTransformer:
+    __slots__ = ()
+
     def to_value(self, ignore_none, force_value):
         # pylint: disable=unused-argument
         return str(self)
@@ -55,7 +71,14 @@ def traverse(value, ignore_none=True, force_value=False, ignore_empty=False):
     return value
 
 
-def traverse_dict(instance_dict, ignore_none, force_value=False, ignore_empty=False):
+def traverse_dict(
+    instance_dict, ignore_none, force_value=False, ignore_empty=False, encoders=None
+):
+    if encoders:
+        return encode_dict(
+            instance_dict, encoders, ignore_none, force_value, ignore_empty
+        )
+
     d = {}
     for k, v in instance_dict.items():
         evaluated = evaluate(v)
@@ -74,13 +97,783 @@ def traverse_list(instance_list, ignore_none, force_value=False, ignore_empty=Fa
     ]
 
 
+_SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+def traverse_iteratively(
+    value, ignore_none=True, force_value=False, ignore_empty=False
+):
+    """Same as `traverse`, but uses an explicit stack instead of recursion.
+
+    It handles arbitrarily deep nesting without `RecursionError`.
+    DictTransformer which doesn't override `to_dict` is expanded by `_dict` without calling `to_dict`.
+
+    :param value: Value to traverse
+    :param ignore_none: Properties which is None are excluded if True
+    :param force_value: Transform to value using to_value of ValueTransformer if True
+    :param ignore_empty: Properties which is empty are excluded if True
+    :return: Traversed value
+
+    Usage:
+
+        >>> traverse_iteratively({"a": [TOption(1), TOption(None)], "b": TOption(None)})
+        {'a': [1]}
+        >>> deep = []
+        >>> for _ in range(5000):
+        ...     deep = [deep]
+        >>> x = traverse_iteratively(deep)
+        >>> for _ in range(5000):
+        ...     x = x[0]
+        >>> x
+        []
+    """
+    # pylint: disable=too-many-branches
+    root = [None]
+    # (value, container of the result, key or index in the container)
+    stack = [(value, root, 0)]
+    pop = stack.pop
+
+    while stack:
+        v, target, key = pop()
+        while isinstance(v, TOption):
+            v = v.get()
+
+        if force_value and isinstance(v, ValueTransformer):
+            target[key] = v.to_value(ignore_none, force_value)
+            continue
+        if isinstance(v, dict):
+            items = v.items()
+        elif isinstance(v, (list, Iterator)):
+            items = None
+        elif isinstance(v, DictTransformer):
+            if type(v).to_dict is not DictTransformer.to_dict:
+                target[key] = v.to_dict(
+                    ignore_none=ignore_none,
+                    force_value=force_value,
+                    ignore_empty=ignore_empty,
+                )
+                continue
+            items = v._dict.items()  # pylint: disable=protected-access
+        else:
+            target[key] = v
+            continue
+
+        result: Any
+        if items is None:
+            children = [i for i in v if not (ignore_none and is_ignore(i))]
+            result = [None] * len(children)
+            indexed: Iterable = enumerate(children)
+        else:
+            result = {}
+            indexed = []
+            for k, c in items:
+                evaluated = evaluate(c)
+                if not (ignore_empty and not bool(evaluated)) and not (
+                    ignore_none and is_ignore(evaluated)
+                ):
+                    result[k] = None
+                    indexed.append((k, evaluated))
+        target[key] = result
+
+        # Scalars are set now, and the others are set in order when popped
+        pending = []
+        for k, c in indexed:
+            if type(c) in _SCALAR_TYPES:
+                result[k] = c
+            else:
+                pending.append((c, result, k))
+        pending.reverse()
+        stack.extend(pending)
+
+    return root[0]
+
+
+SKIP = object()
+"""Returned by field encoders when the property is excluded"""
+
+
+def encode_field(v, ignore_none, force_value, ignore_empty):
+    """Same as one item of `traverse_dict`, but returns `SKIP` if excluded"""
+    evaluated = evaluate(v)
+    if (ignore_empty and not bool(evaluated)) or (ignore_none and is_ignore(evaluated)):
+        return SKIP
+    return traverse(evaluated, ignore_none, force_value, ignore_empty)
+
+
+def encode_dict(instance_dict, encoders, ignore_none, force_value, ignore_empty):
+    d = {}
+    for k, v in instance_dict.items():
+        r = encoders.get(k, encode_field)(v, ignore_none, force_value, ignore_empty)
+        if r is not SKIP:
+            d[k] = r
+    return d
+
+
+def _is_plain(type_) -> bool:
+    """`traverse` returns values of `type_` as they are"""
+    return not issubclass(
+        type_, (ValueTransformer, TOption, dict, list, Iterator, DictTransformer)
+    )
+
+
+def compile_encoder(type_, resolve=lambda t: t):
+    """Build an encode function for values of `type_` which behaves as same as `traverse`.
+
+    Each function checks the exact type of a value once and falls back to `traverse`
+    if the value doesn't match `type_`.
+
+    :param type_: Annotated type
+    :param resolve: Function which resolves str or ForwardRef types
+    :return: fn(value, ignore_none, force_value, ignore_empty)
+
+    Usage:
+
+        >>> from owlmixin.owlcollections import TList
+        >>> encode = compile_encoder(TList[TOption[int]])
+        >>> encode([TOption(1), TOption(None)], True, True, False)
+        [1]
+        >>> encode([TOption(1), TOption(None)], False, True, False)
+        [1, None]
+    """
+    # pylint: disable=too-many-return-statements
+    type_ = resolve(type_)
+
+    if not hasattr(type_, "__origin__"):
+        if not isinstance(type_, type):
+            return traverse
+
+        if _is_plain(type_):
+
+            def encode_plain(value, ignore_none, force_value, ignore_empty):
+                if type(value) is type_:
+                    return value
+                return traverse(value, ignore_none, force_value, ignore_empty)
+
+            return encode_plain
+
+        if issubclass(type_, ValueTransformer) and not issubclass(
+            type_, (TOption, dict, list, Iterator, DictTransformer)
+        ):
+
+            def encode_value(value, ignore_none, force_value, ignore_empty):
+                if isinstance(value, type_):
+                    return (
+                        value.to_value(ignore_none, force_value)
+                        if force_value
+                        else value
+                    )
+                return traverse(value, ignore_none, force_value, ignore_empty)
+
+            return encode_value
+
+        if issubclass(type_, DictTransformer) and not issubclass(
+            type_, (ValueTransformer, TOption, dict, list, Iterator)
+        ):
+
+            def encode_object(value, ignore_none, force_value, ignore_empty):
+                if type(value) is not type_:
+                    return traverse(value, ignore_none, force_value, ignore_empty)
+                return value.to_dict(
+                    ignore_none=ignore_none,
+                    force_value=force_value,
+                    ignore_empty=ignore_empty,
+                )
+
+            if type_.to_dict is not DictTransformer.to_dict:
+                return encode_object
+
+            def encode_dict_transformer(value, ignore_none, force_value, ignore_empty):
+                if type(value) is not type_:
+                    return traverse(value, ignore_none, force_value, ignore_empty)
+                # Skip calling `to_dict` because it is not overridden
+                return traverse_dict(
+                    value._dict, ignore_none, force_value, ignore_empty, value._encoders
+                )
+
+            return encode_dict_transformer
+
+        return traverse
+
+    o_type = type_.__origin__
+    if not isinstance(o_type, type):
+        return traverse
+
+    if o_type is TOption:
+        encode_item = compile_encoder(type_.__args__[0], resolve)
+
+        def encode_option(value, ignore_none, force_value, ignore_empty):
+            if type(value) is TOption:
+                return encode_item(value.value, ignore_none, force_value, ignore_empty)
+            return traverse(value, ignore_none, force_value, ignore_empty)
+
+        return encode_option
+
+    if issubclass(o_type, list) or issubclass(o_type, Iterator):
+        encode_item = compile_encoder(type_.__args__[0], resolve)
+
+        def encode_list(value, ignore_none, force_value, ignore_empty):
+            if type(value) is not list and type(value) is not o_type:
+                return traverse(value, ignore_none, force_value, ignore_empty)
+            return [
+                encode_item(x, ignore_none, force_value, ignore_empty)
+                for x in value
+                if not (
+                    ignore_none
+                    and (x is None or (isinstance(x, TOption) and x.value is None))
+                )
+            ]
+
+        return encode_list
+
+    if issubclass(o_type, dict):
+        encode_item_field = compile_field_encoder(type_.__args__[0], resolve)
+
+        def encode_dict_(value, ignore_none, force_value, ignore_empty):
+            if type(value) is not dict and type(value) is not o_type:
+                return traverse(value, ignore_none, force_value, ignore_empty)
+            d = {}
+            for k, v in value.items():
+                r = encode_item_field(v, ignore_none, force_value, ignore_empty)
+                if r is not SKIP:
+                    d[k] = r
+            return d
+
+        return encode_dict_
+
+    return traverse
+
+
+def compile_field_encoder(type_, resolve=lambda t: t):
+    """Build an encode function for properties of `type_` which behaves as same as `encode_field`.
+
+    :param type_: Annotated type
+    :param resolve: Function which resolves str or ForwardRef types
+    :return: fn(value, ignore_none, force_value, ignore_empty) which returns `SKIP` if excluded
+
+    Usage:
+
+        >>> encode = compile_field_encoder(TOption[str])
+        >>> encode(TOption("a"), True, True, False)
+        'a'
+        >>> encode(TOption(None), True, True, False) is SKIP
+        True
+        >>> encode(TOption(""), True, True, True) is SKIP
+        True
+    """
+    type_ = resolve(type_)
+    o_type = getattr(type_, "__origin__", None)
+
+    if o_type is TOption:
+        encode_item = compile_encoder(type_.__args__[0], resolve)
+
+        def encode_option_field(v, ignore_none, force_value, ignore_empty):
+            if type(v) is not TOption:
+                return encode_field(v, ignore_none, force_value, ignore_empty)
+            evaluated = v.value
+            if (ignore_empty and not bool(evaluated)) or (
+                ignore_none and is_ignore(evaluated)
+            ):
+                return SKIP
+            return encode_item(evaluated, ignore_none, force_value, ignore_empty)
+
+        return encode_option_field
+
+    if isinstance(o_type, type) and issubclass(o_type, Iterator):
+        # Iterator is evaluated as list
+        return encode_field
+
+    encode = compile_encoder(type_, resolve)
+    if encode is traverse:
+        return encode_field
+
+    def encode_known_field(v, ignore_none, force_value, ignore_empty):
+        if v is None:
+            return SKIP if ignore_none or ignore_empty else None
+        if isinstance(v, (TOption, Iterator)):
+            return encode_field(v, ignore_none, force_value, ignore_empty)
+        if ignore_empty and not bool(v):
+            return SKIP
+        return encode(v, ignore_none, force_value, ignore_empty)
+
+    return encode_known_field
+
+
+_INFINITY = float("inf")
+_MISSING = object()
+
+
+def _float_to_json(o: float) -> str:
+    if o != o:  # pylint: disable=comparison-with-itself
+        return "NaN"
+    if o == _INFINITY:
+        return "Infinity"
+    if o == -_INFINITY:
+        return "-Infinity"
+    return float.__repr__(o)
+
+
+def _key_to_json(k) -> str:
+    if isinstance(k, str):
+        return encode_basestring(k)
+    if isinstance(k, float):
+        return f'"{_float_to_json(k)}"'
+    if k is True:
+        return '"true"'
+    if k is False:
+        return '"false"'
+    if k is None:
+        return '"null"'
+    if isinstance(k, int):
+        return f'"{int.__repr__(k)}"'
+    raise TypeError(
+        f"keys must be str, int, float, bool or None, not {k.__class__.__name__}"
+    )
+
+
+def _join_json(brackets: str, parts: List[str], indent, level: int) -> str:
+    if not parts:
+        return brackets
+    if indent is None:
+        return f"{brackets[0]}{','.join(parts)}{brackets[1]}"
+    newline = "\n" + indent * (level + 1)
+    return f"{brackets[0]}{newline}{(',' + newline).join(parts)}\n{indent * level}{brackets[1]}"
+
+
+def _raw_to_json(o, indent, level: int) -> str:
+    """Same as `json.dumps` (The same order as `json.JSONEncoder`)"""
+    # pylint: disable=too-many-return-statements
+    if isinstance(o, str):
+        return encode_basestring(o)
+    if o is None:
+        return "null"
+    if o is True:
+        return "true"
+    if o is False:
+        return "false"
+    if isinstance(o, int):
+        return int.__repr__(o)
+    if isinstance(o, float):
+        return _float_to_json(o)
+    if isinstance(o, (list, tuple)):
+        return _join_json(
+            "[]", [_raw_to_json(x, indent, level + 1) for x in o], indent, level
+        )
+    if isinstance(o, dict):
+        return _join_json(
+            "{}",
+            [
+                f"{_key_to_json(k)}: {_raw_to_json(v, indent, level + 1)}"
+                for k, v in sorted(o.items())
+            ],
+            indent,
+            level,
+        )
+    raise TypeError(f"Object of type {o.__class__.__name__} is not JSON serializable")
+
+
+def _field_to_json(v, ignore_none, ignore_empty, indent, level: int):
+    """Same as `encode_field` for json, but returns `SKIP` if excluded"""
+    evaluated = evaluate(v)
+    if (ignore_empty and not bool(evaluated)) or (ignore_none and is_ignore(evaluated)):
+        return SKIP
+    return _value_to_json(evaluated, ignore_none, ignore_empty, indent, level)
+
+
+def _dict_to_json(
+    d: dict, writers, default, ignore_none, ignore_empty, indent, level: int
+):
+    items = []
+    for k, v in d.items():
+        r = writers.get(k, default)(v, ignore_none, ignore_empty, indent, level + 1)
+        if r is not SKIP:
+            items.append((k, r))
+    items.sort(key=itemgetter(0))
+    return _join_json(
+        "{}", [f"{_key_to_json(k)}: {r}" for k, r in items], indent, level
+    )
+
+
+def _object_to_json(o, ignore_none, ignore_empty, indent, level: int) -> str:
+    d = o._dict  # pylint: disable=protected-access
+    plan = o._json_writers  # pylint: disable=protected-access
+    if plan is None or d.keys() != plan.keys:
+        # Some keys are not sorted beforehand
+        return _dict_to_json(
+            d,
+            {} if plan is None else plan.writers,
+            _field_to_json,
+            ignore_none,
+            ignore_empty,
+            indent,
+            level,
+        )
+
+    parts = []
+    for k, key_json, write in plan.fields:
+        r = write(d[k], ignore_none, ignore_empty, indent, level + 1)
+        if r is not SKIP:
+            parts.append(key_json + r)
+    return _join_json("{}", parts, indent, level)
+
+
+def _value_to_json(o, ignore_none, ignore_empty, indent, level: int) -> str:
+    """Same as `json.dumps(traverse(o, ignore_none, True, ignore_empty))`"""
+    # pylint: disable=too-many-return-statements
+    # The same order as `traverse`
+    if isinstance(o, ValueTransformer):
+        return _raw_to_json(o.to_value(ignore_none, True), indent, level)
+    if isinstance(o, TOption):
+        return _value_to_json(o.get(), ignore_none, ignore_empty, indent, level)
+    if isinstance(o, dict):
+        return _dict_to_json(
+            o, {}, _field_to_json, ignore_none, ignore_empty, indent, level
+        )
+    if isinstance(o, (list, Iterator)):
+        return _join_json(
+            "[]",
+            [
+                _value_to_json(x, ignore_none, ignore_empty, indent, level + 1)
+                for x in o
+                if not (ignore_none and is_ignore(x))
+            ],
+            indent,
+            level,
+        )
+    if isinstance(o, DictTransformer):
+        if type(o).to_dict is DictTransformer.to_dict:
+            return _object_to_json(o, ignore_none, ignore_empty, indent, level)
+        return _raw_to_json(
+            o.to_dict(
+                ignore_none=ignore_none, force_value=True, ignore_empty=ignore_empty
+            ),
+            indent,
+            level,
+        )
+    return _raw_to_json(o, indent, level)
+
+
+_PRIMITIVE_TO_JSON = {
+    str: encode_basestring,
+    int: int.__repr__,
+    float: _float_to_json,
+    bool: lambda x: "true" if x else "false",
+}
+
+
+def compile_json_writer(type_, resolve=lambda t: t):
+    """Build a function which writes values of `type_` as json text as same as `traverse_to_json`.
+
+    :param type_: Annotated type
+    :param resolve: Function which resolves str or ForwardRef types
+    :return: fn(value, ignore_none, ignore_empty, indent, level)
+
+    Usage:
+
+        >>> from owlmixin.owlcollections import TList
+        >>> write = compile_json_writer(TList[TOption[str]])
+        >>> write([TOption("a"), TOption(None)], True, False, None, 0)
+        '["a"]'
+    """
+    # pylint: disable=too-many-return-statements
+    type_ = resolve(type_)
+
+    if not hasattr(type_, "__origin__"):
+        if not isinstance(type_, type):
+            return _value_to_json
+
+        to_json = _PRIMITIVE_TO_JSON.get(type_)
+        if to_json:
+
+            def write_primitive(value, ignore_none, ignore_empty, indent, level):
+                if type(value) is type_:
+                    return to_json(value)
+                return _value_to_json(value, ignore_none, ignore_empty, indent, level)
+
+            return write_primitive
+
+        if issubclass(type_, ValueTransformer) and not issubclass(
+            type_, (TOption, dict, list, Iterator, DictTransformer)
+        ):
+
+            def write_value(value, ignore_none, ignore_empty, indent, level):
+                if isinstance(value, type_):
+                    return _raw_to_json(
+                        value.to_value(ignore_none, True), indent, level
+                    )
+                return _value_to_json(value, ignore_none, ignore_empty, indent, level)
+
+            return write_value
+
+        if (
+            issubclass(type_, DictTransformer)
+            and not issubclass(type_, (ValueTransformer, TOption, dict, list, Iterator))
+            and type_.to_dict is DictTransformer.to_dict
+        ):
+
+            def write_object(value, ignore_none, ignore_empty, indent, level):
+                if type(value) is type_:
+                    return _object_to_json(
+                        value, ignore_none, ignore_empty, indent, level
+                    )
+                return _value_to_json(value, ignore_none, ignore_empty, indent, level)
+
+            return write_object
+
+        return _value_to_json
+
+    o_type = type_.__origin__
+    if not isinstance(o_type, type):
+        return _value_to_json
+
+    if o_type is TOption:
+        write_item = compile_json_writer(type_.__args__[0], resolve)
+
+        def write_option(value, ignore_none, ignore_empty, indent, level):
+            if type(value) is TOption:
+                return write_item(value.value, ignore_none, ignore_empty, indent, level)
+            return _value_to_json(value, ignore_none, ignore_empty, indent, level)
+
+        return write_option
+
+    if issubclass(o_type, list) or issubclass(o_type, Iterator):
+        write_item = compile_json_writer(type_.__args__[0], resolve)
+
+        def write_list(value, ignore_none, ignore_empty, indent, level):
+            if type(value) is not list and type(value) is not o_type:
+                return _value_to_json(value, ignore_none, ignore_empty, indent, level)
+            return _join_json(
+                "[]",
+                [
+                    write_item(x, ignore_none, ignore_empty, indent, level + 1)
+                    for x in value
+                    if not (
+                        ignore_none
+                        and (x is None or (isinstance(x, TOption) and x.value is None))
+                    )
+                ],
+                indent,
+                level,
+            )
+
+        return write_list
+
+    if issubclass(o_type, dict):
+        write_item_field = compile_json_field_writer(type_.__args__[0], resolve)
+
+        def write_dict(value, ignore_none, ignore_empty, indent, level):
+            if type(value) is not dict and type(value) is not o_type:
+                return _value_to_json(value, ignore_none, ignore_empty, indent, level)
+            return _dict_to_json(
+                value,
+                {},
+                write_item_field,
+                ignore_none,
+                ignore_empty,
+                indent,
+                level,
+            )
+
+        return write_dict
+
+    return _value_to_json
+
+
+def compile_json_field_writer(type_, resolve=lambda t: t):
+    """Build a function which writes properties of `type_` as json text.
+
+    It behaves as same as `compile_field_encoder` and `json.dumps`.
+
+    :param type_: Annotated type
+    :param resolve: Function which resolves str or ForwardRef types
+    :return: fn(value, ignore_none, ignore_empty, indent, level) which returns `SKIP` if excluded
+
+    Usage:
+
+        >>> write = compile_json_field_writer(TOption[int])
+        >>> write(TOption(1), True, False, None, 0)
+        '1'
+        >>> write(TOption(None), True, False, None, 0) is SKIP
+        True
+    """
+    type_ = resolve(type_)
+    o_type = getattr(type_, "__origin__", None)
+
+    if o_type is TOption:
+        write_item = compile_json_writer(type_.__args__[0], resolve)
+
+        def write_option_field(v, ignore_none, ignore_empty, indent, level):
+            if type(v) is not TOption:
+                return _field_to_json(v, ignore_none, ignore_empty, indent, level)
+            evaluated = v.value
+            if (ignore_empty and not bool(evaluated)) or (
+                ignore_none and is_ignore(evaluated)
+            ):
+                return SKIP
+            return write_item(evaluated, ignore_none, ignore_empty, indent, level)
+
+        return write_option_field
+
+    if isinstance(o_type, type) and issubclass(o_type, Iterator):
+        # Iterator is evaluated as list
+        return _field_to_json
+
+    write = compile_json_writer(type_, resolve)
+    if write is _value_to_json:
+        return _field_to_json
+
+    def write_known_field(v, ignore_none, ignore_empty, indent, level):
+        if v is None:
+            return SKIP if ignore_none or ignore_empty else "null"
+        if isinstance(v, (TOption, Iterator)):
+            return _field_to_json(v, ignore_none, ignore_empty, indent, level)
+        if ignore_empty and not bool(v):
+            return SKIP
+        return write(v, ignore_none, ignore_empty, indent, level)
+
+    return write_known_field
+
+
+class JsonWriterPlan(NamedTuple):
+    """How to write properties of a class as json text
+
+    :ivar fields: (property name, json of the key with separator, writer) sorted by name
+    :ivar keys: Property names
+    :ivar writers: Writers by property name
+    """
+
+    fields: Tuple[Tuple[str, str, Callable], ...]
+    keys: FrozenSet[str]
+    writers: Dict[str, Callable]
+
+
+def build_json_writer_plan(writers: Dict[str, Callable]) -> JsonWriterPlan:
+    """
+    :param writers: Writers built by `compile_json_field_writer` by property name
+    :return: Json writer plan
+    """
+    return JsonWriterPlan(
+        fields=tuple(
+            (k, f"{encode_basestring(k)}: ", writers[k]) for k in sorted(writers)
+        ),
+        keys=frozenset(writers),
+        writers=writers,
+    )
+
+
+def _backend_dumps() -> Optional[Callable[[Any, Optional[int]], str]]:
+    """`dumps` of the default json backend, or None if it is the one of stdlib (json text is written directly)"""
+    dumps = util.get_json_backend().dumps
+    return None if dumps is util.get_json_backend("stdlib").dumps else dumps
+
+
+def traverse_to_json(
+    value, indent: Optional[int] = None, ignore_none=True, ignore_empty=False
+) -> str:
+    """Same as `util.dump_json(traverse(value, ignore_none, True, ignore_empty), indent)`
+
+    Json text is written directly without building an intermediate dict tree.
+    Properties of OwlMixin are written in the order sorted beforehand per class.
+    If the default json backend (`util.use_json_backend`) has its own `dumps`, it is used instead.
+
+    :param value: Value to dump
+    :param indent: Number of indentation
+    :param ignore_none: Properties which is None are excluded if True
+    :param ignore_empty: Properties which is empty are excluded if True
+    :return: Json string
+
+    Usage:
+
+        >>> traverse_to_json({"b": TOption(None), "a": [1, TOption(2.5)]})
+        '{"a": [1,2.5]}'
+        >>> print(traverse_to_json({"b": TOption(None), "a": [1]}, 2, ignore_none=False))
+        {
+          "a": [
+            1
+          ],
+          "b": null
+        }
+    """
+    dumps = _backend_dumps()
+    if dumps is not None:
+        return dumps(traverse(value, ignore_none, True, ignore_empty), indent)
+
+    if indent is not None and not isinstance(indent, str):
+        indent = " " * indent  # type: ignore
+    return _value_to_json(value, ignore_none, ignore_empty, indent, 0)
+
+
+def iter_json_chunks(
+    value, indent: Optional[int] = None, ignore_none=True, ignore_empty=False
+) -> Iterator[str]:
+    """Same as `traverse_to_json`, but yields json text of a list or an Iterator element by element.
+
+    Only one element is encoded at a time, so an Iterator is never materialized.
+    Other values are yielded as a whole.
+
+    :param value: Value to dump
+    :param indent: Number of indentation
+    :param ignore_none: Properties which is None are excluded if True
+    :param ignore_empty: Properties which is empty are excluded if True
+    :return: Iterator of json text
+
+    Usage:
+
+        >>> list(iter_json_chunks(iter([{"a": 1}, None, TOption(2)])))
+        ['[{"a": 1}', ',2', ']']
+        >>> "".join(iter_json_chunks(iter([{"a": 1}, 2]), 2)) == traverse_to_json([{"a": 1}, 2], 2)
+        True
+        >>> list(iter_json_chunks(iter([])))
+        ['[]']
+    """
+    dumps = _backend_dumps()
+    indent_text = indent
+    if indent is not None and not isinstance(indent, str):
+        indent_text = " " * indent  # type: ignore
+    # The same order as `_value_to_json`
+    if isinstance(value, (ValueTransformer, TOption, dict)) or not isinstance(
+        value, (list, Iterator)
+    ):
+        yield traverse_to_json(value, indent, ignore_none, ignore_empty)
+        return
+
+    newline = "" if indent_text is None else f"\n{indent_text}"
+    delimiter = "["
+    for x in value:
+        if not (ignore_none and is_ignore(x)):
+            if dumps is None:
+                text = _value_to_json(x, ignore_none, ignore_empty, indent_text, 1)
+            else:
+                # Newlines of json text are only between tokens, so it is nested by indenting all lines
+                text = dumps(
+                    traverse(x, ignore_none, True, ignore_empty), indent
+                ).replace("\n", newline)
+            yield f"{delimiter}{newline}{text}"
+            delimiter = ","
+    if delimiter == "[":
+        yield "[]"
+    else:
+        yield "]" if indent_text is None else "\n]"
+
+
 class DictTransformer:
     """`@property _dict` can overridden"""
 
+    __slots__ = ()
+
     @property
     def _dict(self):
         return self.__dict__
 
+    @property
+    def _encoders(self) -> Optional[dict]:
+        """Encode functions by property name used by `to_dict`"""
+        return None
+
+    @property
+    def _json_writers(self) -> Optional[JsonWriterPlan]:
+        """Json writers of properties used by `to_json`"""
+        return None
+
     def str_format(self, format_: str) -> str:
         """From instance to str with formatting
 
@@ -108,12 +901,14 @@ class DictTransformer:
         ignore_none: bool = True,
         force_value: bool = True,
         ignore_empty: bool = False,
+        iterative: bool = False,
     ) -> dict:
         """From instance to dict
 
         :param ignore_none: Properties which is None are excluded if True
         :param force_value: Transform to value using to_value (default: str()) of ValueTransformer which inherited if True
         :param ignore_empty: Properties which is empty are excluded if True
+        :param iterative: Traverse with an explicit stack instead of recursion for deeply nested data if True
         :return: Dict
 
         Usage:
@@ -155,12 +950,20 @@ class DictTransformer:
             False
 
         """
-        return traverse_dict(self._dict, ignore_none, force_value, ignore_empty)
+        if iterative:
+            return traverse_iteratively(
+                self._dict, ignore_none, force_value, ignore_empty
+            )
+        return traverse_dict(
+            self._dict, ignore_none, force_value, ignore_empty, self._encoders
+        )
 
 
 class DictsTransformer:
     """`@property _dict` can overridden"""
 
+    __slots__ = ()
+
     def to_dicts(
         self,
         *,
@@ -230,6 +1033,8 @@ class DictsTransformer:
 class JsonTransformer:
     """`@property _dict` can overridden"""
 
+    __slots__ = ()
+
     def to_json(
         self,
         *,
@@ -239,6 +1044,10 @@ class JsonTransformer:
     ) -> str:
         """From instance to json string
 
+        There is no iterative path, so an instance nested deeper than about 200 levels raises `RecursionError`
+        (the json encoder itself also has a nesting limit). Use `to_dict(iterative=True)` for such instances.
+        `dumps` of the default json backend (`util.use_json_backend`) is used if it isn't stdlib.
+
         :param indent: Number of indentation
         :param ignore_none: Properties which is None are excluded if True
         :param ignore_empty: Properties which is empty are excluded if True
@@ -258,9 +1067,8 @@ class JsonTransformer:
             >>> human.to_json()
             '{"favorites": [{"name": "Apple","names_by_lang": {"de": "Apfel","en": "Apple"}},{"name": "Orange"}],"id": 1,"name": "Tom"}'
         """
-        return util.dump_json(
-            traverse(self, ignore_none, force_value=True, ignore_empty=ignore_empty),
-            indent,
+        return traverse_to_json(
+            self, indent, ignore_none=ignore_none, ignore_empty=ignore_empty
         )
 
     def to_jsonf(
@@ -271,20 +1079,33 @@ class JsonTransformer:
         indent: int = None,
         ignore_none: bool = True,
         ignore_empty: bool = False,
+        compression: Optional[str] = "infer",
     ) -> str:
         """From instance to json file
 
+        There is no iterative path for deeply nested instances (see `to_json`).
+
         :param fpath: Json file path
         :param encoding: Json file encoding
         :param indent: Number of indentation
         :param ignore_none: Properties which is None are excluded if True
         :param ignore_empty: Properties which is empty are excluded if True
+        :param compression: "gzip", "bz2", "xz" or None. It is inferred from the extension of fpath if "infer"
         :return: Json file path
         """
+        if isinstance(self, DictsTransformer):
+            # Elements of TList and TIterator are written one by one
+            return util.dump_json_chunksf(
+                iter_json_chunks(self, indent, ignore_none, ignore_empty),
+                fpath=fpath,
+                encoding=encoding,
+                compression=compression,
+            )
         return util.dump_jsonf(
             traverse(self, ignore_none, force_value=True, ignore_empty=ignore_empty),
             fpath=fpath,
             encoding=encoding,
+            compression=compression,
             indent=indent,
         )
 
@@ -331,14 +1152,95 @@ class JsonTransformer:
         )
 
 
+class JsonLinesTransformer:
+    """For sequences of instances"""
+
+    __slots__ = ()
+
+    def _iter_json_lines(self, ignore_none: bool, ignore_empty: bool) -> Iterator[str]:
+        for x in self:  # type: ignore
+            if not (ignore_none and is_ignore(x)):
+                yield traverse_to_json(
+                    x, ignore_none=ignore_none, ignore_empty=ignore_empty
+                )
+
+    def to_jsonl(self, *, ignore_none: bool = True, ignore_empty: bool = False) -> str:
+        """From sequence of instances to json lines (one record per line)
+
+        :param ignore_none: Properties which is None are excluded if True
+        :param ignore_empty: Properties which is empty are excluded if True
+        :return: Json lines string
+
+        Usage:
+
+            >>> from owlmixin.samples import Human
+            >>> humans = Human.from_dicts([
+            ...     {"id": 1, "name": "Tom", "favorites": [{"name": "Apple"}]},
+            ...     {"id": 2, "name": "John", "favorites": []}
+            ... ])
+            >>> print(humans.to_jsonl(ignore_empty=True))
+            {"favorites": [{"name": "Apple"}],"id": 1,"name": "Tom"}
+            {"id": 2,"name": "John"}
+            <BLANKLINE>
+        """
+        return "".join(
+            f"{x}\n" for x in self._iter_json_lines(ignore_none, ignore_empty)
+        )
+
+    def to_jsonlf(
+        self,
+        fpath: str,
+        encoding: str = "utf8",
+        *,
+        ignore_none: bool = True,
+        ignore_empty: bool = False,
+        compression: Optional[str] = "infer",
+    ) -> str:
+        """From sequence of instances to json lines file.
+        Records are written one by one, so TIterator is never loaded on memory at once.
+
+        :param fpath: Json lines file path
+        :param encoding: Json lines file encoding
+        :param ignore_none: Properties which is None are excluded if True
+        :param ignore_empty: Properties which is empty are excluded if True
+        :param compression: "gzip", "bz2", "xz" or None. It is inferred from the extension of fpath if "infer"
+        :return: Json lines file path
+        """
+        with util.open_textf(
+            fpath, "w", encoding, compression=compression, newline="\n"
+        ) as f:
+            for line in self._iter_json_lines(ignore_none, ignore_empty):
+                f.write(line)
+                f.write("\n")
+        return fpath
+
+
 class YamlTransformer:
     """`@property _dict` can overridden"""
 
-    def to_yaml(self, *, ignore_none: bool = True, ignore_empty: bool = False) -> str:
+    __slots__ = ()
+
+    def _yaml_documents(self, ignore_none: bool, ignore_empty: bool) -> Iterator:
+        if not isinstance(self, DictsTransformer):
+            raise ValueError("multi_document is only for TList and TIterator")
+        return (
+            traverse(x, ignore_none, force_value=True, ignore_empty=ignore_empty)
+            for x in self  # type: ignore
+            if not is_ignore(x)
+        )
+
+    def to_yaml(
+        self,
+        *,
+        ignore_none: bool = True,
+        ignore_empty: bool = False,
+        multi_document: bool = False,
+    ) -> str:
         """From instance to yaml string
 
         :param ignore_none: Properties which is None are excluded if True
         :param ignore_empty: Properties which is empty are excluded if True
+        :param multi_document: Write each element as a `---` separated document if True (only TList and TIterator)
         :return: Yaml string
 
         Usage:
@@ -362,7 +1264,18 @@ class YamlTransformer:
             id: 1
             name: Tom
             <BLANKLINE>
+
+            >>> print(Human.from_dicts([{"id": 1, "name": "Tom", "favorites": []}]).to_yaml(multi_document=True))
+            ---
+            favorites: []
+            id: 1
+            name: Tom
+            <BLANKLINE>
         """
+        if multi_document:
+            return util.dump_yaml_documents(
+                self._yaml_documents(ignore_none, ignore_empty)
+            )
         return util.dump_yaml(
             traverse(self, ignore_none, force_value=True, ignore_empty=ignore_empty)
         )
@@ -374,6 +1287,8 @@ class YamlTransformer:
         *,
         ignore_none: bool = True,
         ignore_empty: bool = False,
+        multi_document: bool = False,
+        compression: Optional[str] = "infer",
     ) -> str:
         """From instance to yaml file
 
@@ -381,18 +1296,86 @@ class YamlTransformer:
         :param encoding: Yaml file encoding
         :param ignore_none: Properties which is None are excluded if True
         :param ignore_empty: Properties which is empty are excluded if True
+        :param multi_document: Write each element as a `---` separated document one by one if True
+                               (only TList and TIterator)
+        :param compression: "gzip", "bz2", "xz" or None. It is inferred from the extension of fpath if "infer"
         :return: Yaml file path
         """
+        if multi_document:
+            return util.dump_yaml_documentsf(
+                self._yaml_documents(ignore_none, ignore_empty),
+                fpath=fpath,
+                encoding=encoding,
+                compression=compression,
+            )
         return util.dump_yamlf(
             traverse(self, ignore_none, force_value=True, ignore_empty=ignore_empty),
             fpath=fpath,
             encoding=encoding,
+            compression=compression,
         )
 
 
+class SnapshotTransformer:
+    """Instances are pickled as they are (`@property _dict` is not used)"""
+
+    __slots__ = ()
+
+    def to_snapshot(self, fpath: str, *, compression: Optional[str] = "infer") -> str:
+        """From instance to snapshot file which can be loaded without decoding and validating again
+
+        Fingerprints of classes are written in the header so that `from_snapshot` rejects stale snapshots.
+
+        :param fpath: Snapshot file path
+        :param compression: "gzip", "bz2", "xz" or None. It is inferred from the extension of fpath if "infer"
+        :return: Snapshot file path
+        """
+        return util.dump_snapshotf(self, fpath=fpath, compression=compression)
+
+    @classmethod
+    def from_snapshot(cls, fpath: str, *, compression: Optional[str] = "infer"):
+        """From snapshot file written by `to_snapshot` to instance
+
+        Snapshots are pickles, so load only the ones you wrote by yourself.
+
+        :param fpath: Snapshot file path
+        :param compression: "gzip", "bz2", "xz" or None. It is inferred from the extension of fpath if "infer"
+        :return: Instance
+        :raises ValueError: If fpath is not a snapshot of this class, or a class was changed after it was written
+
+        Usage:
+
+            >>> import os, tempfile
+            >>> from owlmixin import TList
+            >>> from owlmixin.samples import Human
+            >>> human = Human.from_dict({
+            ...     "id": 1,
+            ...     "name": "Tom",
+            ...     "favorites": [
+            ...         {"name": "Apple", "names_by_lang": {"en": "Apple", "de": "Apfel"}},
+            ...         {"name": "Orange"}
+            ...     ]
+            ... })
+            >>> fpath = human.to_snapshot(os.path.join(tempfile.mkdtemp(), "human.snapshot"))
+            >>> Human.from_snapshot(fpath).to_dict() == human.to_dict()
+            True
+            >>> TList.from_snapshot(fpath)  # doctest: +ELLIPSIS
+            Traceback (most recent call last):
+                ...
+            ValueError: ...human.snapshot is a snapshot of Human, not TList
+        """
+        return util.load_snapshotf(fpath, cls, compression=compression)
+
+
 class CsvTransformer:
     """`@property _dict` can overridden"""
 
+    __slots__ = ()
+
+    def _csv_rows(self) -> Iterator[dict]:
+        """Same as elements of `traverse(self, force_value=True)`, but converted one by one"""
+        return (traverse(x, force_value=True) for x in self if not is_ignore(x))  # type: ignore
+
     def to_csv(
         self,
         fieldnames: Sequence[str],
@@ -429,11 +1412,49 @@ class CsvTransformer:
             <BLANKLINE>
         """
         return util.dump_csv(
-            traverse(self, force_value=True),
+            self._csv_rows(),
+            fieldnames=fieldnames,
+            with_header=with_header,
+            crlf=crlf,
+            tsv=tsv,
+        )
+
+    def to_csv_chunks(
+        self,
+        fieldnames: Sequence[str],
+        *,
+        with_header: bool = False,
+        crlf: bool = False,
+        tsv: bool = False,
+        chunk_rows: int = 1000,
+    ) -> Iterator[str]:
+        """From sequence of text to csv string chunks (generator form of `to_csv`).
+        Rows are converted lazily, so TIterator is never loaded on memory at once.
+
+        :param fieldnames: Order of columns by property name
+        :param with_header: Add headers at the first line if True
+        :param crlf: Add CRLF line break at the end of line if True, else add LF
+        :param tsv: Use tabs as separator if True, else use comma
+        :param chunk_rows: Number of rows in a chunk
+        :return: Iterator of csv string chunks
+
+        Usage:
+
+            >>> from owlmixin.samples import Human
+            >>> humans = Human.from_iterable_dicts([
+            ...     {"id": 1, "name": "Tom", "favorites": [{"name": "Apple"}]},
+            ...     {"id": 2, "name": "John", "favorites": [{"name": "Orange"}]}
+            ... ])
+            >>> list(humans.to_csv_chunks(fieldnames=['name', 'id'], with_header=True, chunk_rows=2))
+            ['name,id\\nTom,1\\n', 'John,2\\n']
+        """
+        return util.iter_csv(
+            self._csv_rows(),
             fieldnames=fieldnames,
             with_header=with_header,
             crlf=crlf,
             tsv=tsv,
+            chunk_rows=chunk_rows,
         )
 
     def to_csvf(
@@ -445,8 +1466,9 @@ class CsvTransformer:
         with_header: bool = False,
         crlf: bool = False,
         tsv: bool = False,
+        compression: Optional[str] = "infer",
     ) -> str:
-        """From instance to yaml file
+        """From instance to csv file (rows are converted and written one by one)
 
         :param fpath: Csv file path
         :param fieldnames: Order of columns by property name
@@ -454,13 +1476,15 @@ class CsvTransformer:
         :param with_header: Add headers at the first line if True
         :param crlf: Add CRLF line break at the end of line if True, else add LF
         :param tsv: Use tabs as separator if True, else use comma
+        :param compression: "gzip", "bz2", "xz" or None. It is inferred from the extension of fpath if "infer"
         :return: Csv file path
         """
         return util.dump_csvf(
-            traverse(self, force_value=True),
+            self._csv_rows(),
             fieldnames,
             fpath=fpath,
             encoding=encoding,
+            compression=compression,
             with_header=with_header,
             crlf=crlf,
             tsv=tsv,
@@ -470,6 +1494,8 @@ class CsvTransformer:
 class TableTransformer:
     """`@property _dict` can overridden"""
 
+    __slots__ = ()
+
     def to_table(self, fieldnames: Sequence[str]) -> str:
         """From sequence of text to csv string
 
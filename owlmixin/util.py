@@ -3,13 +3,36 @@
 # The location of `import yaml` is not optimized!!
 # pylint: disable=wrong-import-order,duplicate-code
 
+import bz2
 import codecs
 import csv
+import functools
+import gzip
+import hashlib
 import io
+import itertools
 import json
+import lzma
+import os
+import pickle
 import re
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Executor, wait
 from math import ceil, floor
-from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 from unicodedata import east_asian_width
 from urllib.request import urlopen
 
@@ -76,22 +99,94 @@ def construct_yaml_str(self, node):
 
 yaml.SafeLoader.add_constructor("tag:yaml.org,2002:str", construct_yaml_str)
 
+# Parser used by `load_yaml` and `load_yamlf` ("libyaml" if PyYAML is built with it)
+try:
+    from yaml import CSafeLoader as _BaseLoader
+
+    YAML_LOADER_BACKEND = "libyaml"
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _BaseLoader  # type: ignore
+
+    YAML_LOADER_BACKEND = "python"
+
+# Emitter used by `dump_yaml` and `dump_yamlf`.
+# libyaml always writes sequences in mappings indentless, so `MyDumper` can't use CSafeDumper
+YAML_DUMPER_BACKEND = "python"
+
+
+class MyLoader(_BaseLoader):  # type: ignore
+    """Same as `yaml.SafeLoader`, but uses libyaml if available"""
+
+    # pylint: disable=too-many-ancestors
+
+
+MyLoader.add_constructor("tag:yaml.org,2002:str", construct_yaml_str)
+
+
+_MAX_SHAPES = 1024
+_replaced_keys_by_shape: Dict[tuple, Optional[tuple]] = {}
+# (keymap, tuple of its items) used last, to avoid building the tuple for the same keymap
+_last_keymap: Tuple[dict, tuple] = ({}, ())
+
 
 def replace_keys(d, keymap, force_snake_case):
-    """
+    """Replaced keys are cached by the keys of `d` (shape).
+    `d` itself is returned if no keys are replaced, so don't modify the result.
+
     :param dict d:
     :param Dict[unicode, unicode] keymap:
     :param bool force_snake_case:
     :rtype: Dict[unicode, unicode]
     """
-    return {
-        to_snake(keymap.get(k, k)) if force_snake_case else keymap.get(k, k): v
-        for k, v in d.items()
-    }
+    replaced_keys = replace_keys_of_shape(tuple(d.keys()), keymap, force_snake_case)
+    if replaced_keys is None:
+        return d
+    return dict(zip(replaced_keys, d.values()))
+
+
+def replace_keys_of_shape(keys, keymap, force_snake_case):
+    """Same as `replace_keys`, but for keys of a dict (results are cached)
+
+    :param Tuple[unicode, ...] keys:
+    :param Dict[unicode, unicode] keymap:
+    :param bool force_snake_case:
+    :rtype: Optional[Tuple[unicode, ...]]
+    :return: Replaced keys, or None if no keys are replaced
+
+    Usage:
+
+        >>> replace_keys_of_shape(("id", "self", "camelCase"), {"self": "_self"}, True)
+        ('id', '_self', 'camel_case')
+        >>> replace_keys_of_shape(("id", "snake_case"), {"self": "_self"}, True) is None
+        True
+    """
+    global _last_keymap  # pylint: disable=global-statement
+
+    last_keymap, keymap_items = _last_keymap
+    if keymap != last_keymap:
+        keymap_items = tuple(keymap.items())
+        _last_keymap = (dict(keymap), keymap_items)
+    shape = (keys, force_snake_case, keymap_items)
+    try:
+        return _replaced_keys_by_shape[shape]
+    except KeyError:
+        pass
+
+    replaced_keys: Optional[tuple] = tuple(
+        to_snake(keymap.get(k, k)) if force_snake_case else keymap.get(k, k)
+        for k in keys
+    )
+    if replaced_keys == keys:
+        replaced_keys = None
+    if len(_replaced_keys_by_shape) >= _MAX_SHAPES:
+        _replaced_keys_by_shape.clear()
+    _replaced_keys_by_shape[shape] = replaced_keys
+    return replaced_keys
 
 
+@functools.lru_cache(maxsize=4096)
 def to_snake(value):
-    """For key of dictionary
+    """For key of dictionary (results are cached)
 
     :param unicode value:
     :rtype: unicode
@@ -101,22 +196,541 @@ def to_snake(value):
     )
 
 
-def load_json(json_str):
+def _stdlib_dumps(data, indent):
+    return json.dumps(
+        data, indent=indent, ensure_ascii=False, sort_keys=True, separators=(",", ": ")
+    )
+
+
+class JsonBackend(NamedTuple):
+    """Functions used by `load_json` and `dump_json`
+
+    :ivar name: Registered name
+    :ivar loads: fn(str | bytes) -> dict | list
+    :ivar dumps: fn(data, indent) -> str (must return the same text as the stdlib backend)
+    """
+
+    name: str
+    loads: Callable[[Union[str, bytes]], Any]
+    dumps: Callable[[Any, Optional[int]], str]
+
+
+_json_backends: Dict[str, JsonBackend] = {
+    "stdlib": JsonBackend(name="stdlib", loads=json.loads, dumps=_stdlib_dumps)
+}
+_default_json_backend = "stdlib"
+
+
+def register_json_backend(
+    name: str,
+    *,
+    loads: Optional[Callable[[Union[str, bytes]], Any]] = None,
+    dumps: Optional[Callable[[Any, Optional[int]], str]] = None,
+) -> JsonBackend:
+    """Register a json backend which can be selected by `name`
+
+    :param name: Backend name
+    :param loads: fn(str | bytes) -> dict | list (stdlib `json.loads` if None)
+    :param dumps: fn(data, indent) -> str (stdlib if None).
+                  It must return the same text as the stdlib backend (sorted keys, `,` and `: ` separators)
+    :return: Registered backend
+
+    Usage:
+
+        >>> backend = register_json_backend("doc", loads=lambda s: {"loaded_by": "doc"})
+        >>> load_json('{"a": 1}', backend="doc")
+        {'loaded_by': 'doc'}
+        >>> dump_json({"b": 1, "a": [1, 2]}, backend="doc")
+        '{"a": [1,2],"b": 1}'
+    """
+    backend = JsonBackend(
+        name=name, loads=loads or json.loads, dumps=dumps or _stdlib_dumps
+    )
+    _json_backends[name] = backend
+    return backend
+
+
+def get_json_backend(name: Optional[str] = None) -> JsonBackend:
+    """
+    :param name: Backend name (default backend if None)
+    :return: Backend
+
+    Usage:
+
+        >>> get_json_backend("stdlib").name
+        'stdlib'
+        >>> get_json_backend("unknown")
+        Traceback (most recent call last):
+            ...
+        ValueError: Unknown json backend: unknown (available: ...)
+    """
+    key = _default_json_backend if name is None else name
+    try:
+        return _json_backends[key]
+    except KeyError:
+        raise ValueError(
+            f"Unknown json backend: {key} (available: {', '.join(_json_backends)})"
+        ) from None
+
+
+def use_json_backend(name: str) -> str:
+    """Select the default json backend globally.
+
+    `orjson` is registered automatically if installed.
+    It is faster than `stdlib` but parses integers out of 64 bits as float.
+
+    :param name: Backend name
+    :return: Previous default backend name
+    """
+    global _default_json_backend  # pylint: disable=global-statement
+
+    get_json_backend(name)
+    previous, _default_json_backend = _default_json_backend, name
+    return previous
+
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
+
+if orjson is not None:
+
+    def _orjson_loads(json_str):
+        try:
+            return orjson.loads(json_str)
+        except orjson.JSONDecodeError:
+            # NaN, Infinity, lone surrogates and so on are accepted only by stdlib
+            return json.loads(json_str)
+
+    # orjson can't write the separators of `dump_json`, so only parsing is swapped
+    # Integers out of 64 bits are parsed as float, so it is not selected by default
+    register_json_backend("orjson", loads=_orjson_loads)
+
+
+# Openers of compressed files by `compression`
+_compression_openers: Dict[str, Callable] = {
+    "gzip": gzip.open,
+    "bz2": bz2.open,
+    "xz": lzma.open,
+}
+_compression_by_extension = {".gz": "gzip", ".bz2": "bz2", ".xz": "xz", ".lzma": "xz"}
+
+
+def infer_compression(fpath: str) -> Optional[str]:
+    """
+    :param fpath:
+    :return: "gzip", "bz2", "xz" or None (not compressed)
+
+    Usage:
+
+        >>> infer_compression("archives/2020.json.gz")
+        'gzip'
+        >>> infer_compression("archives/2020.yaml.XZ")
+        'xz'
+        >>> infer_compression("archives/2020.csv") is None
+        True
+    """
+    return _compression_by_extension.get(os.path.splitext(fpath)[1].lower())
+
+
+def open_textf(
+    fpath: str,
+    mode: str,
+    encoding: str,
+    *,
+    compression: Optional[str] = "infer",
+    newline: Optional[str] = None,
+):
+    """Open a (compressed) file in text mode. Compressed files are (de)compressed while streaming.
+
+    :param fpath:
+    :param mode: "r" or "w"
+    :param encoding:
+    :param compression: "gzip", "bz2", "xz" or None. It is inferred from the extension of fpath if "infer"
+    :param newline: Same as `open`
+    :return: Text file object
+
+    Usage:
+
+        >>> import tempfile
+        >>> fpath = os.path.join(tempfile.mkdtemp(), "sample.txt.gz")
+        >>> with open_textf(fpath, "w", "utf8") as f:
+        ...     _ = f.write("あいう")
+        >>> with gzip.open(fpath, "rt", encoding="utf8") as f:
+        ...     f.read()
+        'あいう'
+        >>> open_textf(fpath, "r", "utf8", compression="zip")
+        Traceback (most recent call last):
+            ...
+        ValueError: Unknown compression: zip (supported: gzip, bz2, xz)
+    """
+    opener = _get_opener(fpath, compression)
+    return opener(fpath, mode + "t", encoding=encoding, newline=newline)
+
+
+def read_bytesf(fpath: str, *, compression: Optional[str] = "infer") -> bytes:
+    """Read a whole (compressed) file at once without decoding
+
+    :param fpath:
+    :param compression: "gzip", "bz2", "xz" or None. It is inferred from the extension of fpath if "infer"
+    :return: (Decompressed) contents
+    """
+    with _get_opener(fpath, compression)(fpath, "rb") as f:
+        return f.read()
+
+
+def _get_opener(fpath, compression):
+    if compression == "infer":
+        compression = infer_compression(fpath)
+    if compression is None:
+        return open
+
+    opener = _compression_openers.get(compression)
+    if opener is None:
+        raise ValueError(
+            f"Unknown compression: {compression} (supported: {', '.join(_compression_openers)})"
+        )
+    return opener
+
+
+def _decode_unless_utf8(data: bytes, encoding: Optional[str]):
+    """Parsers (json, orjson and libyaml) decode UTF-8 bytes by themselves faster than text mode files"""
+    if encoding is None or codecs.lookup(encoding).name == "utf-8":
+        return data
+    return data.decode(encoding)
+
+
+class FileCache:
+    """LRU cache of objects loaded from files.
+
+    An object is loaded again if mtime or size of the file is changed since it was cached.
+    `max_bytes` limits the total size of cached files (not of the objects loaded from them).
+    Cached objects are shared by callers, so don't mutate them.
+
+    Usage:
+
+        >>> import tempfile
+        >>> fpath = os.path.join(tempfile.mkdtemp(), "config.txt")
+        >>> with open(fpath, "w") as f:
+        ...     _ = f.write("v1")
+        >>> def load():
+        ...     print("loaded")
+        ...     with open(fpath) as f:
+        ...         return f.read()
+        >>> cache = FileCache(max_entries=2)
+        >>> cache.get_or_load(("text",), fpath, load)
+        loaded
+        'v1'
+        >>> cache.get_or_load(("text",), fpath, load)
+        'v1'
+        >>> with open(fpath, "w") as f:
+        ...     _ = f.write("v2!")
+        >>> cache.get_or_load(("text",), fpath, load)
+        loaded
+        'v2!'
+        >>> len(cache), cache.nbytes
+        (1, 3)
+    """
+
+    def __init__(self, max_entries: int = 128, max_bytes: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[tuple, Tuple[int, int, Any]]" = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of cached files"""
+        return self._nbytes
+
+    def get_or_load(self, key: tuple, fpath: str, load: Callable[[], Any]) -> Any:
+        """
+        :param key: Options which change the loaded object (ex. class, encoding)
+        :param fpath: File path
+        :param load: Function which loads an object from fpath
+        :return: The cached object if fpath is not changed, otherwise the object returned by load
+        """
+        # Stat before loading so that a file changed while loading is loaded again next time
+        stat = os.stat(fpath)
+        key = (os.path.abspath(fpath), *key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+                self._entries.move_to_end(key)
+                return entry[2]
+
+        value = load()
+        with self._lock:
+            self._discard(key)
+            if stat.st_size <= self.max_bytes:
+                self._entries[key] = (stat.st_mtime_ns, stat.st_size, value)
+                self._nbytes += stat.st_size
+            while (
+                len(self._entries) > self.max_entries or self._nbytes > self.max_bytes
+            ):
+                self._discard(next(iter(self._entries)))
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+    def _discard(self, key: tuple) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._nbytes -= entry[1]
+
+
+# Shared by `cache=True` of `OwlMixin.from_jsonf`, `from_yamlf` and so on
+file_cache = FileCache()
+
+
+def load_json(json_str, backend=None):
     """
     :param unicode json_str:
+    :param Optional[unicode] backend: Json backend name (default backend if None)
     :rtype: dict | list
     """
-    return json.loads(json_str)
+    return get_json_backend(backend).loads(json_str)
 
 
-def load_jsonf(fpath, encoding):
-    """
+def load_jsonf(fpath, encoding, backend=None, compression="infer"):
+    """The file is read in binary mode, and UTF-8 bytes are passed to the backend without decoding
+
     :param unicode fpath:
     :param unicode encoding:
+    :param Optional[unicode] backend: Json backend name (default backend if None)
+    :param Optional[unicode] compression: "gzip", "bz2", "xz" or None. It is inferred from the extension if "infer"
     :rtype: dict | list
     """
-    with codecs.open(fpath, encoding=encoding) as f:
-        return json.load(f)
+    return get_json_backend(backend).loads(
+        _decode_unless_utf8(read_bytesf(fpath, compression=compression), encoding)
+    )
+
+
+_WHITESPACES = re.compile(r"[ \t\n\r]*")
+# The longest token whose prefix can make a decode error at the end of a buffer
+_LONGEST_TOKEN = len("-Infinity")
+
+
+def _is_truncated(err: json.JSONDecodeError, buf: str) -> bool:
+    """True if err may be caused by the end of buf, such as `{"a": tr` or `"abc` (not malformed yet)"""
+    return (
+        err.msg.startswith("Unterminated string") or len(buf) - err.pos < _LONGEST_TOKEN
+    )
+
+
+def _shift_decode_error(
+    err: json.JSONDecodeError, offset: int, lines: int, column: int
+) -> json.JSONDecodeError:
+    """Make the position of err (relative to a buffer) absolute in the whole text.
+
+    :param err: Error raised for the buffer
+    :param offset: Number of chars before the buffer
+    :param lines: Number of newlines before the buffer
+    :param column: Number of chars after the last newline before the buffer
+    """
+    shifted = json.JSONDecodeError(err.msg, err.doc, err.pos)
+    shifted.pos = offset + err.pos
+    if err.lineno == 1:
+        shifted.colno = column + err.colno
+    shifted.lineno = lines + err.lineno
+    shifted.args = (
+        f"{err.msg}: line {shifted.lineno} column {shifted.colno} (char {shifted.pos})",
+    )
+    return shifted
+
+
+def iter_json_array(read, chunk_size=65536):
+    """Decode elements of a top-level json array one by one, reading text in chunks.
+
+    Memory is bounded by the largest single element (and `chunk_size`), not the whole text.
+
+    :param Callable[[int], unicode] read: fn(size) -> text (ex. `read` of a text file)
+    :param int chunk_size: Size to read at once
+    :rtype: Iterator[dict | list | unicode | int | float | bool | None]
+
+    Usage:
+
+        >>> list(iter_json_array(io.StringIO('[{"a": 1}, [2], 3.5, "x", null] ').read, 2))
+        [{'a': 1}, [2], 3.5, 'x', None]
+        >>> list(iter_json_array(io.StringIO(' [ ] ').read))
+        []
+        >>> list(iter_json_array(io.StringIO('{"a": 1}').read))
+        Traceback (most recent call last):
+            ...
+        json.decoder.JSONDecodeError: Expecting '[': line 1 column 1 (char 0)
+        >>> list(iter_json_array(io.StringIO('[1,\\n 2,\\n 3 4]').read, 2))
+        Traceback (most recent call last):
+            ...
+        json.decoder.JSONDecodeError: Expecting ',' or ']': line 3 column 4 (char 11)
+    """
+    # pylint: disable=too-many-branches,too-many-statements
+    decode = json.JSONDecoder().raw_decode
+    buf = ""
+    pos = 0
+    eof = False
+    # Position of buf in the whole text for errors
+    offset = lines = column = 0
+
+    def fill(size):
+        nonlocal buf, pos, eof, offset, lines, column
+        chunk = read(size)
+        eof = not chunk
+        newlines = buf.count("\n", 0, pos)
+        if newlines:
+            lines += newlines
+            column = pos - buf.rfind("\n", 0, pos) - 1
+        else:
+            column += pos
+        offset += pos
+        buf = buf[pos:] + chunk
+        pos = 0
+
+    def error(msg):
+        return _shift_decode_error(
+            json.JSONDecodeError(msg, buf, pos), offset, lines, column
+        )
+
+    def peek():
+        """Skip whitespaces and return the next char ("" if EOF)"""
+        nonlocal pos
+        while True:
+            pos = _WHITESPACES.match(buf, pos).end()  # type: ignore
+            if pos < len(buf) or eof:
+                return buf[pos : pos + 1]
+            fill(chunk_size)
+
+    def expect(chars):
+        nonlocal pos
+        c = peek()
+        if not c or c not in chars:
+            raise error(f"Expecting {' or '.join(repr(x) for x in chars)}")
+        pos += 1
+        return c
+
+    expect("[")
+    if peek() == "]":
+        pos += 1
+    else:
+        while True:
+            peek()
+            while True:
+                try:
+                    value, end = decode(buf, pos)
+                except json.JSONDecodeError as err:
+                    # Don't read the rest of a huge text only to report a malformed element
+                    if eof or not _is_truncated(err, buf):
+                        raise _shift_decode_error(err, offset, lines, column) from None
+                    # Grow geometrically so that a large element is decoded in O(n)
+                    fill(max(chunk_size, len(buf) - pos))
+                    continue
+                # A number at the end of the buffer (ex. `1` of `1.5`) may continue
+                if eof or (end < len(buf) and buf[end] in " \t\n\r,]"):
+                    break
+                fill(max(chunk_size, len(buf) - pos))
+            pos = end
+            yield value
+            if expect(",]") == "]":
+                break
+
+    if peek():
+        raise error("Extra data")
+
+
+def _iter_textf(fpath, encoding, compression, iterate, newline=None):
+    """Open the file at the first `next` so that it is never leaked by an iterator which isn't consumed"""
+    # Raise errors of the path (ex. not found) immediately without holding the file
+    os.stat(fpath)
+
+    def gen():
+        with open_textf(
+            fpath, "r", encoding, compression=compression, newline=newline
+        ) as f:
+            yield from iterate(f)
+
+    return gen()
+
+
+def load_json_iterator(json_str):
+    """Same as `load_json`, but decodes elements of a top-level array one by one
+
+    :param unicode json_str:
+    :rtype: Iterator[dict]
+    """
+    return iter_json_array(io.StringIO(json_str).read)
+
+
+def load_jsonf_iterator(fpath, encoding, chunk_size=65536, compression="infer"):
+    """Same as `load_jsonf`, but reads a top-level array in chunks and decodes its elements one by one
+
+    :param unicode fpath:
+    :param unicode encoding:
+    :param int chunk_size: Size to read at once
+    :param Optional[unicode] compression: "gzip", "bz2", "xz" or None. It is inferred from the extension if "infer"
+    :rtype: Iterator[dict]
+    """
+    return _iter_textf(
+        fpath,
+        encoding,
+        compression,
+        lambda f: iter_json_array(f.read, chunk_size),
+        newline="",
+    )
+
+
+def iter_json_lines(lines, backend=None):
+    """Decode json lines one by one (blank lines are skipped)
+
+    :param Iterable[unicode] lines:
+    :param Optional[unicode] backend: Json backend name (default backend if None)
+    :rtype: Iterator[dict]
+
+    Usage:
+
+        >>> list(iter_json_lines(['{"a": 1}\\n', '\\n', '[2]']))
+        [{'a': 1}, [2]]
+        >>> list(iter_json_lines(['{"a": 1}', '{"a": 2']))
+        Traceback (most recent call last):
+            ...
+        json.decoder.JSONDecodeError: Line 2: Expecting ',' delimiter: line 1 column 8 (char 7)
+    """
+    loads = get_json_backend(backend).loads
+    for lineno, line in enumerate(lines, 1):
+        if line.isspace() or not line:
+            continue
+        try:
+            yield loads(line)
+        except json.JSONDecodeError as e:
+            raise json.JSONDecodeError(f"Line {lineno}: {e.msg}", e.doc, e.pos) from e
+
+
+def load_jsonl_iterator(jsonl_str, backend=None):
+    """
+    :param unicode jsonl_str: Json lines
+    :param Optional[unicode] backend: Json backend name (default backend if None)
+    :rtype: Iterator[dict]
+    """
+    return iter_json_lines(io.StringIO(jsonl_str), backend)
+
+
+def load_jsonlf_iterator(fpath, encoding, backend=None, compression="infer"):
+    """
+    :param unicode fpath:
+    :param unicode encoding:
+    :param Optional[unicode] backend: Json backend name (default backend if None)
+    :param Optional[unicode] compression: "gzip", "bz2", "xz" or None. It is inferred from the extension if "infer"
+    :rtype: Iterator[dict]
+    """
+    return _iter_textf(
+        fpath, encoding, compression, lambda f: iter_json_lines(f, backend)
+    )
 
 
 def load_yaml(yaml_str):
@@ -124,79 +738,192 @@ def load_yaml(yaml_str):
     :param unicode yaml_str:
     :rtype: dict | list
     """
-    return yaml.safe_load(yaml_str)
+    return yaml.load(yaml_str, Loader=MyLoader)
 
 
-def load_yamlf(fpath, encoding):
-    """
+def load_yamlf(fpath, encoding, compression="infer"):
+    """The file is read in binary mode, and UTF-8 bytes are passed to the parser without decoding
+
     :param unicode fpath:
     :param unicode encoding:
+    :param Optional[unicode] compression: "gzip", "bz2", "xz" or None. It is inferred from the extension if "infer"
     :rtype: dict | list
     """
-    with codecs.open(fpath, encoding=encoding) as f:
-        return yaml.safe_load(f)
+    return yaml.load(
+        _decode_unless_utf8(read_bytesf(fpath, compression=compression), encoding),
+        Loader=MyLoader,
+    )
+
+
+def load_yaml_documents(yaml_str):
+    """Load `---` separated documents one by one (empty documents are skipped)
+
+    :param unicode yaml_str:
+    :rtype: Iterator[dict | list]
+
+    Usage:
+
+        >>> list(load_yaml_documents("a: 1\\n---\\n---\\nb: 2\\n"))
+        [{'a': 1}, {'b': 2}]
+    """
+    return (d for d in yaml.load_all(yaml_str, Loader=MyLoader) if d is not None)
+
+
+def load_yamlf_documents(fpath, encoding, compression="infer"):
+    """Same as `load_yaml_documents`, but parses the file lazily
+
+    :param unicode fpath:
+    :param unicode encoding:
+    :param Optional[unicode] compression: "gzip", "bz2", "xz" or None. It is inferred from the extension if "infer"
+    :rtype: Iterator[dict | list]
+    """
+    return _iter_textf(fpath, encoding, compression, load_yaml_documents, newline="")
+
+
+def _sniff_csv_dialect(f):
+    snippet = f.read(8192)
+    f.seek(0)
+
+    dialect = csv.Sniffer().sniff(snippet)
+    dialect.skipinitialspace = True
+    return dialect
 
 
 def load_csvf(
-    fpath: str, fieldnames: Optional[Sequence[str]], encoding: str
+    fpath: str,
+    fieldnames: Optional[Sequence[str]],
+    encoding: str,
+    dialect: Optional[Union[str, csv.Dialect, type]] = None,
+    compression: Optional[str] = "infer",
 ) -> Iterator[dict]:
     """
     :param fpath:
     :param fieldnames:
     :param encoding:
+    :param dialect: Dialect name or class (ex. "excel-tab", "lf_tsv"). It is sniffed from the first 8KB if None
+    :param compression: "gzip", "bz2", "xz" or None. It is inferred from the extension if "infer"
     :return Iterator of dict:
     """
-    with open(fpath, mode="r", encoding=encoding) as f:
-        snippet = f.read(8192)
-        f.seek(0)
-
-        dialect = csv.Sniffer().sniff(snippet)
-        dialect.skipinitialspace = True
-        reader = csv.DictReader(f, fieldnames=fieldnames, dialect=dialect)  # type: ignore
+    with open_textf(fpath, "r", encoding, compression=compression) as f:
+        reader = csv.DictReader(
+            f,
+            fieldnames=fieldnames,
+            dialect=dialect or _sniff_csv_dialect(f),  # type: ignore
+        )
         for d in reader:
             yield d
 
 
-def load_json_url(url):
+def load_csvf_rows(
+    fpath: str,
+    fieldnames: Optional[Sequence[str]],
+    encoding: str,
+    dialect: Optional[Union[str, csv.Dialect, type]] = None,
+    compression: Optional[str] = "infer",
+) -> Tuple[Sequence[str], Iterator[List[str]]]:
+    """Same as `load_csvf`, but rows are lists of cells (blank lines are skipped)
+
+    :param fpath:
+    :param fieldnames: Header. The first row is used if None
+    :param encoding:
+    :param dialect: Dialect name or class (ex. "excel-tab", "lf_tsv"). It is sniffed from the first 8KB if None
+    :param compression: "gzip", "bz2", "xz" or None. It is inferred from the extension if "infer"
+    :return: Header and iterator of rows
+    """
+    f = open_textf(fpath, "r", encoding, compression=compression)
+    try:
+        reader = csv.reader(f, dialect=dialect or _sniff_csv_dialect(f))  # type: ignore
+        rows = (row for row in reader if row)
+        header = fieldnames if fieldnames is not None else next(rows, [])
+    except BaseException:
+        f.close()
+        raise
+
+    def iterate():
+        with f:
+            yield from rows
+
+    return header, iterate()
+
+
+def load_json_url(url, backend=None):
     """
     :param unicode url:
+    :param Optional[unicode] backend: Json backend name (default backend if None)
     :rtype: dict | list
     """
-    return json.loads(urlopen(url).read())
+    return get_json_backend(backend).loads(urlopen(url).read())
 
 
-def dump_csv(
+def _csv_value(v):
+    # XXX: Double quotation behaves strangely... so replace (why?)
+    return dump_json(v).replace('"', "'") if isinstance(v, (dict, list)) else v
+
+
+def iter_csv(
     data: Iterable[dict],
     fieldnames: Sequence[str],
     *,
     with_header: bool = False,
     crlf: bool = False,
     tsv: bool = False,
-) -> str:
-    """
+    chunk_rows: int = 1000,
+) -> Iterator[str]:
+    """Same as `dump_csv`, but yields csv text every `chunk_rows` rows
+
     :param data:
     :param fieldnames:
     :param with_header:
     :param crlf:
     :param tsv:
-    :return: Csv string
-    """
+    :param chunk_rows: Number of rows in a chunk
+    :return: Iterator of csv text
 
-    def force_str(v):
-        # XXX: Double quotation behaves strangely... so replace (why?)
-        return dump_json(v).replace('"', "'") if isinstance(v, (dict, list)) else v
+    Usage:
 
+        >>> list(iter_csv(iter([{"a": 1}, {"a": [2]}, {"a": 3}]), ["a"], with_header=True, chunk_rows=2))
+        ['a\\n1\\n', '[2]\\n3\\n']
+    """
     with io.StringIO() as sio:
         dialect = get_dialect_name(crlf, tsv)
         writer = csv.DictWriter(
             sio, fieldnames=fieldnames, dialect=dialect, extrasaction="ignore"
         )
+        rows = 0
         if with_header:
             writer.writeheader()
+            rows += 1
         for x in data:
-            writer.writerow({k: force_str(v) for k, v in x.items()})
-        sio.seek(0)
-        return sio.read()
+            writer.writerow({k: _csv_value(v) for k, v in x.items()})
+            rows += 1
+            if rows >= chunk_rows:
+                yield sio.getvalue()
+                sio.seek(0)
+                sio.truncate()
+                rows = 0
+        if rows:
+            yield sio.getvalue()
+
+
+def dump_csv(
+    data: Iterable[dict],
+    fieldnames: Sequence[str],
+    *,
+    with_header: bool = False,
+    crlf: bool = False,
+    tsv: bool = False,
+) -> str:
+    """
+    :param data:
+    :param fieldnames:
+    :param with_header:
+    :param crlf:
+    :param tsv:
+    :return: Csv string
+    """
+    return "".join(
+        iter_csv(data, fieldnames, with_header=with_header, crlf=crlf, tsv=tsv)
+    )
 
 
 def dump_csvf(
@@ -208,6 +935,7 @@ def dump_csvf(
     with_header: bool = False,
     crlf: bool = False,
     tsv: bool = False,
+    compression: Optional[str] = "infer",
 ) -> str:
     """
     :param data:
@@ -217,14 +945,11 @@ def dump_csvf(
     :param with_header:
     :param crlf:
     :param tsv:
+    :param compression: "gzip", "bz2", "xz" or None. It is inferred from the extension if "infer"
     :return: written path
     """
 
-    def force_str(v):
-        # XXX: Double quotation behaves strangely... so replace (why?)
-        return dump_json(v).replace('"', "'") if isinstance(v, (dict, list)) else v
-
-    with codecs.open(fpath, mode="w", encoding=encoding) as f:
+    with open_textf(fpath, "w", encoding, compression=compression, newline="") as f:
         dialect = get_dialect_name(crlf, tsv)
         writer = csv.DictWriter(
             f, fieldnames=fieldnames, dialect=dialect, extrasaction="ignore"
@@ -232,34 +957,61 @@ def dump_csvf(
         if with_header:
             writer.writeheader()
         for x in data:
-            writer.writerow({k: force_str(v) for k, v in x.items()})
+            writer.writerow({k: _csv_value(v) for k, v in x.items()})
 
     return fpath
 
 
-def dump_json(data, indent=None):
+def dump_json(data, indent=None, backend=None):
     """
     :param list | dict data:
     :param Optional[int] indent:
+    :param Optional[unicode] backend: Json backend name (default backend if None)
     :rtype: unicode
     """
-    return json.dumps(
-        data, indent=indent, ensure_ascii=False, sort_keys=True, separators=(",", ": ")
-    )
+    return get_json_backend(backend).dumps(data, indent)
 
 
 def dump_jsonf(
-    data: Union[list, dict], *, fpath: str, encoding: str, indent=None
+    data: Union[list, dict],
+    *,
+    fpath: str,
+    encoding: str,
+    indent=None,
+    backend: Optional[str] = None,
+    compression: Optional[str] = "infer",
 ) -> str:
     """
     :param data: list | dict data
     :param fpath: write path
     :param encoding: encoding
     :param indent:
+    :param backend: Json backend name (default backend if None)
+    :param compression: "gzip", "bz2", "xz" or None. It is inferred from the extension if "infer"
     :rtype: written path
     """
-    with codecs.open(fpath, mode="w", encoding=encoding) as f:
-        f.write(dump_json(data, indent))
+    with open_textf(fpath, "w", encoding, compression=compression, newline="") as f:
+        f.write(dump_json(data, indent, backend))
+        return fpath
+
+
+def dump_json_chunksf(
+    chunks: Iterable[str],
+    *,
+    fpath: str,
+    encoding: str,
+    compression: Optional[str] = "infer",
+) -> str:
+    """Write chunks of json text one by one
+
+    :param chunks: Json text chunks
+    :param fpath: write path
+    :param encoding: encoding
+    :param compression: "gzip", "bz2", "xz" or None. It is inferred from the extension if "infer"
+    :rtype: written path
+    """
+    with open_textf(fpath, "w", encoding, compression=compression, newline="") as f:
+        f.writelines(chunks)
         return fpath
 
 
@@ -278,18 +1030,241 @@ def dump_yaml(data):
     )
 
 
-def dump_yamlf(data: Union[list, dict], *, fpath: str, encoding: str) -> str:
+def dump_yamlf(
+    data: Union[list, dict],
+    *,
+    fpath: str,
+    encoding: str,
+    compression: Optional[str] = "infer",
+) -> str:
     """
     :param data: list | dict data
     :param fpath: write path
     :param encoding: encoding
+    :param compression: "gzip", "bz2", "xz" or None. It is inferred from the extension if "infer"
     :rtype: written path
     """
-    with codecs.open(fpath, mode="w", encoding=encoding) as f:
+    with open_textf(fpath, "w", encoding, compression=compression, newline="") as f:
         f.write(dump_yaml(data))
         return fpath
 
 
+def dump_yaml_documents(data: Iterable[Union[list, dict]]) -> str:
+    """
+    :param data: Documents
+    :rtype: `---` separated documents
+
+    Usage:
+
+        >>> print(dump_yaml_documents([{"a": [1]}, {"b": 2}]))
+        ---
+        a:
+          - 1
+        ---
+        b: 2
+        <BLANKLINE>
+    """
+    with io.StringIO() as sio:
+        _dump_yaml_documents(data, sio)
+        return sio.getvalue()
+
+
+def dump_yaml_documentsf(
+    data: Iterable[Union[list, dict]],
+    *,
+    fpath: str,
+    encoding: str,
+    compression: Optional[str] = "infer",
+) -> str:
+    """Documents are written one by one
+
+    :param data: Documents
+    :param fpath: write path
+    :param encoding: encoding
+    :param compression: "gzip", "bz2", "xz" or None. It is inferred from the extension if "infer"
+    :rtype: written path
+    """
+    with open_textf(fpath, "w", encoding, compression=compression, newline="") as f:
+        _dump_yaml_documents(data, f)
+        return fpath
+
+
+def _dump_yaml_documents(data, stream):
+    yaml.dump_all(
+        data,
+        stream,
+        explicit_start=True,
+        indent=2,
+        allow_unicode=True,
+        default_flow_style=False,
+        Dumper=MyDumper,
+    )
+
+
+SNAPSHOT_MAGIC = b"OWLSNAP\x01"
+
+
+def schema_fingerprint(cls: type) -> str:
+    """Hash of the qualified name and the annotations (names and types in declaration order) of cls
+
+    Usage:
+
+        >>> class Spot:
+        ...     name: str
+        ...     rating: int
+        >>> fingerprint = schema_fingerprint(Spot)
+        >>> class Spot:
+        ...     rating: int
+        ...     name: str
+        >>> schema_fingerprint(Spot) == fingerprint
+        False
+    """
+    annotations = vars(cls).get("__annotations__") or {}
+    schema = repr(
+        (
+            cls.__module__,
+            cls.__qualname__,
+            [(name, repr(type_)) for name, type_ in annotations.items()],
+        )
+    )
+    return hashlib.sha256(schema.encode("utf8")).hexdigest()
+
+
+class _SchemaRecordingPickler(pickle.Pickler):
+    """Records classes which declare annotations in order to put their fingerprints in the header"""
+
+    def __init__(self, file):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.schemas: set = set()
+
+    def reducer_override(self, obj):
+        t = type(obj)
+        if isinstance(vars(t).get("__annotations__"), dict):
+            self.schemas.add(t)
+        return NotImplemented
+
+
+def dump_snapshotf(
+    data: Any, *, fpath: str, compression: Optional[str] = "infer"
+) -> str:
+    """Write an object graph as it is with the fingerprints of its classes.
+
+    :param data: Any picklable object
+    :param fpath: write path
+    :param compression: "gzip", "bz2", "xz" or None. It is inferred from the extension if "infer"
+    :rtype: written path
+    """
+    payload = io.BytesIO()
+    pickler = _SchemaRecordingPickler(payload)
+    pickler.dump(data)
+    schemas = sorted(
+        (t.__module__, t.__qualname__, schema_fingerprint(t)) for t in pickler.schemas
+    )
+
+    with _get_opener(fpath, compression)(fpath, "wb") as f:
+        f.write(SNAPSHOT_MAGIC)
+        pickle.dump(schemas, f, protocol=pickle.HIGHEST_PROTOCOL)
+        f.write(payload.getbuffer())
+        return fpath
+
+
+def load_snapshotf(
+    fpath: str, type_: type = object, *, compression: Optional[str] = "infer"
+) -> Any:
+    """Read an object graph written by `dump_snapshotf` without decoding or validating values again.
+
+    Snapshots are pickles, so load only the ones you wrote by yourself.
+
+    :param fpath: read path
+    :param type_: Expected type of the object graph
+    :param compression: "gzip", "bz2", "xz" or None. It is inferred from the extension if "infer"
+    :return: The object graph
+    :raises ValueError: If fpath is not a snapshot of type_, or a class was changed after the snapshot was written
+    """
+    data = read_bytesf(fpath, compression=compression)
+    if not data.startswith(SNAPSHOT_MAGIC):
+        raise ValueError(f"{fpath} is not a snapshot")
+
+    f = io.BytesIO(data)
+    f.seek(len(SNAPSHOT_MAGIC))
+    schemas = pickle.load(f)
+    unpickler = pickle.Unpickler(f)
+    for module, qualname, fingerprint in schemas:
+        if schema_fingerprint(unpickler.find_class(module, qualname)) != fingerprint:
+            raise ValueError(
+                f"{module}.{qualname} was changed after {fpath} was written"
+            )
+
+    obj = unpickler.load()
+    if not isinstance(obj, type_):
+        raise ValueError(
+            f"{fpath} is a snapshot of {type(obj).__name__}, not {type_.__name__}"
+        )
+    return obj
+
+
+_MISSING = object()
+
+
+def pool_size(workers: Optional[int]) -> int:
+    """Number of workers of a pool created with `max_workers=workers` (the number of CPUs if None)
+
+    :param workers: `max_workers` of the pool
+    :return: Number of workers (used to size chunks and windows of submitted tasks)
+    """
+    return workers or os.cpu_count() or 1
+
+
+def map_bounded(
+    pool: Executor,
+    func: Callable[[Any], Any],
+    items: Iterable,
+    max_pending: int,
+    *,
+    ordered: bool = True,
+) -> Iterator:
+    """Same as `pool.map(func, items)`, but only `max_pending` items are submitted at once.
+
+    A lazy iterable is never materialized. Pending tasks are cancelled when the iterator is closed or fails.
+
+    :param pool: Executor (not shut down)
+    :param func: Function applied in the pool (picklable for a process pool)
+    :param items: Arguments of func
+    :param max_pending: Number of tasks submitted at once
+    :param ordered: Results are yielded in completion order if False
+    :return: Iterator of results
+
+    Usage:
+
+        >>> from concurrent.futures import ThreadPoolExecutor
+        >>> with ThreadPoolExecutor(2) as pool:
+        ...     list(map_bounded(pool, lambda x: x * 2, iter(range(5)), 2))
+        [0, 2, 4, 6, 8]
+    """
+    iterator = iter(items)
+    pending: Any = deque() if ordered else set()
+    submit = pending.append if ordered else pending.add
+    try:
+        for item in itertools.islice(iterator, max_pending):
+            submit(pool.submit(func, item))
+
+        while pending:
+            if ordered:
+                done = [pending.popleft()]
+            else:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                submit = pending.add
+            for future in done:
+                result = future.result()
+                item = next(iterator, _MISSING)
+                if item is not _MISSING:
+                    submit(pool.submit(func, item))
+                yield result
+    finally:
+        for future in pending:
+            future.cancel()
+
+
 def dump_table(data: List[dict], fieldnames: Sequence[str]) -> str:
     """
     :param data:
@@ -1,17 +1,31 @@
 # coding: utf-8
 # pylint: disable=no-self-use,too-many-lines
 
+import copy
+import gc
+import json
 import os
+import pickle
+import tracemalloc
+import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 import pytest
 from mock import patch
 from typing import Any
 
-from owlmixin import OwlMixin, RequiredError
+from owlmixin import (
+    InvalidTypeError,
+    OwlMixin,
+    OwlSlotsMixin,
+    RequiredError,
+    UnknownPropertiesError,
+    util,
+)
 from owlmixin.owlcollections import TDict, TList
 from owlmixin.owlenum import OwlEnum
 from owlmixin.samples import Japanese
-from owlmixin.transformers import TOption
+from owlmixin.transformers import TOption, traverse_dict
 
 
 class Color(OwlEnum):
@@ -47,6 +61,13 @@ class Paper(OwlMixin):
         return f"{v} px"
 
 
+class Sheet(OwlMixin):
+    name: str
+    pages: TOption[int]
+    color: TOption[Color]
+    ratio: float = 1.0
+
+
 class Address(OwlMixin):
     name: str
 
@@ -230,6 +251,601 @@ class TestFromDict:
             Human.from_dict(None)
 
 
+class TestOwlPlan:
+    def test_fields(self):
+        plan = Paper.__owl_plan__
+
+        assert plan.cls is Paper
+        assert [f.name for f in plan.fields] == ["name", "width", "height"]
+        assert [f.type_ for f in plan.fields] == [str, str, int]
+        assert plan.keys == frozenset({"name", "width", "height"})
+
+    def test_hook(self):
+        plan = Paper.__owl_plan__
+
+        assert plan.fields[0].hook is None
+        assert plan.fields[1].hook(10) == "10 px"
+
+    def test_default(self):
+        plan = Japanese.__owl_plan__
+
+        assert [(f.name, f.default) for f in plan.fields] == [
+            ("name", None),
+            ("language", "japanese"),
+        ]
+
+    def test_default_assigned_in_init(self):
+        for compiled in (False, True):
+
+            class InitDefault(OwlMixin, compiled=compiled):
+                x: int
+
+                def __init__(self, x=None, **extra):
+                    self.x = 5 if x is None else x
+
+            assert InitDefault.__owl_plan__.fields[0].default == 5
+            assert InitDefault.from_dict({}).x == 5
+            assert InitDefault.from_dicts([{}, {"x": 1}]).to_dicts() == [{"x": 5}, {"x": 1}]
+
+    def test_default_without_instance(self):
+        class NeedArgs(OwlMixin):
+            x: int
+            y: int = 3
+
+            def __init__(self, x):
+                self.x = x
+
+        assert [f.default for f in NeedArgs.__owl_plan__.fields] == [None, 3]
+
+    def test_forwardref_type(self):
+        plan = ForwardRefType.__owl_plan__
+
+        assert plan.fields[1].type_ is Address
+
+    def test_cached(self):
+        assert Paper.__owl_plan__ is Paper.__owl_plan__
+
+    def test_not_cached_until_forwardref_is_resolved(self):
+        class Later(OwlMixin):
+            child: "UndefinedLater"  # noqa: F821
+
+        assert Later.__owl_plan__ is not Later.__owl_plan__
+
+    def test_not_inherited(self):
+        class Base(OwlMixin):
+            id: int
+
+        class Child(Base):
+            id: int
+            name: str
+
+        assert [f.name for f in Base.__owl_plan__.fields] == ["id"]
+        assert [f.name for f in Child.__owl_plan__.fields] == ["id", "name"]
+
+
+class CompiledSpot(OwlMixin, compiled=True):
+    names: TList[str]
+    address: TOption[Address]
+    color: TOption[Color]
+
+
+class CompiledHuman(OwlMixin, compiled=True):
+    id: int
+    name: str
+    favorite_spots: TList[CompiledSpot]
+    favorite_animal: Animal
+    friends_by_short_name: TOption[TDict["CompiledHuman"]]
+
+
+class CompiledPaper(OwlMixin, compiled=True):
+    name: str
+    width: str
+    height: int
+
+    @classmethod
+    def ___width(cls, v: int) -> str:
+        return f"{v} px"
+
+
+class CompiledJapanese(OwlMixin, compiled=True):
+    name: str
+    language: str = "japanese"
+
+
+class TestCompiled:
+    def test_normal(self):
+        r: CompiledHuman = CompiledHuman.from_dict(SAMPLE_HUMAN)
+
+        assert CompiledHuman.__owl_plan__.from_dict is not None
+        assert r.to_dict() == Human.from_dict(SAMPLE_HUMAN).to_dict()
+        assert r.favorite_spots[1].color.get() is Color.RED
+        assert isinstance(r.friends_by_short_name.get()["toshi"], CompiledHuman)
+
+    def test_hook_and_default(self):
+        assert CompiledPaper.from_dict({"name": "A4", "width": 210, "height": 297}).width == "210 px"
+        assert CompiledJapanese.from_dict({"name": "taro"}).language == "japanese"
+
+    def test_force_cast(self):
+        r = CompiledPaper.from_dict({"name": "A4", "width": 210, "height": "297"}, force_cast=True)
+        assert r.height == 297
+
+    def test_not_compiled_by_default(self):
+        Human.from_dict(SAMPLE_HUMAN)
+        assert Human.__owl_plan__.from_dict is None
+
+    def test_compile(self):
+        class Later(OwlMixin):
+            id: int
+
+        assert Later.compile() is Later
+        assert Later.__owl_plan__.from_dict is not None
+        assert Later.from_dict({"id": 1}).id == 1
+
+    def test_compile_before_forward_references_are_defined(self, monkeypatch):
+        class Box(OwlMixin):
+            item: "NotDefinedYet"  # type: ignore # noqa: F821
+
+        Box.compile()
+        assert "__owl_plan_cache__" not in Box.__dict__
+
+        class NotDefinedYet(OwlMixin):
+            name: str
+
+        monkeypatch.setitem(globals(), "NotDefinedYet", NotDefinedYet)
+        r = Box.from_dict({"item": {"name": "apple"}})
+        assert isinstance(r.item, NotDefinedYet)
+        assert Box.__owl_plan__ is Box.__dict__["__owl_plan_cache__"]
+        assert Box.__owl_plan__.from_dict is not None
+
+    def test_required_error(self):
+        with pytest.raises(RequiredError) as e:
+            CompiledHuman.from_dict({**SAMPLE_HUMAN, "favorite_spots": [{"names": ["a", None]}]})
+        assert e.value.prop == "names.1"
+
+    def test_invalid_type_error(self):
+        with pytest.raises(InvalidTypeError) as e:
+            CompiledHuman.from_dict({**SAMPLE_HUMAN, "favorite_spots": ["spot"]})
+        assert e.value.prop == "favorite_spots.0"
+        assert e.value.expected == [str(CompiledSpot), str(dict)]
+
+    def test_unknown_properties_error(self):
+        with pytest.raises(UnknownPropertiesError) as e:
+            CompiledHuman.from_dict({**SAMPLE_HUMAN, "unknown": 1})
+        assert e.value.props == ["unknown"]
+
+
+class SlotsSpot(OwlSlotsMixin):
+    names: TList[str]
+    address: TOption[Address]
+    color: TOption[Color]
+
+
+class SlotsHuman(OwlMixin, slots=True):
+    id: int
+    name: str
+    favorite_spots: TList[SlotsSpot]
+    favorite_animal: Animal
+    friends_by_short_name: TOption[TDict["SlotsHuman"]]
+
+
+class SlotsJapanese(OwlSlotsMixin, compiled=True):
+    name: str
+    language: str = "japanese"
+
+
+class SlotsOsakan(SlotsJapanese):
+    language: str = "osaka"
+    city: str = "osaka"
+
+
+class TestSlots:
+    def test_normal(self):
+        r: SlotsHuman = SlotsHuman.from_dict(SAMPLE_HUMAN)
+
+        assert not hasattr(r, "__dict__")
+        assert r.to_dict() == Human.from_dict(SAMPLE_HUMAN).to_dict()
+        assert r.to_json() == Human.from_dict(SAMPLE_HUMAN).to_json()
+        assert r.to_yaml() == Human.from_dict(SAMPLE_HUMAN).to_yaml()
+
+    def test_slots(self):
+        assert SlotsJapanese.__slots__ == ("name", "language")
+        assert SlotsOsakan.__slots__ == ("city",)
+        with pytest.raises(AttributeError):
+            SlotsJapanese.from_dict({"name": "taro"}).unknown = 1
+
+    def test_default(self):
+        assert SlotsJapanese.from_dict({"name": "taro"}).language == "japanese"
+        assert SlotsJapanese().language == "japanese"
+        assert SlotsOsakan.from_dict({}).to_dict() == {
+            "language": "osaka",
+            "city": "osaka",
+        }
+        with pytest.raises(AttributeError):
+            SlotsJapanese().name
+
+    def test_not_slots(self):
+        class Plain(SlotsJapanese, slots=False):
+            pass
+
+        p = Plain()
+        p.unknown = 1
+        assert p.__dict__ == {"unknown": 1}
+        assert p.language == "japanese"
+
+    def test_pickle_and_copy(self):
+        r: SlotsHuman = SlotsHuman.from_dict(SAMPLE_HUMAN)
+
+        assert pickle.loads(pickle.dumps(r)).to_dict() == r.to_dict()
+        assert copy.deepcopy(r).to_dict() == r.to_dict()
+
+
+class Account(OwlMixin):
+    name: str
+    password: str
+
+    def __getstate__(self):
+        return {**self.__dict__, "password": "REDACTED"}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.restored = True
+
+
+class Counter(OwlMixin):
+    count: int
+
+    def __reduce__(self):
+        return Counter.from_dict, ({"count": self.count + 100},)
+
+
+class TestPickle:
+    def test_round_trip(self):
+        for cls in (Human, CompiledHuman, SlotsHuman):
+            r = cls.from_dict(SAMPLE_HUMAN)
+            for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+                actual = pickle.loads(pickle.dumps(r, protocol=protocol))
+                assert type(actual) is cls
+                assert actual.to_dict() == r.to_dict()
+                assert isinstance(actual.friends_by_short_name.get(), TDict)
+                assert isinstance(actual.favorite_spots[1].address, TOption)
+
+    def test_values_without_names(self):
+        r = Human.from_dict(SAMPLE_HUMAN)
+        payload = pickle.dumps(r, protocol=pickle.HIGHEST_PROTOCOL)
+
+        assert b"favorite_animal" not in payload
+        assert b"is_big" not in payload
+        assert len(payload) < len(pickle.dumps(r.__dict__, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def test_extras(self):
+        r = Japanese.from_dict({"name": "taro", "unknown": 1}, restrict=False)
+        r.memo = "memo"
+
+        actual = pickle.loads(pickle.dumps(r))
+        assert actual.__dict__ == r.__dict__
+
+        s = SlotsJapanese()
+        assert pickle.loads(pickle.dumps(s)).language == "japanese"
+        with pytest.raises(AttributeError):
+            pickle.loads(pickle.dumps(s)).name
+
+    def test_hooks_of_subclass(self):
+        r = Account.from_dict({"name": "taro", "password": "secret"})
+        for actual in (pickle.loads(pickle.dumps(r)), copy.copy(r), copy.deepcopy(r)):
+            assert (actual.name, actual.password, actual.restored) == ("taro", "REDACTED", True)
+
+        c = Counter.from_dict({"count": 1})
+        assert pickle.loads(pickle.dumps(c)).count == 101
+        assert copy.copy(c).count == 101
+
+    def test_lazy(self):
+        r: Human = Human.from_dict(SAMPLE_HUMAN, lazy=True)
+
+        actual = pickle.loads(pickle.dumps(r))
+        assert actual.__owl_lazy__ is not None
+        assert actual.to_dict() == Human.from_dict(SAMPLE_HUMAN).to_dict()
+
+    def test_copy(self):
+        r = Human.from_dict(SAMPLE_HUMAN)
+
+        assert copy.copy(r).favorite_spots is r.favorite_spots
+        assert copy.deepcopy(r).favorite_spots is not r.favorite_spots
+        assert copy.deepcopy(r).to_dict() == r.to_dict()
+
+    def test_errors(self):
+        with pytest.raises(RequiredError) as e:
+            Human.from_dict({**SAMPLE_HUMAN, "name": None})
+
+        actual = pickle.loads(pickle.dumps(e.value))
+        assert type(actual) is RequiredError
+        assert str(actual) == str(e.value)
+
+
+class TestSnapshot:
+    @pytest.mark.parametrize("ext", ["", ".gz"])
+    def test_round_trip(self, tmpdir, ext):
+        d = tmpdir.mkdir("tmp").strpath
+        for cls in (Human, CompiledHuman, SlotsHuman):
+            r = cls.from_dict(SAMPLE_HUMAN)
+            fpath = r.to_snapshot(os.path.join(d, f"{cls.__name__}.snapshot{ext}"))
+
+            actual = cls.from_snapshot(fpath)
+            assert type(actual) is cls
+            assert actual.to_dict() == r.to_dict()
+            assert isinstance(actual.friends_by_short_name.get(), TDict)
+
+    def test_collections(self, tmpdir):
+        d = tmpdir.mkdir("tmp").strpath
+        humans: TList[Human] = Human.from_dicts([SAMPLE_HUMAN, SAMPLE_HUMAN2])
+        humans_by_name: TDict[Human] = humans.key_by(lambda x: x.name)
+
+        actual = TList.from_snapshot(humans.to_snapshot(os.path.join(d, "list.snapshot")))
+        assert type(actual) is TList
+        assert actual.to_dicts() == humans.to_dicts()
+
+        actual = TDict.from_snapshot(humans_by_name.to_snapshot(os.path.join(d, "dict.snapshot")))
+        assert type(actual) is TDict
+        assert actual.to_dict() == humans_by_name.to_dict()
+
+    def test_fingerprints_in_header(self, tmpdir):
+        fpath = Human.from_dict(SAMPLE_HUMAN).to_snapshot(tmpdir.join("human.snapshot").strpath)
+
+        with open(fpath, "rb") as f:
+            assert f.read(len(util.SNAPSHOT_MAGIC)) == util.SNAPSHOT_MAGIC
+            assert pickle.load(f) == sorted(
+                (__name__, c.__name__, util.schema_fingerprint(c))
+                for c in (Address, Animal, Human, Spot)
+            )
+
+    def test_changed_schema(self, tmpdir, monkeypatch):
+        fpath = Human.from_dict(SAMPLE_HUMAN).to_snapshot(tmpdir.join("human.snapshot").strpath)
+
+        class Address(OwlMixin):
+            name: str
+            zip_code: TOption[str]
+
+        Address.__qualname__ = "Address"
+        monkeypatch.setattr(f"{__name__}.Address", Address)
+        with pytest.raises(ValueError) as e:
+            Human.from_snapshot(fpath)
+        assert str(e.value) == f"{__name__}.Address was changed after {fpath} was written"
+
+    def test_not_snapshot(self, tmpdir):
+        r = Human.from_dict(SAMPLE_HUMAN)
+
+        fpath = r.to_jsonf(tmpdir.join("human.json").strpath)
+        with pytest.raises(ValueError) as e:
+            Human.from_snapshot(fpath)
+        assert str(e.value) == f"{fpath} is not a snapshot"
+
+        fpath = r.to_snapshot(tmpdir.join("human.snapshot").strpath)
+        with pytest.raises(ValueError) as e:
+            Spot.from_snapshot(fpath)
+        assert str(e.value) == f"{fpath} is a snapshot of Human, not Spot"
+
+
+class TestFileCache:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        util.file_cache.clear()
+        yield
+        util.file_cache.clear()
+
+    def test_cached(self, tmpdir):
+        d = tmpdir.mkdir("tmp").strpath
+        spot: Spot = Spot.from_dict({"names": ["a", "b"], "address": {"name": "tokyo"}})
+        addresses: TList[Address] = Address.from_dicts([{"name": "tokyo"}, {"name": "osaka"}])
+        for load, fpath in [
+            (Spot.from_jsonf, spot.to_jsonf(os.path.join(d, "spot.json"))),
+            (Spot.from_yamlf, spot.to_yamlf(os.path.join(d, "spot.yaml"))),
+            (Address.from_jsonf_to_list, addresses.to_jsonf(os.path.join(d, "addresses.json"))),
+            (Address.from_yamlf_to_list, addresses.to_yamlf(os.path.join(d, "addresses.yaml"))),
+            (
+                lambda fpath, **kwargs: Address.from_csvf_to_list(fpath, dialect="excel", **kwargs),
+                addresses.to_csvf(os.path.join(d, "addresses.csv"), ["name"], with_header=True),
+            ),
+        ]:
+            actual = load(fpath, cache=True)
+            assert load(fpath, cache=True) is actual
+            assert load(fpath) is not actual
+            assert load(fpath, cache=True, validate=False) is not actual
+
+        assert len(util.file_cache) == 10
+
+    def test_changed(self, tmpdir):
+        fpath = Address.from_dict({"name": "tokyo"}).to_jsonf(tmpdir.join("address.json").strpath)
+        before = Address.from_jsonf(fpath, cache=True)
+
+        Address.from_dict({"name": "kanagawa"}).to_jsonf(fpath)
+        actual = Address.from_jsonf(fpath, cache=True)
+
+        assert actual.name == "kanagawa"
+        assert Address.from_jsonf(fpath, cache=True) is actual
+        assert before.name == "tokyo"
+
+    def test_classes(self, tmpdir):
+        class Station(OwlMixin):
+            name: str
+
+        fpath = Address.from_dicts([{"name": "tokyo"}]).to_jsonf(tmpdir.join("addresses.json").strpath)
+
+        assert type(Address.from_jsonf_to_list(fpath, cache=True)[0]) is Address
+        assert type(Station.from_jsonf_to_list(fpath, cache=True)[0]) is Station
+
+
+class Checked(OwlMixin):
+    validate: bool
+    spot: Spot
+    note: TOption[str]
+
+    @property
+    def broken(self):
+        raise AttributeError("broken in property")
+
+
+class TestLazy:
+    def test_decode_at_access(self):
+        r: Human = Human.from_dict(SAMPLE_HUMAN, lazy=True)
+
+        assert r.__owl_lazy__[0]["favorite_spots"] is SAMPLE_HUMAN["favorite_spots"]
+        assert r.name == "メンバ1"
+        assert isinstance(r.favorite_spots[0], Spot)
+        assert "favorite_spots" not in r.__owl_lazy__[0]
+        assert r.to_dict() == Human.from_dict(SAMPLE_HUMAN).to_dict()
+        assert r.__owl_lazy__ is None
+
+    def test_compiled_and_slots(self):
+        for cls in (CompiledHuman, SlotsHuman):
+            r = cls.from_dict(SAMPLE_HUMAN, lazy=True)
+            assert r.__owl_lazy__ is not None
+            assert r.to_json() == Human.from_dict(SAMPLE_HUMAN).to_json()
+
+    def test_error_at_access(self):
+        r: Human = Human.from_dict({**SAMPLE_HUMAN, "favorite_spots": ["spot"]}, lazy=True)
+
+        assert r.id == 1
+        with pytest.raises(InvalidTypeError):
+            r.favorite_spots
+        with pytest.raises(InvalidTypeError):
+            r.validate()
+        with pytest.raises(InvalidTypeError):
+            r.to_dict()
+
+    def test_validate(self):
+        r: Human = Human.from_dict(SAMPLE_HUMAN, lazy=True)
+
+        assert r.validate() is r
+        assert r.__owl_lazy__ is None
+        assert "__owl_lazy__" not in r.__dict__
+
+    def test_set_before_access(self):
+        r: Human = Human.from_dict(SAMPLE_HUMAN, lazy=True)
+        r.favorite_spots = TList()
+
+        assert r.validate().favorite_spots == []
+
+    def test_order_of_properties(self):
+        r: Human = Human.from_dict(SAMPLE_HUMAN, lazy=True)
+        r.friends_by_short_name
+
+        assert list(r.to_dict()) == list(Human.from_dict(SAMPLE_HUMAN).to_dict())
+
+    def test_property_named_validate(self):
+        r: Checked = Checked.from_dict({"validate": True, "spot": {"names": ["spot1"]}}, lazy=True)
+
+        assert r.to_dict() == {"validate": True, "spot": {"names": ["spot1"]}}
+        assert OwlMixin.validate(r) is r
+
+    def test_attribute_error_in_property(self):
+        for r in (
+            Checked.from_dict({"validate": True, "spot": {"names": []}}),
+            Checked.from_dict({"validate": True, "spot": {"names": []}}, lazy=True),
+        ):
+            with pytest.raises(AttributeError, match="broken in property"):
+                r.broken
+            with pytest.raises(AttributeError, match="'Checked' object has no attribute 'unknown'"):
+                r.unknown
+
+    def test_hasattr_without_lazy(self):
+        r: Human = Human.from_dict(SAMPLE_HUMAN)
+
+        assert not hasattr(r, "unknown")
+        assert r.__owl_lazy__ is None
+
+
+class TestTrusted:
+    def test_normal(self):
+        for cls in (Human, CompiledHuman, SlotsHuman):
+            r = cls.from_dict(SAMPLE_HUMAN, validate=False)
+            assert r.to_dict() == Human.from_dict(SAMPLE_HUMAN).to_dict()
+            assert r.favorite_spots[1].color.get() is Color.RED
+            assert isinstance(r.friends_by_short_name.get()["toshi"], cls)
+
+    def test_skip_validations(self):
+        for cls in (Human, CompiledHuman):
+            r = cls.from_dict(
+                {**SAMPLE_HUMAN, "name": None, "id": "1", "unknown": 1, "favorite_spots": [None]},
+                validate=False,
+            )
+            assert r.name is None
+            assert r.id == "1"
+            assert r.favorite_spots == [None]
+
+    def test_force_cast(self):
+        for cls in (Paper, CompiledPaper):
+            r = cls.from_dict({"name": "A4", "width": 210, "height": "297"}, force_cast=True, validate=False)
+            assert r.width == "210 px"
+            assert r.height == 297
+
+    def test_lazy(self):
+        r: Human = Human.from_dict({**SAMPLE_HUMAN, "favorite_spots": [{"names": None}]}, lazy=True, validate=False)
+        assert r.favorite_spots[0].names is None
+
+    def test_from_json(self):
+        r = Human.from_json(json.dumps({**SAMPLE_HUMAN, "name": None}), validate=False)
+        assert r.name is None
+        assert Human.from_dicts([SAMPLE_HUMAN], validate=False)[0].id == 1
+
+
+class DeepNode(OwlMixin):
+    name: str
+    children: TList["DeepNode"]
+    parent: TOption["DeepNode"]
+
+
+def deep_node(depth: int) -> dict:
+    d = {"name": "leaf", "children": []}
+    for i in range(depth):
+        d = {"name": f"node{i}", "children": [d], "parent": {"name": "p", "children": []}}
+    return d
+
+
+class TestIterative:
+    def test_same_as_recursive(self):
+        for cls in (Human, CompiledHuman, SlotsHuman):
+            r = cls.from_dict(SAMPLE_HUMAN, iterative=True)
+            assert r.to_dict() == cls.from_dict(SAMPLE_HUMAN).to_dict()
+            assert r.to_dict(iterative=True) == r.to_dict()
+            assert r.to_dict(ignore_none=False, iterative=True) == r.to_dict(ignore_none=False)
+            assert r.to_dict(force_value=True, iterative=True) == r.to_dict(force_value=True)
+
+    def test_deep(self):
+        r = DeepNode.from_dict(deep_node(5000), iterative=True)
+        assert r.name == "node4999"
+        assert r.parent.get().name == "p"
+
+        d = r.to_dict(iterative=True)
+        for _ in range(5000):
+            d = d["children"][0]
+        assert d == {"name": "leaf", "children": []}
+
+    def test_errors(self):
+        d = deep_node(3000)
+        leaf = d
+        while leaf["children"]:
+            leaf = leaf["children"][0]
+
+        leaf["unknown"] = 1
+        with pytest.raises(UnknownPropertiesError):
+            DeepNode.from_dict(d, iterative=True)
+        assert DeepNode.from_dict(d, iterative=True, restrict=False).name == "node2999"
+
+        del leaf["unknown"]
+        leaf["name"] = None
+        with pytest.raises(RequiredError):
+            DeepNode.from_dict(d, iterative=True)
+
+    def test_same_error_as_recursive(self):
+        # `address` is expanded on the stack, but `color` is decoded as a leaf after it
+        d = {"names": ["spot"], "address": {"name": "tokyo", "unknown": 1}, "color": 1}
+        for cls in (Spot, CompiledSpot, SlotsSpot):
+            with pytest.raises(UnknownPropertiesError) as expected:
+                cls.from_dict(d)
+            with pytest.raises(UnknownPropertiesError) as actual:
+                cls.from_dict(d, iterative=True)
+            assert str(actual.value) == str(expected.value)
+
+
 class TestFromOptionalDict:
     def test_normal(self):
         r: Human = Human.from_optional_dict(SAMPLE_HUMAN).get()
@@ -423,6 +1039,24 @@ class TestToDict:
     def test_iterator_value(self):
         assert TDict({"key": iter([1, 2, 3])}).to_dict() == {"key": [1, 2, 3]}
 
+    def test_value_not_matched_with_annotation(self):
+        r: Spot = Spot.from_dict({"names": ["spot"], "color": "red"})
+        r.names = iter([TOption("a"), TOption(None), None])
+        r.address = Address.from_dict({"name": "address"})
+        r.color = None
+        r.extra = TOption(1)
+
+        assert r.to_dict() == {"names": ["a"], "address": {"name": "address"}, "extra": 1}
+
+    def test_same_as_not_compiled_encoders(self):
+        r: Human = Human.from_dict(SAMPLE_HUMAN)
+        for ignore_none in (True, False):
+            for force_value in (True, False):
+                for ignore_empty in (True, False):
+                    assert r.to_dict(
+                        ignore_none=ignore_none, force_value=force_value, ignore_empty=ignore_empty
+                    ) == traverse_dict(r._dict, ignore_none, force_value, ignore_empty)
+
 
 class TestToDicts:
     def test_normal(self):
@@ -495,6 +1129,99 @@ class TestFromDicts:
             "color": Color.RED,
         }
 
+    def test_same_as_from_dict(self):
+        ds = [SAMPLE_HUMAN, SAMPLE_HUMAN2, {**SAMPLE_HUMAN, "Name": "camel"}]
+
+        for cls in (Human, CompiledHuman, SlotsHuman):
+            assert [x.to_dict() for x in cls.from_dicts(ds)] == [
+                cls.from_dict(d).to_dict() for d in ds
+            ]
+            assert cls.__owl_plan__.from_dicts is not None
+
+    def test_instances(self):
+        spot = Spot.from_dict(SAMPLE_HUMAN["favorite_spots"][0])
+        assert Spot.from_dicts([spot])[0] is spot
+
+    def test_unknown_properties_error(self):
+        with pytest.raises(UnknownPropertiesError):
+            Human.from_dicts([SAMPLE_HUMAN, {**SAMPLE_HUMAN, "unknown": 1}])
+        assert len(Human.from_dicts([SAMPLE_HUMAN, {**SAMPLE_HUMAN, "unknown": 1}], restrict=False)) == 2
+
+    def test_required_error(self):
+        with pytest.raises(RequiredError):
+            Human.from_dicts([SAMPLE_HUMAN, {**SAMPLE_HUMAN, "name": None}])
+
+    def test_overridden_from_dict(self):
+        class Overridden(OwlMixin):
+            id: int
+
+            @classmethod
+            def from_dict(cls, d, **kwargs):
+                return super().from_dict({"id": d["id"] * 10}, **kwargs)
+
+        assert Overridden.from_dicts([{"id": 1}])[0].id == 10
+
+    def test_gc_untouched(self):
+        class Checker(OwlMixin):
+            enabled: bool
+
+            @classmethod
+            def ___enabled(cls, v):
+                return gc.isenabled()
+
+        assert Checker.from_dicts([{}]).to_dicts() == [{"enabled": True}]
+        gc.disable()
+        try:
+            assert Checker.from_dicts([{}]).to_dicts() == [{"enabled": False}]
+        finally:
+            gc.enable()
+
+
+class TestParallel:
+    def test_from_dicts(self):
+        ds = [{**SAMPLE_HUMAN, "id": i} for i in range(30)] + [SAMPLE_HUMAN2]
+        expected = Human.from_dicts(ds).to_dicts()
+
+        r = Human.from_dicts(ds, workers=2)
+        assert isinstance(r, TList)
+        assert r.to_dicts() == expected
+        assert Human.from_dicts(iter(ds), workers=2).to_dicts() == expected
+        assert SlotsHuman.from_dicts(ds, workers=2).to_dicts() == expected
+        assert Human.from_dicts([], workers=2) == []
+
+    def test_executor(self):
+        ds = [{**SAMPLE_HUMAN, "id": i} for i in range(10)]
+        for executor in (ProcessPoolExecutor(max_workers=2), ThreadPoolExecutor(max_workers=2)):
+            with executor:
+                assert Human.from_dicts(ds, executor=executor).to_dicts() == Human.from_dicts(ds).to_dicts()
+                # Not shut down
+                assert Human.from_dicts(ds, executor=executor).to_dicts() == Human.from_dicts(ds).to_dicts()
+
+    def test_first_error(self):
+        ds = [SAMPLE_HUMAN] * 10
+        ds[3] = {**SAMPLE_HUMAN, "id": None}
+        ds[8] = {**SAMPLE_HUMAN, "name": None}
+
+        with pytest.raises(RequiredError) as e:
+            Human.from_dicts(ds, workers=2)
+        assert e.value.prop == "id"
+        assert e.value.cls == f"{Human.__module__}.Human"
+
+    def test_loaders(self):
+        assert (
+            Spot.from_jsonf_to_list("tests/json/spots_utf8.json", workers=2).to_dicts()
+            == Spot.from_jsonf_to_list("tests/json/spots_utf8.json").to_dicts()
+        )
+        assert (
+            Spot.from_yamlf_to_list("tests/yaml/spots_utf8.yaml", workers=2).to_dicts()
+            == Spot.from_yamlf_to_list("tests/yaml/spots_utf8.yaml").to_dicts()
+        )
+        assert Spot.from_json_to_list('[{"names": ["a"]}]', workers=2).to_dicts() == [{"names": ["a"]}]
+        assert (
+            Paper.from_csvf_to_list("tests/csv/papers_with_header.csv", workers=2).to_dicts()
+            == Paper.from_csvf_to_list("tests/csv/papers_with_header.csv").to_dicts()
+        )
+
 
 class TestFromOptionalDicts:
     def test_normal(self):
@@ -620,7 +1347,53 @@ class TestFromCsvfToList:
             ]
 
 
+    def test_explicit_dialect(self, tmpdir):
+        fpath = os.path.join(tmpdir.mkdir("tmp").strpath, "sheets.tsv")
+        with open(fpath, "w", encoding="utf8") as f:
+            f.write("name\tpages\tcolor\tratio\nA4\t10\tred\t1.5\n\nB5\t\t\n")
+
+        rs = Sheet.from_csvf_to_list(fpath, dialect="excel-tab")
+        assert rs.to_dicts(ignore_none=False) == [
+            {"name": "A4", "pages": 10, "color": "red", "ratio": 1.5},
+            {"name": "B5", "pages": None, "color": None, "ratio": 1.0},
+        ]
+        assert rs.to_dicts() == Sheet.from_csvf_to_iterator(fpath, dialect="excel-tab").to_dicts()
+
+    def test_same_as_from_dicts(self, tmpdir):
+        fpath = os.path.join(tmpdir.mkdir("tmp").strpath, "sheets.csv")
+        with open(fpath, "w", encoding="utf8") as f:
+            f.write("pages,name,unused\n1,a,x\n,b,\n3,c,z\n")
+
+        assert Sheet.from_csvf_to_list(fpath, restrict=False).to_dicts(
+            ignore_none=False
+        ) == Sheet.from_dicts(
+            util.load_csvf(fpath, None, "utf8"), force_cast=True, restrict=False
+        ).to_dicts(ignore_none=False)
+
+    def test_unknown_properties(self, tmpdir):
+        fpath = os.path.join(tmpdir.mkdir("tmp").strpath, "sheets.csv")
+        with open(fpath, "w", encoding="utf8") as f:
+            f.write("name,unknown\n")
+        assert Sheet.from_csvf_to_list(fpath) == []
+
+        with open(fpath, "a", encoding="utf8") as f:
+            f.write("a,b\n")
+        with pytest.raises(UnknownPropertiesError):
+            Sheet.from_csvf_to_list(fpath)
+
+
 class TestFromCsvfToIterator:
+    def test_file_is_not_leaked(self):
+        with warnings.catch_warnings(record=True) as ws:
+            warnings.simplefilter("always")
+            for cls in (Paper, CompiledPaper):
+                cls.from_csvf_to_iterator("tests/csv/papers_with_header.csv")
+                rs = cls.from_csvf_to_iterator("tests/csv/papers_with_header.csv")
+                rs.next_at(0)
+                del rs
+                gc.collect()
+        assert [w for w in ws if issubclass(w.category, ResourceWarning)] == []
+
     def test_normal_without_header(self):
         rs = Paper.from_csvf_to_iterator(
             "tests/csv/papers_without_header.csv", ("name", "width", "height")
@@ -782,6 +1555,59 @@ class TestFromJsonfToList:
         ]
 
 
+class TestFromJsonfToIterator:
+    def test_shiftjis(self):
+        assert Spot.from_jsonf_to_iterator("tests/json/spots_shiftjis.json", encoding="sjis").to_dicts() == [
+            {"names": ["spot1"], "address": {"name": "address1"}},
+            {"names": ["スポット21", "スポット22"]},
+        ]
+
+    def test_decode_one_by_one(self, tmpdir):
+        fpath = os.path.join(tmpdir.mkdir("tmp").strpath, "test.json")
+        with open(fpath, "w", encoding="utf8") as f:
+            f.write('[{"names": ["spot1"]}, {"names": ["spot2"]}, broken')
+
+        rs = Spot.from_jsonf_to_iterator(fpath)
+        assert rs.next_at(1).get().names == ["spot2"]
+        with pytest.raises(json.JSONDecodeError):
+            rs.next_at(0)
+
+    def test_memory_is_bounded_by_element(self, tmpdir):
+        fpath = os.path.join(tmpdir.mkdir("tmp").strpath, "test.json")
+        Spot.from_dicts([{"names": [f"spot{i}" * 10]} for i in range(20000)]).to_jsonf(fpath)
+        assert os.path.getsize(fpath) > 2_000_000
+
+        tracemalloc.start()
+        try:
+            assert sum(1 for _ in Spot.from_jsonf_to_iterator(fpath)) == 20000
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert peak < 1_000_000
+
+    def test_not_found(self):
+        with pytest.raises(FileNotFoundError):
+            Spot.from_jsonf_to_iterator("tests/json/not_found.json")
+
+    def test_file_is_not_leaked(self, tmpdir):
+        fpath = os.path.join(tmpdir.mkdir("tmp").strpath, "spots.jsonl")
+        Spot.from_jsonf_to_list("tests/json/spots_utf8.json").to_jsonlf(fpath)
+
+        with warnings.catch_warnings(record=True) as ws:
+            warnings.simplefilter("always")
+            for load in (
+                lambda: Spot.from_jsonf_to_iterator("tests/json/spots_utf8.json"),
+                lambda: Spot.from_jsonlf_to_iterator(fpath),
+                lambda: Spot.from_yamlf_to_iterator("tests/yaml/spots_utf8.yaml"),
+            ):
+                load()
+                rs = load()
+                rs.next_at(0)
+                del rs
+                gc.collect()
+        assert [w for w in ws if issubclass(w.category, ResourceWarning)] == []
+
+
 class TestFromYaml:
     def test_normal(self):
         r = Human.from_yaml(
@@ -933,6 +1759,69 @@ class TestToJson:
     def test_iterator_value(self):
         assert TDict({"key": iter([1, 2, 3])}).to_json() == '{"key": [1,2,3]}'
 
+    def test_non_str_keys(self):
+        assert TDict({2: "b", 1.5: "a"}).to_json() == '{"1.5": "a","2": "b"}'
+        assert TDict({True: "t", False: "f"}).to_json() == '{"false": "f","true": "t"}'
+        assert TDict({None: "n"}).to_json() == '{"null": "n"}'
+
+    def test_extra_attribute(self):
+        r: Address = Address.from_dict({"name": "address"})
+        r.extra = TOption("extra")
+        r.empty = TOption(None)
+        assert r.to_json() == '{"extra": "extra","name": "address"}'
+
+    @pytest.mark.parametrize("indent", [None, 0, 4])
+    def test_same_as_dumping_dict(self, indent):
+        r: Human = Human.from_dict(SAMPLE_HUMAN)
+        for ignore_none in (True, False):
+            for ignore_empty in (True, False):
+                assert r.to_json(
+                    indent=indent, ignore_none=ignore_none, ignore_empty=ignore_empty
+                ) == json.dumps(
+                    r.to_dict(ignore_none=ignore_none, ignore_empty=ignore_empty),
+                    indent=indent,
+                    ensure_ascii=False,
+                    sort_keys=True,
+                    separators=(",", ": "),
+                )
+
+    def test_json_backend(self, tmpdir):
+        fpath = os.path.join(tmpdir.mkdir("tmp").strpath, "test.json")
+        calls = []
+
+        def dumps(data, indent):
+            calls.append(data)
+            return util.get_json_backend("stdlib").dumps(data, indent)
+
+        def to_jsonf_text(r):
+            r.to_jsonf(fpath, indent=2)
+            with open(fpath, encoding="utf8") as f:
+                return f.read()
+
+        rs: TList[Human] = Human.from_dicts([SAMPLE_HUMAN, {**SAMPLE_HUMAN, "id": 2}])
+        expected = [
+            rs[0].to_json(),
+            rs[0].to_json(indent=2),
+            rs.to_json(indent=4),
+            rs.to_jsonl(),
+            to_jsonf_text(rs),
+        ]
+
+        util.register_json_backend("test_dumps", dumps=dumps)
+        previous = util.use_json_backend("test_dumps")
+        try:
+            assert [
+                rs[0].to_json(),
+                rs[0].to_json(indent=2),
+                rs.to_json(indent=4),
+                rs.to_jsonl(),
+                to_jsonf_text(rs),
+            ] == expected
+        finally:
+            util.use_json_backend(previous)
+        assert calls[0] == rs[0].to_dict()
+        assert len(calls) == 7
+
 
 class TestToJsonf:
     """
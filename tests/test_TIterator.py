@@ -1,10 +1,14 @@
 # coding: utf-8
 # pylint: disable=no-self-use
+import json
+import itertools
 import os
+import tracemalloc
 
 import pytest
+import yaml
 
-from owlmixin import OwlMixin, TOption
+from owlmixin import OwlMixin, TOption, UnknownPropertiesError
 from owlmixin.owlcollections import TList, TIterator
 
 
@@ -170,6 +174,143 @@ class TestToCsvf:
         )
 
 
+class TestToCsvChunks:
+    def test_normal(self):
+        origin = [{"id": i, "name": f"name{i}"} for i in range(5)]
+        chunks = list(Human.from_iterable_dicts(origin).to_csv_chunks(["id", "name"], with_header=True, chunk_rows=2))
+        assert len(chunks) == 3
+        assert "".join(chunks) == Human.from_dicts(origin).to_csv(["id", "name"], with_header=True)
+
+    def test_lazy(self):
+        def dicts():
+            yield {"id": 1, "name": "一郎"}
+            raise AssertionError("Must not be reached")
+
+        chunks = Human.from_iterable_dicts(dicts()).to_csv_chunks(["id", "name"], chunk_rows=1)
+        assert next(chunks) == "1,一郎\n"
+
+    def test_to_csvf_memory_is_bounded_by_row(self, tmpdir):
+        fpath = os.path.join(tmpdir.mkdir("tmp").strpath, "test.csv")
+        dicts = ({"id": i, "name": f"name{i}" * 10} for i in range(20000))
+
+        tracemalloc.start()
+        try:
+            Human.from_iterable_dicts(dicts).to_csvf(fpath, ["id", "name"])
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert os.path.getsize(fpath) > 1_000_000
+        assert peak < 500_000
+
+
+class TestToJsonf:
+    """
+    Requirements: `from_jsonf_to_iterator` are fine
+    """
+
+    def test_normal(self, tmpdir):
+        origin = [{"id": 1, "name": "一郎", "address": {"name": "東京"}}, {"id": 2, "name": "二郎", "ruby": "じろう"}]
+        fpath = os.path.join(tmpdir.mkdir("tmp").strpath, "test.json")
+
+        for indent in [None, 2]:
+            assert Human.from_iterable_dicts(origin).to_jsonf(fpath, encoding="euc-jp", indent=indent) == fpath
+            with open(fpath, encoding="euc-jp") as f:
+                assert f.read() == Human.from_dicts(origin).to_json(indent=indent)
+            assert Human.from_jsonf_to_iterator(fpath, encoding="euc-jp").to_dicts() == origin
+
+    def test_empty(self, tmpdir):
+        fpath = os.path.join(tmpdir.mkdir("tmp").strpath, "test.json")
+        Human.from_iterable_dicts([]).to_jsonf(fpath)
+        with open(fpath, encoding="utf8") as f:
+            assert f.read() == "[]"
+
+    def test_memory_is_bounded_by_element(self, tmpdir):
+        fpath = os.path.join(tmpdir.mkdir("tmp").strpath, "test.json")
+        dicts = ({"id": i, "name": f"name{i}" * 10} for i in range(20000))
+
+        tracemalloc.start()
+        try:
+            Human.from_iterable_dicts(dicts).filter(lambda x: x.id % 2 == 0).to_jsonf(fpath)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert os.path.getsize(fpath) > 1_000_000
+        assert peak < 500_000
+
+
+class TestToJsonl:
+    def test_normal(self):
+        origin = [{"id": 1, "name": "一郎", "address": {"name": "東京"}}, {"id": 2, "name": "二郎", "ruby": ""}]
+        assert (
+            Human.from_iterable_dicts(origin).to_jsonl(ignore_empty=True)
+            == '{"address": {"name": "東京"},"id": 1,"name": "一郎"}\n{"id": 2,"name": "二郎"}\n'
+        )
+
+    def test_empty(self):
+        assert Human.from_iterable_dicts([]).to_jsonl() == ""
+
+
+class TestToJsonlf:
+    """
+    Requirements: `from_jsonlf_to_iterator` are fine
+    """
+
+    def test_normal(self, tmpdir):
+        origin = [{"id": 1, "name": "一郎"}, {"id": 2, "name": "二郎", "ruby": "じろう"}]
+        fpath = os.path.join(tmpdir.mkdir("tmp").strpath, "test.jsonl")
+
+        assert Human.from_iterable_dicts(origin).to_jsonlf(fpath, encoding="euc-jp") == fpath
+        with open(fpath, encoding="euc-jp") as f:
+            assert f.read().count("\n") == 2
+        assert Human.from_jsonlf_to_iterator(fpath, encoding="euc-jp").to_dicts() == origin
+
+    def test_lazy(self, tmpdir):
+        fpath = os.path.join(tmpdir.mkdir("tmp").strpath, "test.jsonl")
+        with open(fpath, "w", encoding="utf8") as f:
+            f.write('{"id": 1, "name": "一郎"}\n\n{"id": 2, "name": "二郎", "unknown": 1}\n{"id": 3, "name":\n')
+
+        it = Human.from_jsonlf_to_iterator(fpath)
+        assert it.next_at(0).get().name == "一郎"
+        assert it.next_at(0).get().name == "二郎"
+        with pytest.raises(json.JSONDecodeError) as e:
+            it.next_at(0)
+        assert e.value.msg.startswith("Line 4:")
+
+    def test_restrict(self):
+        with pytest.raises(UnknownPropertiesError):
+            Human.from_jsonl_to_iterator('{"id": 1, "name": "一郎", "unknown": 1}', restrict=True).to_list()
+
+
+class TestToYamlf:
+    """
+    Requirements: `from_yamlf_to_iterator` are fine
+    """
+
+    def test_multi_document(self, tmpdir):
+        origin = [{"id": 1, "name": "一郎"}, {"id": 2, "name": "二郎", "ruby": "じろう"}]
+        fpath = os.path.join(tmpdir.mkdir("tmp").strpath, "test.yaml")
+
+        assert Human.from_iterable_dicts(origin).to_yamlf(fpath, encoding="euc-jp", multi_document=True) == fpath
+        with open(fpath, encoding="euc-jp") as f:
+            assert f.read() == "---\nid: 1\nname: 一郎\n---\nid: 2\nname: 二郎\nruby: じろう\n"
+        assert Human.from_yamlf_to_iterator(fpath, encoding="euc-jp", multi_document=True).to_dicts() == origin
+
+    def test_multi_document_lazy(self, tmpdir):
+        fpath = os.path.join(tmpdir.mkdir("tmp").strpath, "test.yaml")
+        with open(fpath, "w", encoding="utf8") as f:
+            f.write("id: 1\nname: 一郎\n---\n---\nid: 2\nname: 二郎\n---\nid: [\n")
+
+        it = Human.from_yamlf_to_iterator(fpath, multi_document=True)
+        assert it.next_at(0).get().name == "一郎"
+        assert it.next_at(0).get().name == "二郎"
+        with pytest.raises(yaml.YAMLError):
+            it.next_at(0)
+
+    def test_multi_document_only_for_sequences(self):
+        with pytest.raises(ValueError):
+            Human.from_dict({"id": 1, "name": "一郎"}).to_yaml(multi_document=True)
+
+
 class TestNextAt:
     def test_normal(self):
         d = [{"names": ["spot1"], "address": {"name": "address1"}}, {"names": ["spot21", "spot22"]}]
@@ -201,6 +342,65 @@ class TestMap:
         ]
 
 
+class TestPMap:
+    def test_normal(self):
+        it = TIterator(range(10)).pmap(lambda x: x + 1, workers=2)
+        assert isinstance(it, TIterator)
+        assert it.to_list() == list(range(1, 11))
+        assert it.to_list() == []
+
+    def test_lazy(self):
+        read = []
+
+        def source():
+            for i in itertools.count():
+                read.append(i)
+                yield i
+
+        it = TIterator(source()).pmap(lambda x: x * 2, workers=2, max_pending=4)
+        assert read == []
+        assert it.take(5).to_list() == [0, 2, 4, 6, 8]
+        assert len(read) <= 5 + 4
+
+    def test_error(self):
+        it = TIterator([1, 0, 2]).pmap(lambda x: 1 / x, workers=2)
+        assert next(it) == 1
+        with pytest.raises(ZeroDivisionError):
+            next(it)
+
+
+    @pytest.mark.parametrize("options", [{"chunk_size": 0}, {"max_pending": 0}])
+    def test_invalid_options(self, options):
+        with pytest.raises(ValueError):
+            TIterator([1, 2]).pmap(lambda x: x, workers=2, **options)
+
+class TestPFilter:
+    def test_normal(self):
+        it = TIterator(range(10)).pfilter(lambda x: x % 2 == 0, workers=2, chunk_size=3)
+        assert it.to_list() == [0, 2, 4, 6, 8]
+        assert it.to_list() == []
+
+    def test_unordered(self):
+        assert sorted(TIterator(range(10)).pfilter(lambda x: x % 2 == 0, workers=2, ordered=False)) == [0, 2, 4, 6, 8]
+
+
+    @pytest.mark.parametrize("options", [{"chunk_size": 0}, {"max_pending": 0}])
+    def test_invalid_options(self, options):
+        with pytest.raises(ValueError):
+            TIterator([1, 2]).pfilter(lambda x: x, workers=2, **options)
+
+class TestPForEach:
+    def test_normal(self):
+        ret = []
+        assert TIterator([1, 2, 3]).pfor_each(ret.append, workers=2, chunk_size=2) is None
+        assert sorted(ret) == [1, 2, 3]
+
+
+    @pytest.mark.parametrize("options", [{"chunk_size": 0}, {"max_pending": 0}])
+    def test_invalid_options(self, options):
+        with pytest.raises(ValueError):
+            TIterator([1, 2]).pfor_each(print, workers=2, **options)
+
 class TestEMap:
     def test_normal(self):
         d = [{"names": ["spot1"], "address": {"name": "address1"}}, {"names": ["spot21", "spot22"]}]
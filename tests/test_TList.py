@@ -1,6 +1,9 @@
 # coding: utf-8
 # pylint: disable=no-self-use
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
@@ -24,6 +27,11 @@ class Human(OwlMixin):
     address: TOption[Address]
 
 
+def names_of(spot: Spot) -> TList[str]:
+    # Module level for process pools
+    return spot.names
+
+
 class Test__Add__:
     def test_normal(self):
         d = [{"names": ["spot1"], "address": {"name": "address1"}}, {"names": ["spot21", "spot22"]}]
@@ -170,6 +178,60 @@ class TestToCsvf:
         )
 
 
+class TestToJsonl:
+    def test_normal(self):
+        r: TList[Human] = Human.from_dicts([{"id": 1, "name": "一郎"}, {"id": 2, "name": "二郎", "ruby": "じろう"}])
+        assert r.to_jsonl() == '{"id": 1,"name": "一郎"}\n{"id": 2,"name": "二郎","ruby": "じろう"}\n'
+        assert Human.from_jsonl_to_iterator(r.to_jsonl()).to_dicts() == r.to_dicts()
+
+    def test_ignore_none(self):
+        r: TList[Human] = TList([Human.from_dict({"id": 1, "name": "一郎"}), None])
+        assert r.to_jsonl() == '{"id": 1,"name": "一郎"}\n'
+        assert r.to_jsonl(ignore_none=False) == '{"address": null,"id": 1,"name": "一郎","ruby": null}\nnull\n'
+
+
+class TestCompressedFiles:
+    """
+    Requirements: `from_*f` are fine
+    """
+
+    @pytest.mark.parametrize("ext", ["", ".gz", ".bz2", ".xz"])
+    def test_round_trip(self, tmpdir, ext):
+        r: TList[Human] = Human.from_dicts(
+            [{"id": 1, "name": "一郎"}, {"id": 2, "name": "二郎", "ruby": "じろう"}]
+        )
+        d = tmpdir.mkdir("tmp").strpath
+
+        fpath = r.to_jsonf(os.path.join(d, f"test.json{ext}"), encoding="euc-jp")
+        assert Human.from_jsonf_to_list(fpath, encoding="euc-jp").to_dicts() == r.to_dicts()
+        assert Human.from_jsonf_to_iterator(fpath, encoding="euc-jp").to_dicts() == r.to_dicts()
+
+        fpath = r.to_jsonlf(os.path.join(d, f"test.jsonl{ext}"))
+        assert Human.from_jsonlf_to_iterator(fpath).to_dicts() == r.to_dicts()
+
+        fpath = r.to_yamlf(os.path.join(d, f"test.yaml{ext}"))
+        assert Human.from_yamlf_to_list(fpath).to_dicts() == r.to_dicts()
+
+        fpath = r.to_yamlf(os.path.join(d, f"test.yamls{ext}"), multi_document=True)
+        assert Human.from_yamlf_to_iterator(fpath, multi_document=True).to_dicts() == r.to_dicts()
+
+        fpath = r.to_csvf(os.path.join(d, f"test.csv{ext}"), ["id", "name", "ruby"], with_header=True)
+        assert Human.from_csvf_to_list(fpath).to_dicts() == r.to_dicts()
+        assert Human.from_csvf_to_iterator(fpath).to_dicts() == r.to_dicts()
+
+    def test_explicit(self, tmpdir):
+        r: TList[Human] = Human.from_dicts([{"id": 1, "name": "一郎"}])
+        fpath = os.path.join(tmpdir.mkdir("tmp").strpath, "test.json")
+
+        r.to_jsonf(fpath, compression="gzip")
+        with open(fpath, "rb") as f:
+            assert f.read(2) == b"\x1f\x8b"
+        assert Human.from_jsonf_to_list(fpath, compression="gzip").to_dicts() == r.to_dicts()
+
+        r.to_jsonf(fpath + ".gz", compression=None)
+        assert Human.from_jsonf_to_list(fpath + ".gz", compression=None).to_dicts() == r.to_dicts()
+
+
 class TestGet:
     def test_normal(self):
         d = [{"names": ["spot1"], "address": {"name": "address1"}}, {"names": ["spot21", "spot22"]}]
@@ -189,6 +251,25 @@ class TestForEach:
         assert ret == ["spot1", "spot21"]
 
 
+class TestPForEach:
+    def test_normal(self):
+        d = [{"names": ["spot1"], "address": {"name": "address1"}}, {"names": ["spot21", "spot22"]}]
+
+        ret = []
+        assert Spot.from_dicts(d).pfor_each(lambda s: ret.append(s.names[0]), workers=2) is None
+        assert sorted(ret) == ["spot1", "spot21"]
+
+    def test_threads(self):
+        thread_ids = set()
+        TList(range(20)).pfor_each(lambda x: thread_ids.add(threading.get_ident()) or time.sleep(0.01), workers=4)
+        assert len(thread_ids) > 1
+
+
+    @pytest.mark.parametrize("options", [{"chunk_size": 0}, {"max_pending": 0}])
+    def test_invalid_options(self, options):
+        with pytest.raises(ValueError):
+            TList([1, 2]).pfor_each(print, workers=2, **options)
+
 class TestMap:
     def test_normal(self):
         d = [{"names": ["spot1"], "address": {"name": "address1"}}, {"names": ["spot21", "spot22"]}]
@@ -196,6 +277,50 @@ class TestMap:
         assert Spot.from_dicts(d).map(lambda s: s.names) == [["spot1"], ["spot21", "spot22"]]
 
 
+class TestPMap:
+    def test_normal(self):
+        d = [{"names": ["spot1"], "address": {"name": "address1"}}, {"names": ["spot21", "spot22"]}]
+
+        assert Spot.from_dicts(d).pmap(lambda s: s.names, workers=2) == [["spot1"], ["spot21", "spot22"]]
+
+    def test_same_as_map(self):
+        xs = TList(range(100))
+        for chunk_size in (1, 3, 200):
+            assert xs.pmap(lambda x: x * 2, workers=4, chunk_size=chunk_size) == xs.map(lambda x: x * 2)
+            assert sorted(xs.pmap(lambda x: x * 2, workers=4, ordered=False, chunk_size=chunk_size)) == xs.map(
+                lambda x: x * 2
+            )
+        assert TList().pmap(lambda x: x, workers=2) == []
+
+    def test_unordered(self):
+        def sleep(x):
+            time.sleep(0.2 if x == 0 else 0)
+            return x
+
+        assert TList([0, 1, 2]).pmap(sleep, workers=3, ordered=False)[-1] == 0
+        assert TList([0, 1, 2]).pmap(sleep, workers=3) == [0, 1, 2]
+
+    def test_processes(self):
+        d = [{"names": ["spot1"], "address": {"name": "address1"}}, {"names": ["spot21", "spot22"]}]
+
+        assert Spot.from_dicts(d).pmap(names_of, workers=2, processes=True) == [["spot1"], ["spot21", "spot22"]]
+
+    def test_executor(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            assert TList([1, 2]).pmap(lambda x: x + 1, executor=executor) == [2, 3]
+            # Not shut down
+            assert TList([1, 2]).pmap(lambda x: x + 1, executor=executor) == [2, 3]
+
+    def test_error(self):
+        with pytest.raises(ZeroDivisionError):
+            TList([1, 0, 2]).pmap(lambda x: 1 / x, workers=2)
+
+
+    @pytest.mark.parametrize("options", [{"chunk_size": 0}, {"max_pending": 0}])
+    def test_invalid_options(self, options):
+        with pytest.raises(ValueError):
+            TList([1, 2]).pmap(lambda x: x, workers=2, **options)
+
 class TestEMap:
     def test_normal(self):
         d = [{"names": ["spot1"], "address": {"name": "address1"}}, {"names": ["spot21", "spot22"]}]
@@ -227,6 +352,24 @@ class TestFilter:
         ]
 
 
+class TestPFilter:
+    def test_normal(self):
+        d = [{"names": ["spot1"], "address": {"name": "address1"}}, {"names": ["spot21", "spot22"]}]
+
+        assert Spot.from_dicts(d).pfilter(lambda s: s.address.get(), workers=2).to_dicts() == [
+            {"names": ["spot1"], "address": {"name": "address1"}}
+        ]
+
+    def test_same_as_filter(self):
+        xs = TList(range(100))
+        assert xs.pfilter(lambda x: x % 3 == 0, workers=4, chunk_size=7) == xs.filter(lambda x: x % 3 == 0)
+
+
+    @pytest.mark.parametrize("options", [{"chunk_size": 0}, {"max_pending": 0}])
+    def test_invalid_options(self, options):
+        with pytest.raises(ValueError):
+            TList([1, 2]).pfilter(lambda x: x, workers=2, **options)
+
 class TestReject:
     def test_normal(self):
         d = [{"names": ["spot1"], "address": {"name": "address1"}}, {"names": ["spot21", "spot22"]}]
@@ -1,5 +1,7 @@
 # coding: utf-8
 
+import pickle
+
 import pytest
 from owlmixin import OwlMixin, TOption, TList, RequiredError
 
@@ -86,6 +88,19 @@ class TestTOption:
             ])
 
 
+class TestPickle:
+    def test_normal(self):
+        for value in (None, 0, "a", TList([1])):
+            actual = pickle.loads(pickle.dumps(TOption(value)))
+            assert isinstance(actual, TOption)
+            assert actual.get() == value
+        assert b"value" not in pickle.dumps(TOption(1))
+
+    def test_nested(self):
+        r: Spot = Spot.from_dict({'id': 1, 'name': 'Name1', 'children': [{'id': 2, 'name': 'Name2'}]})
+        assert pickle.loads(pickle.dumps(r)).to_dict() == r.to_dict()
+
+
 class TestIsNone:
     def test_none(self):
         r: Spot = Spot.from_dict({'id': 1, 'name': 'Name1'})
@@ -1,7 +1,14 @@
 # coding: utf-8
 # pylint: disable=no-self-use
 
+import io
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
+import yaml
 from yaml.constructor import ConstructorError
 
 from owlmixin import util
@@ -60,6 +67,26 @@ class TestReplaceKeys:
 
         assert util.replace_keys(d, keymap, True) == expected
 
+    def test_same_shape_twice(self):
+        keymap = {"self": "_self"}
+
+        assert util.replace_keys({"self": 1, "camelCase": 2}, keymap, True) == {
+            "_self": 1,
+            "camel_case": 2,
+        }
+        assert util.replace_keys({"self": 3, "camelCase": 4}, keymap, True) == {
+            "_self": 3,
+            "camel_case": 4,
+        }
+
+    def test_returns_itself_if_nothing_replaced(self):
+        d = {"id": 1, "snake_case": 2}
+        assert util.replace_keys(d, {"self": "_self"}, True) is d
+
+    def test_none(self):
+        with pytest.raises(AttributeError):
+            util.replace_keys(None, {"self": "_self"}, True)
+
 
 class TestToSnake:
     def test_lower_camel(self):
@@ -80,6 +107,158 @@ class TestToSnake:
         assert util.to_snake("--detail-option") == "detail_option"
 
 
+JSON_CORPUS = [
+    "{}",
+    "[]",
+    '{"id": 1, "name": "tadashi", "names": ["a", "b"], "nested": {"x": null, "y": true, "z": false}}',
+    '[1, -0, 1.5, 1e-07, 9223372036854775807, "\\u3042\\ud83e\\udd89", "\\"quoted\\""]',
+    '{"nan": NaN, "inf": Infinity, "minus_inf": -Infinity}',
+    '{"dup": 1, "dup": 2}',
+    "  \n[ 1 ,2 ]\n",
+]
+DUMP_CASES = [
+    ({"b": 1, "a": [1, 2.5, None, True]}, None, '{"a": [1,2.5,null,true],"b": 1}'),
+    ({"あ": "い", "z": {"y": {}}}, None, '{"z": {"y": {}},"あ": "い"}'),
+    ([{"b": 1, "a": 2}], 2, '[\n  {\n    "a": 2,\n    "b": 1\n  }\n]'),
+    ("\"\n\u0001", None, '"\\"\\n\\u0001"'),
+]
+
+
+@pytest.fixture(params=sorted(util._json_backends))
+def json_backend(request):
+    return request.param
+
+
+class TestJsonBackend:
+    """Conformance of all registered backends (ex. orjson if installed)"""
+
+    def test_load_json(self, json_backend):
+        for s in JSON_CORPUS:
+            actual = util.load_json(s, backend=json_backend)
+            assert json.dumps(actual, sort_keys=True) == json.dumps(json.loads(s), sort_keys=True)
+            assert util.load_json(s.encode(), backend=json_backend) == actual or s.startswith('{"nan"')
+
+    @pytest.mark.skipif("orjson" not in util._json_backends, reason="orjson is not installed")
+    def test_orjson_big_integer(self):
+        """Known difference from stdlib"""
+        assert util.load_json("[12345678901234567890123]", backend="stdlib") == [12345678901234567890123]
+        assert util.load_json("[12345678901234567890123]", backend="orjson") == [1.2345678901234568e22]
+
+    def test_load_json_invalid(self, json_backend):
+        for s in ["", "{", "[1,]", "{'a': 1}"]:
+            with pytest.raises(json.JSONDecodeError):
+                util.load_json(s, backend=json_backend)
+
+    def test_load_jsonf(self, json_backend):
+        assert util.load_jsonf("tests/json/human_shiftjis.json", "sjis", backend=json_backend) == util.load_jsonf(
+            "tests/json/human_shiftjis.json", "sjis", backend="stdlib"
+        )
+
+    def test_dump_json(self, json_backend):
+        for data, indent, expected in DUMP_CASES:
+            assert util.dump_json(data, indent, backend=json_backend) == expected
+
+    def test_dump_jsonf(self, json_backend, tmpdir):
+        fpath = os.path.join(tmpdir.mkdir("tmp").strpath, "test.json")
+        util.dump_jsonf({"b": "い", "a": 1}, fpath=fpath, encoding="euc-jp", backend=json_backend)
+        with open(fpath, encoding="euc-jp") as f:
+            assert f.read() == '{"a": 1,"b": "い"}'
+
+    def test_register_and_use(self):
+        calls = []
+
+        def loads(s):
+            calls.append(s)
+            return json.loads(s)
+
+        util.register_json_backend("test", loads=loads)
+        previous = util.use_json_backend("test")
+        try:
+            assert util.load_json('{"a": 1}') == {"a": 1}
+            assert util.dump_json({"a": 1}) == '{"a": 1}'
+            assert calls == ['{"a": 1}']
+        finally:
+            util.use_json_backend(previous)
+        assert util.get_json_backend().name == previous
+
+    def test_unknown(self):
+        with pytest.raises(ValueError):
+            util.use_json_backend("unknown")
+        with pytest.raises(ValueError):
+            util.load_json("{}", backend="unknown")
+
+
+class TestLoadJsonf:
+    def test_bytes_are_passed_if_utf8(self, tmpdir):
+        fpath = os.path.join(tmpdir.mkdir("tmp").strpath, "test.json")
+        with open(fpath, "w", encoding="utf8") as f:
+            f.write('{"name": "あ"}')
+
+        args = []
+
+        def loads(s):
+            args.append(s)
+            return json.loads(s)
+
+        util.register_json_backend("test_bytes", loads=loads)
+        assert util.load_jsonf(fpath, "utf8", backend="test_bytes") == {"name": "あ"}
+        assert util.load_jsonf(fpath, "UTF-8", backend="test_bytes") == {"name": "あ"}
+        assert util.load_jsonf(fpath, "utf-8-sig", backend="test_bytes") == {"name": "あ"}
+        assert [type(x) for x in args] == [bytes, bytes, str]
+
+    def test_other_encoding(self):
+        assert util.load_jsonf("tests/json/human_shiftjis.json", "sjis") == util.load_jsonf(
+            "tests/json/human_utf8.json", "utf8"
+        )
+        with pytest.raises(UnicodeDecodeError):
+            util.load_jsonf("tests/json/human_shiftjis.json", "utf8")
+
+
+class TestIterJsonArray:
+    def test_tokens_split_by_chunks(self):
+        text = '[true, false, null, -Infinity, 1.5e-3, -12, "a\\u3042\\"b", {"x": [1, {"y": "z"}]}, ""]'
+        for chunk_size in range(1, len(text) + 1):
+            assert list(util.iter_json_array(io.StringIO(text).read, chunk_size)) == json.loads(text)
+
+    def test_malformed_element_raises_without_reading_rest(self):
+        f = io.StringIO('[{"a": 1}, {"a": x}, ' + ", ".join(['{"a": 1}'] * 500000) + "]")
+        size_read = 0
+
+        def read(size):
+            nonlocal size_read
+            chunk = f.read(size)
+            size_read += len(chunk)
+            return chunk
+
+        with pytest.raises(json.JSONDecodeError) as e:
+            list(util.iter_json_array(read, 1024))
+        assert e.value.msg == "Expecting value"
+        assert size_read <= 1024
+
+    def test_truncated(self):
+        with pytest.raises(json.JSONDecodeError):
+            list(util.iter_json_array(io.StringIO('[{"a": tr').read, 2))
+
+    def test_position_of_error_in_whole_text(self):
+        for text in [
+            '[\n  {"a": 1},\n  {"a": x}\n]',
+            '[1, 2,\n 3,\n    4 5]',
+            '[1, 2, 3, 4, 5, 6]\n\n  7',
+            '[\n"abc",\n  "d\\x"]',
+        ]:
+            with pytest.raises(json.JSONDecodeError) as expected:
+                json.loads(text)
+            for chunk_size in (1, 2, 3, 5):
+                with pytest.raises(json.JSONDecodeError) as e:
+                    list(util.iter_json_array(io.StringIO(text).read, chunk_size))
+                assert (e.value.pos, e.value.lineno, e.value.colno) == (
+                    expected.value.pos,
+                    expected.value.lineno,
+                    expected.value.colno,
+                )
+                assert str(e.value).endswith(str(expected.value).split(":")[-1])
+
+
 class TestLoadYaml:
     def test(self):
         actual = util.load_yaml(
@@ -97,6 +276,20 @@ names:
             util.load_yaml('!!python/object/apply:os.system ["calc.exe"]')
 
 
+    def test_same_as_pure_python(self):
+        for name in ["human_utf8.yaml", "spots_utf8.yaml"]:
+            with open(f"tests/yaml/{name}", encoding="utf-8") as f:
+                s = f.read()
+            assert util.load_yaml(s) == yaml.load(s, Loader=yaml.SafeLoader)
+
+        s = "a: 1\nb: '001'\nc: 2020-01-01\nd: [yes, ~, .inf]\ne: |\n  multi\n  line\n"
+        assert util.load_yaml(s) == yaml.load(s, Loader=yaml.SafeLoader)
+
+    def test_backend(self):
+        assert util.YAML_LOADER_BACKEND == ("libyaml" if yaml.__with_libyaml__ else "python")
+        assert util.YAML_DUMPER_BACKEND == "python"
+
+
 class TestLoadYamlf:
     def test(self):
         assert util.load_yamlf("tests/yaml/spots_utf8.yaml", "utf-8") == [
@@ -108,6 +301,106 @@ class TestLoadYamlf:
         with pytest.raises(ConstructorError):
             util.load_yamlf("tests/yaml/vulnerability.yaml", "utf-8")
 
+    def test_other_encoding(self):
+        assert util.load_yamlf("tests/yaml/spots_shiftjis.yaml", "sjis") == util.load_yamlf(
+            "tests/yaml/spots_utf8.yaml", "utf-8"
+        )
+
+
+class TestOpenTextf:
+    @pytest.mark.parametrize(
+        "fname, magic",
+        [("a.txt", b"\xa4\xa2"), ("a.txt.gz", b"\x1f\x8b"), ("a.txt.bz2", b"BZh"), ("a.txt.xz", b"\xfd7zXZ")],
+    )
+    def test_infer(self, tmpdir, fname, magic):
+        fpath = os.path.join(tmpdir.mkdir("tmp").strpath, fname)
+        with util.open_textf(fpath, "w", "euc-jp", newline="") as f:
+            f.write("あ\r\nい\n")
+
+        with open(fpath, "rb") as f:
+            assert f.read().startswith(magic)
+        with util.open_textf(fpath, "r", "euc-jp", newline="") as f:
+            assert f.read() == "あ\r\nい\n"
+
+    def test_explicit(self, tmpdir):
+        fpath = os.path.join(tmpdir.mkdir("tmp").strpath, "a.txt.gz")
+        with util.open_textf(fpath, "w", "utf8", compression="bz2") as f:
+            f.write("a")
+
+        with util.open_textf(fpath, "r", "utf8", compression="bz2") as f:
+            assert f.read() == "a"
+        with util.open_textf(fpath, "r", "utf8", compression=None) as f, pytest.raises(UnicodeDecodeError):
+            f.read()
+
+    def test_unknown(self, tmpdir):
+        with pytest.raises(ValueError):
+            util.open_textf("a.txt", "r", "utf8", compression="zip")
+
+
+class TestFileCache:
+    @staticmethod
+    def write(d, name: str, content: str) -> str:
+        fpath = os.path.join(d, name)
+        with open(fpath, "w") as f:
+            f.write(content)
+        return fpath
+
+    @staticmethod
+    def get(cache: util.FileCache, fpath: str, loaded: list) -> str:
+        def load():
+            loaded.append(os.path.basename(fpath))
+            with open(fpath) as f:
+                return f.read()
+
+        return cache.get_or_load(("text",), fpath, load)
+
+    def test_lru(self, tmpdir):
+        d = tmpdir.mkdir("tmp").strpath
+        a, b, c = (self.write(d, x, x) for x in "abc")
+        cache = util.FileCache(max_entries=2)
+        loaded: list = []
+
+        for fpath in (a, b, a, c, a, b):
+            self.get(cache, fpath, loaded)
+
+        assert loaded == ["a", "b", "c", "b"]
+        assert len(cache) == 2
+
+    def test_max_bytes(self, tmpdir):
+        d = tmpdir.mkdir("tmp").strpath
+        small1, small2, large = self.write(d, "s1", "123"), self.write(d, "s2", "45"), self.write(d, "l", "123456")
+        cache = util.FileCache(max_bytes=5)
+        loaded: list = []
+
+        for fpath in (small1, small2, small1, large, large, small2):
+            self.get(cache, fpath, loaded)
+
+        assert loaded == ["s1", "s2", "l", "l"]
+        assert (len(cache), cache.nbytes) == (2, 5)
+
+    def test_changed(self, tmpdir):
+        fpath = self.write(tmpdir.mkdir("tmp").strpath, "a", "v1")
+        cache = util.FileCache()
+        loaded: list = []
+
+        assert self.get(cache, fpath, loaded) == "v1"
+        self.write(os.path.dirname(fpath), "a", "v2")
+        stat = os.stat(fpath)
+        os.utime(fpath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert self.get(cache, fpath, loaded) == "v2"
+        assert self.get(cache, fpath, loaded) == "v2"
+        assert loaded == ["a", "a"]
+        assert len(cache) == 1
+
+    def test_options(self, tmpdir):
+        fpath = self.write(tmpdir.mkdir("tmp").strpath, "a", "v1")
+        cache = util.FileCache()
+
+        assert cache.get_or_load(("upper",), fpath, lambda: "V1") == "V1"
+        assert cache.get_or_load(("lower",), fpath, lambda: "v1") == "v1"
+        assert cache.get_or_load(("upper",), fpath, lambda: "unexpected") == "V1"
+
 
 class TestDumpTable:
     def test(self):
@@ -127,3 +420,48 @@ class TestDumpTable:
             ],
             ["id", "name", "とてもながい名前"],
         )
+
+
+class TestMapBounded:
+    def test_items_are_pulled_lazily(self):
+        pulled = []
+
+        def items():
+            for i in range(10):
+                pulled.append(i)
+                yield i
+
+        with ThreadPoolExecutor(2) as pool:
+            rs = util.map_bounded(pool, lambda x: x * 2, items(), 3)
+            assert next(rs) == 0
+            assert len(pulled) == 4
+            assert list(rs) == [2, 4, 6, 8, 10, 12, 14, 16, 18]
+
+    def test_unordered(self):
+        with ThreadPoolExecutor(4) as pool:
+            assert sorted(util.map_bounded(pool, lambda x: x * 2, range(20), 4, ordered=False)) == [
+                x * 2 for x in range(20)
+            ]
+
+    def test_pending_tasks_are_cancelled_by_error(self):
+        started = []
+        blocker = threading.Event()
+
+        def func(x):
+            started.append(x)
+            if x == 0:
+                raise ValueError(x)
+            blocker.wait()
+            return x
+
+        with ThreadPoolExecutor(1) as pool:
+            with pytest.raises(ValueError):
+                list(util.map_bounded(pool, func, range(10), 3))
+            blocker.set()
+        # The 2nd task may have been started by the worker before the error is raised
+        assert started[0] == 0
+        assert 2 not in started
+
+    def test_pool_size(self):
+        assert util.pool_size(3) == 3
+        assert util.pool_size(None) == (os.cpu_count() or 1)